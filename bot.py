@@ -1,8 +1,19 @@
+import os
 import asyncio
+import logging
+from functools import partial
 from aiogram import Bot, Dispatcher
 from aiogram.fsm.storage.redis import Redis, RedisStorage
+from asgiref.sync import sync_to_async
 
 import config
+
+# логи бота и модулей core (счетчики соединений с базой и пула запросов, очередь рассылок) - в stderr процесса
+logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+
+# бот работает непрерывно: соединения с базой держатся открытыми (меньше wait_timeout mysql)
+os.environ.setdefault('DB_CONN_MAX_AGE', str(config.BOT_DB_CONN_MAX_AGE))
+
 from handlers import (
     commands,
     profile,
@@ -25,9 +36,29 @@ from handlers import (
 
     error,
 )
+from core import catalog, db_connections, executor, broadcasts
+import notifications_center
+from middlewares.user_context import UserContextMiddleware, ProfileMiddleware
+from middlewares.rate_limit import RateLimitRequestMiddleware
+
+
+logger = logging.getLogger(__name__)
+
+
+async def log_stats_periodically(interval):
+    # счетчики соединений с базой (core/db_connections.py) и пула запросов (core/executor.py) в одной строке
+    while True:
+        await asyncio.sleep(interval)
+        logger.info('Соединения с базой: %s, пул запросов: %s', db_connections.stats(), executor.stats())
 
 
 async def main() -> None:
+    # тексты, объявленные в обработчиках, проверяем сразу, а не посреди диалога
+    await sync_to_async(catalog.check_required)()
+
+    sweep_task = asyncio.create_task(db_connections.sweep_periodically(config.DB_SWEEP_INTERVAL))
+    stats_task = asyncio.create_task(log_stats_periodically(config.STATS_LOG_INTERVAL))
+
     redis = Redis(
         host=config.REDIS_HOST,
         port=config.REDIS_PORT,
@@ -38,7 +69,15 @@ async def main() -> None:
     storage = RedisStorage(redis=redis, state_ttl=3600 * 24)
 
     bot = Bot(token=config.TELEGRAM_TOKEN)
+    bot.session.middleware(RateLimitRequestMiddleware())
+
+    # очередь рассылок дочитывается и после перезапуска (core/broadcasts.py)
+    broadcast_task = asyncio.create_task(broadcasts.consume(partial(notifications_center.deliver, bot)))
     dp = Dispatcher(storage=storage)
+    dp.update.outer_middleware(UserContextMiddleware())
+    # профиль и TGUser - только для обработчиков с флагами profile/tg_user
+    dp.message.middleware(ProfileMiddleware())
+    dp.callback_query.middleware(ProfileMiddleware())
 
     dp.include_router(commands.router)
     dp.include_router(profile.router)
@@ -60,7 +99,12 @@ async def main() -> None:
     dp.include_router(employer_details.router)
     dp.include_router(error.router)
     await bot.delete_webhook(drop_pending_updates=True)
-    await dp.start_polling(bot)
+    try:
+        await dp.start_polling(bot)
+    finally:
+        sweep_task.cancel()
+        stats_task.cancel()
+        broadcast_task.cancel()
 
 if __name__ == "__main__":
     asyncio.run(main())
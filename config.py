@@ -16,4 +16,24 @@ REDIS_DB = int(os.getenv('REDIS_DB'))
 
 PER_PAGE = 5
 MAX_SYMBOLS = 4000 # максимально допустимая длина сообщения (для показа всех вакансий/отзывов)
-MAX_LEN = 1000 # максимально допустимая длина отзыва/описания вакансии/рассказа о себе
\ No newline at end of file
+MAX_LEN = 1000 # максимально допустимая длина отзыва/описания вакансии/рассказа о себе
+
+MATCHING_INDEX = os.getenv('MATCHING_INDEX', '1') == '1' # подбор подходящих вакансий/работников по индексу в памяти (core/matching.py)
+MATCHING_INDEX_TTL = 300 # через сколько секунд индекс перестраивается целиком (изменения из других процессов)
+
+DB_EXECUTOR_WORKERS = int(os.getenv('DB_EXECUTOR_WORKERS', '8')) # потоков для чтения из базы в боте (core/executor.py), по соединению с базой на поток
+DB_EXECUTOR_QUEUE = int(os.getenv('DB_EXECUTOR_QUEUE', '100')) # сколько запросов может ждать свободного потока в пуле
+BOT_DB_CONN_MAX_AGE = int(os.getenv('BOT_DB_CONN_MAX_AGE', '600')) # сколько секунд бот держит соединение с базой открытым
+DB_SWEEP_INTERVAL = 60 # как часто бот закрывает устаревшие соединения с базой (core/db_connections.py)
+STATS_LOG_INTERVAL = 60 # как часто бот пишет в лог счетчики соединений с базой и пула запросов
+
+# лимиты телеграма на исходящие сообщения (сообщений, за секунд), общие для бота и celery (core/rate_limiter.py)
+TELEGRAM_GLOBAL_RATE = (30, 1)
+TELEGRAM_CHAT_RATE = (1, 1)
+TELEGRAM_GROUP_RATE = (20, 60)
+TELEGRAM_CHAT_BURST = 3 # сколько сообщений подряд можно отправить в личный чат (ответ обработчика из нескольких сообщений)
+
+BROADCAST_CONSUMER = os.getenv('BROADCAST_CONSUMER', 'bot') # имя потребителя очереди рассылок (core/broadcasts.py), постоянное между перезапусками
+BROADCAST_BATCH = 50 # сколько записей очереди рассылок обрабатывается одновременно
+
+NOTIFICATIONS_CONCURRENCY = 20 # одновременных запросов к телеграму при рассылке уведомлений из celery (notifications/sender.py)
@@ -60,13 +60,13 @@ class WorkerAdmin(admin.ModelAdmin):
     def final_min_salary(self, obj):
         return f'{obj.min_salary}₪'
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_occupations()
+
     def all_occupations(self, obj):
         if obj:
-            text = ''
-            for occupation in obj.occupations.all():
-                text += f'{occupation.rus}, '
+            text = obj.readable_rus_occupations
             if text:
-                text = text.rstrip(', ')
                 return text
         return '-'
 
@@ -110,13 +110,13 @@ class JobAdmin(admin.ModelAdmin):
     def final_min_salary(self, obj):
         return f'{obj.min_salary}₪'
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_occupations()
+
     def all_occupations(self, obj):
         if obj:
-            text = ''
-            for occupation in obj.occupations.all():
-                text += f'{occupation.rus}, '
+            text = obj.readable_rus_occupations
             if text:
-                text = text.rstrip(', ')
                 return text
         return '-'
 
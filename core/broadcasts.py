@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import uuid
+
+import redis
+
+from config import BROADCAST_CONSUMER, BROADCAST_BATCH
+from core.redis_connections import get_async_redis
+
+
+# Очередь рассылок в redis streams: одна запись на получателя (id рассылки, вид, id объекта, чат).
+# Записи читает бот через группу потребителей и подтверждает после отправки, поэтому после
+# перезапуска или сбоя неподтвержденные записи дочитываются. Получатель отмечается в множестве
+# отправленных этой рассылки до отправки, так что повтор записи не дублирует сообщение;
+# повторное одобрение объекта - новая рассылка со своим id.
+STREAM_KEY = 'broadcasts'
+GROUP = 'senders'
+SENT_KEY = 'broadcasts:sent:{}'
+SENT_TTL = 3600 * 24 * 7
+ATTEMPTS_KEY = 'broadcasts:attempts'
+MAX_ATTEMPTS = 5 # после стольких временных ошибок запись отбрасывается
+RETRY_DELAY = 5 # пауза перед повтором записей с временной ошибкой
+CLAIM_IDLE = 5 * 60 * 1000 # записи других потребителей, зависшие дольше 5 минут, забираем себе
+
+logger = logging.getLogger(__name__)
+
+
+def new_broadcast_id():
+    return uuid.uuid4().hex
+
+
+async def enqueue(broadcast_id, kind, object_id, chat_ids):
+    """Ставит рассылку kind по объекту object_id в очередь, по записи на каждый чат."""
+    pipeline = get_async_redis().pipeline(transaction=False)
+    for chat_id in chat_ids:
+        pipeline.xadd(STREAM_KEY, {'broadcast_id': broadcast_id, 'kind': kind, 'object_id': object_id, 'chat_id': chat_id})
+    await pipeline.execute()
+
+
+async def _ensure_group(connection):
+    try:
+        await connection.xgroup_create(STREAM_KEY, GROUP, id='0', mkstream=True)
+    except redis.ResponseError as error:
+        if 'BUSYGROUP' not in str(error):
+            raise
+
+
+async def _ack(connection, entry_id):
+    pipeline = connection.pipeline(transaction=True)
+    pipeline.xack(STREAM_KEY, GROUP, entry_id)
+    pipeline.xdel(STREAM_KEY, entry_id)
+    pipeline.hdel(ATTEMPTS_KEY, entry_id)
+    await pipeline.execute()
+
+
+async def _process(connection, entries, deliver):
+    """Обрабатывает записи, возвращает False, если часть из них нужно повторить."""
+    async def process_entry(entry_id, fields):
+        broadcast_id, kind, object_id, chat_id = fields['broadcast_id'], fields['kind'], fields['object_id'], fields['chat_id']
+        sent_key = SENT_KEY.format(broadcast_id)
+        if await connection.sismember(sent_key, chat_id):
+            await _ack(connection, entry_id)
+            return True
+
+        try:
+            # deliver сам обрабатывает постоянные ошибки (заблокировал бота, чат не найден),
+            # исключение - временная ошибка, запись остается неподтвержденной для повтора
+            await deliver(broadcast_id, kind, int(object_id), chat_id)
+        except Exception:
+            attempts = await connection.hincrby(ATTEMPTS_KEY, entry_id, 1)
+            if attempts < MAX_ATTEMPTS:
+                logger.warning('Ошибка рассылки %s %s в чат %s, будет повтор', kind, object_id, chat_id, exc_info=True)
+                return False
+
+            logger.exception('Рассылка %s %s в чат %s не удалась после %s попыток', kind, object_id, chat_id, attempts)
+        else:
+            pipeline = connection.pipeline(transaction=True)
+            pipeline.sadd(sent_key, chat_id)
+            pipeline.expire(sent_key, SENT_TTL)
+            await pipeline.execute()
+
+        await _ack(connection, entry_id)
+        return True
+
+    # темп задает общий ограничитель сообщений (core/rate_limiter.py)
+    results = await asyncio.gather(*(process_entry(entry_id, fields) for entry_id, fields in entries))
+    return all(results)
+
+
+async def _claim_stale(connection, deliver):
+    """Забирает и обрабатывает зависшие записи других потребителей, все страницы xautoclaim."""
+    cursor = '0-0'
+    while True:
+        cursor, claimed, *_ = await connection.xautoclaim(STREAM_KEY, GROUP, BROADCAST_CONSUMER, CLAIM_IDLE, start_id=cursor, count=BROADCAST_BATCH)
+        if claimed and not await _process(connection, claimed, deliver):
+            return False
+
+        if cursor == '0-0':
+            return True
+
+
+async def consume(deliver):
+    """Обработка очереди (задача бота). deliver(broadcast_id, kind, object_id, chat_id) отправляет одно сообщение."""
+    connection = get_async_redis()
+    # сначала свои неподтвержденные записи (после перезапуска или ошибки), затем новые
+    last_id = '0'
+    while True:
+        try:
+            await _ensure_group(connection)
+            if last_id == '0' and not await _claim_stale(connection, deliver):
+                await asyncio.sleep(RETRY_DELAY)
+                continue
+
+            response = await connection.xreadgroup(GROUP, BROADCAST_CONSUMER, {STREAM_KEY: last_id}, count=BROADCAST_BATCH, block=5000)
+            entries = response[0][1] if response else []
+            if last_id == '0' and not entries:
+                last_id = '>'
+                continue
+
+            if not await _process(connection, entries, deliver):
+                # неудачные записи остались в списке неподтвержденных, перечитываем его после паузы
+                await asyncio.sleep(RETRY_DELAY)
+                last_id = '0'
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception('Очередь рассылок недоступна')
+            await asyncio.sleep(5)
+            last_id = '0'
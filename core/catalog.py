@@ -0,0 +1,302 @@
+import json
+import logging
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+import redis
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+
+from core.redis_connections import get_redis
+from core.models import Text, Button, Occupation
+
+
+# Тексты, кнопки и профессии почти не меняются, поэтому каждый процесс (бот, celery, админка)
+# держит их снимок в памяти. Общий снимок с номером версии лежит в redis,
+# об изменении процессы узнают через pub/sub и подменяют снимок целиком.
+CatalogEntry = namedtuple('CatalogEntry', ('slug', 'rus', 'heb'))
+OccupationEntry = namedtuple('OccupationEntry', ('id', 'slug', 'rus', 'heb'))
+
+VERSION_KEY = 'catalog:version'
+SNAPSHOT_KEY = 'catalog:snapshot:{}'
+CHANNEL = 'catalog:updates'
+SNAPSHOT_TTL = 3600 * 24 # старые версии нужны только отстающим процессам
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_snapshot = None
+_version = 0
+_revision = 0
+_generation = 0
+_batch_depth = 0
+_listener = None
+_required = set()
+
+
+class Texts(dict):
+    """Результат resolve: строки доступны и по ключу, и как атрибуты (texts.min_salary)."""
+
+    def __getattr__(self, slug):
+        try:
+            return self[slug]
+        except KeyError:
+            raise AttributeError(slug)
+
+
+def _read_db():
+    return {
+        'texts': list(Text.objects.values_list('slug', 'rus', 'heb')),
+        'buttons': list(Button.objects.values_list('slug', 'rus', 'heb')),
+        'occupations': list(Occupation.objects.values_list('id', 'slug', 'rus', 'heb')),
+    }
+
+
+def _build(raw):
+    return {
+        'texts': {row[0]: CatalogEntry(*row) for row in raw['texts']},
+        'buttons': {row[0]: CatalogEntry(*row) for row in raw['buttons']},
+        'occupations': tuple(OccupationEntry(*row) for row in raw['occupations']),
+    }
+
+
+def _swap(snapshot, version, generation):
+    """Подмена снимка, если за время чтения не пришла более свежая версия."""
+    global _snapshot, _version, _revision
+
+    with _lock:
+        if generation != _generation or (_snapshot is not None and version < _version):
+            return False
+        _snapshot = snapshot
+        _version = version
+        _revision += 1
+
+    return True
+
+
+def _fetch_version(version):
+    raw = get_redis().get(SNAPSHOT_KEY.format(version))
+    if raw is None:
+        return None
+
+    return _build(json.loads(raw))
+
+
+def load():
+    """Загрузка актуального снимка (синхронно): из redis, а при его отсутствии - из базы."""
+    generation = _generation
+    _ensure_listener()
+
+    try:
+        version = get_redis().get(VERSION_KEY)
+        snapshot = _fetch_version(version) if version else None
+    except redis.RedisError:
+        logger.exception('Каталог недоступен в redis, читаем из базы')
+        snapshot = _build(_read_db())
+        _swap(snapshot, 0, generation)
+        return snapshot
+
+    if snapshot is None:
+        return publish()
+
+    _swap(snapshot, int(version), generation)
+    return snapshot
+
+
+def publish():
+    """Сборка снимка из базы, запись новой версии в redis и оповещение остальных процессов."""
+    global _generation
+
+    with _lock:
+        _generation += 1
+        generation = _generation
+
+    raw = _read_db()
+    snapshot = _build(raw)
+
+    try:
+        connection = get_redis()
+        version = connection.incr(VERSION_KEY)
+        connection.set(SNAPSHOT_KEY.format(version), json.dumps(raw), ex=SNAPSHOT_TTL)
+        connection.publish(CHANNEL, version)
+    except redis.RedisError:
+        logger.exception('Не удалось опубликовать каталог в redis')
+        version = _version
+
+    _swap(snapshot, version, generation)
+    return snapshot
+
+
+def invalidate():
+    """Сброс локального снимка, следующее обращение перечитает его."""
+    global _snapshot, _generation, _revision
+
+    with _lock:
+        _generation += 1
+        _revision += 1
+        _snapshot = None
+
+
+def on_change():
+    """Вызывается при изменении записей каталога (сигналы моделей)."""
+    if _batch_depth:
+        return
+
+    invalidate()
+    # публикуем только закоммиченные данные
+    transaction.on_commit(publish)
+
+
+@contextmanager
+def batch():
+    """Массовое изменение каталога с одной публикацией в конце (для management команд)."""
+    global _batch_depth
+
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if not _batch_depth:
+            publish()
+
+
+def version():
+    return _version
+
+
+def revision():
+    """Номер локального снимка, меняется при каждой его подмене или сбросе."""
+    return _revision
+
+
+def _listen():
+    while True:
+        try:
+            pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(CHANNEL)
+            # пока подписки не было, версия могла смениться
+            _refresh(get_redis().get(VERSION_KEY))
+
+            for message in pubsub.listen():
+                _refresh(message['data'])
+
+        except redis.RedisError:
+            logger.exception('Потеряно соединение с каналом каталога')
+            time.sleep(5)
+
+
+def _refresh(version):
+    if not version or int(version) <= _version:
+        return
+
+    generation = _generation
+    snapshot = _fetch_version(version)
+    if snapshot is not None:
+        _swap(snapshot, int(version), generation)
+
+
+def _ensure_listener():
+    global _listener
+
+    with _lock:
+        if _listener is None or not _listener.is_alive():
+            _listener = threading.Thread(target=_listen, name='catalog-listener', daemon=True)
+            _listener.start()
+
+
+def _lookup(snapshot, section, slug):
+    entry = snapshot[section].get(slug)
+    if entry is None:
+        if section == 'texts':
+            raise Text.DoesNotExist(f'Text with slug "{slug}" does not exist.')
+        raise Button.DoesNotExist(f'Button with slug "{slug}" does not exist.')
+
+    return entry
+
+
+def _resolve(snapshot, slugs, lang):
+    if lang not in (None, 'rus', 'heb'):
+        raise ValueError(f'Unknown language "{lang}".')
+
+    entries = snapshot['texts']
+    missing = [slug for slug in slugs if slug not in entries]
+    if missing:
+        raise Text.DoesNotExist(f'Texts with slugs {", ".join(missing)} do not exist.')
+
+    if lang is None:
+        return Texts((slug, entries[slug]) for slug in slugs)
+    return Texts((slug, getattr(entries[slug], lang)) for slug in slugs)
+
+
+def require(*slugs):
+    """Объявление текстов, без которых модуль не работает (проверяются при запуске бота)."""
+    _required.update(slugs)
+    return slugs
+
+
+def check_required():
+    snapshot = _snapshot or load()
+    missing = sorted(_required - snapshot['texts'].keys())
+    if missing:
+        raise ImproperlyConfigured(f'Не найдены тексты: {", ".join(missing)}. Запустите python manage.py add_text')
+
+
+def resolve(*slugs, lang=None):
+    snapshot = _snapshot or load()
+    return _resolve(snapshot, slugs, lang)
+
+
+def get_text(slug):
+    snapshot = _snapshot or load()
+    return _lookup(snapshot, 'texts', slug)
+
+
+def get_button(slug):
+    snapshot = _snapshot or load()
+    return _lookup(snapshot, 'buttons', slug)
+
+
+def _find_occupation(snapshot, slug):
+    for occupation in snapshot['occupations']:
+        if occupation.slug == slug:
+            return occupation
+
+    return None
+
+
+def get_occupations():
+    snapshot = _snapshot or load()
+    return snapshot['occupations']
+
+
+async def aload():
+    return _snapshot or await sync_to_async(load)()
+
+
+async def text(slug):
+    snapshot = await aload()
+    return _lookup(snapshot, 'texts', slug)
+
+
+async def aresolve(*slugs, lang=None):
+    snapshot = await aload()
+    return _resolve(snapshot, slugs, lang)
+
+
+async def button(slug):
+    snapshot = await aload()
+    return _lookup(snapshot, 'buttons', slug)
+
+
+async def occupations():
+    snapshot = await aload()
+    return snapshot['occupations']
+
+
+async def occupation(slug):
+    snapshot = await aload()
+    return _find_occupation(snapshot, slug)
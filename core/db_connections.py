@@ -0,0 +1,57 @@
+import asyncio
+import logging
+import threading
+from collections import namedtuple
+
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+
+# Соединения с базой в долго работающем боте. Цикла запросов django здесь нет, поэтому
+# устаревшие соединения (CONN_MAX_AGE, ошибки) закрываются явно: перед и после каждой задачи
+# пула (core/executor.py) и периодически в потоке sync_to_async, где выполняются записи.
+# Перед использованием соединение проверяется (CONN_HEALTH_CHECKS в settings).
+ConnectionStats = namedtuple('ConnectionStats', ('opened', 'closed'))
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_opened = 0
+_closed = 0
+
+
+def _connection_opened(sender, connection, **kwargs):
+    global _opened
+    with _lock:
+        _opened += 1
+
+
+connection_created.connect(_connection_opened)
+
+
+def close_old():
+    """Закрывает устаревшие и сломанные соединения текущего потока (аналог close_old_connections)."""
+    global _closed
+    for conn in connections.all(initialized_only=True):
+        was_open = conn.connection is not None
+        conn.close_if_unusable_or_obsolete()
+        if was_open and conn.connection is None:
+            with _lock:
+                _closed += 1
+
+
+def stats():
+    """Сколько соединений открыто и закрыто за время работы процесса."""
+    with _lock:
+        return ConnectionStats(_opened, _closed)
+
+
+async def sweep_periodically(interval):
+    """Периодическая проверка соединений потока sync_to_async (запускается задачей в bot.py)."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await sync_to_async(close_old)()
+        except Exception:
+            logger.exception('Не удалось проверить соединения с базой')
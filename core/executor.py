@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from config import DB_EXECUTOR_WORKERS, DB_EXECUTOR_QUEUE
+from core import db_connections
+
+
+# Пул потоков для чтения из базы в боте. sync_to_async по умолчанию (thread_sensitive=True)
+# выполняет все запросы по очереди в одном потоке, и медленный запрос одного пользователя
+# задерживает апдейты всех остальных. Здесь запросы разных пользователей идут параллельно,
+# у каждого потока свое соединение с базой. Записи (save, транзакции) остаются в sync_to_async.
+# Очередь ограничена: при перегрузке запрос сразу отклоняется (ExecutorBusy), а не ждет без предела.
+ExecutorStats = namedtuple('ExecutorStats', ('workers', 'running', 'queued', 'completed', 'rejected'))
+
+SATURATION_LOG_INTERVAL = 60 # не чаще раза в минуту пишем в лог об отклоненных запросах
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorBusy(Exception):
+    """Очередь пула заполнена, запрос отклонен."""
+
+
+_lock = threading.Lock()
+_executor = None
+_running = 0
+_queued = 0
+_completed = 0
+_rejected = 0
+_saturation_logged_at = 0
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=DB_EXECUTOR_WORKERS, thread_name_prefix='db')
+
+    return _executor
+
+
+def _call(func, args, kwargs):
+    global _running, _queued, _completed
+    with _lock:
+        _queued -= 1
+        _running += 1
+
+    # как в цикле запроса django: закрываем соединения с истекшим CONN_MAX_AGE или ошибкой,
+    # живое соединение потока используется повторно
+    db_connections.close_old()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        db_connections.close_old()
+        with _lock:
+            _running -= 1
+            _completed += 1
+
+
+def _forget_cancelled(future):
+    # задача, отмененная до начала выполнения, не попадает в _call и не уходит из очереди сама
+    global _queued
+    if future.cancelled():
+        with _lock:
+            _queued -= 1
+
+
+def _log_saturation():
+    global _saturation_logged_at
+    now = time.monotonic()
+    if now - _saturation_logged_at > SATURATION_LOG_INTERVAL:
+        _saturation_logged_at = now
+        logger.warning('Пул запросов к базе заполнен, запросы отклоняются: %s', stats())
+
+
+async def run(func, *args, **kwargs):
+    """Выполняет синхронную функцию чтения из базы в пуле и возвращает результат.
+
+    Если в пуле уже DB_EXECUTOR_WORKERS + DB_EXECUTOR_QUEUE задач, поднимает ExecutorBusy.
+    """
+    global _queued, _rejected
+    with _lock:
+        is_full = _running + _queued >= DB_EXECUTOR_WORKERS + DB_EXECUTOR_QUEUE
+        if is_full:
+            _rejected += 1
+        else:
+            _queued += 1
+
+    if is_full:
+        _log_saturation()
+        raise ExecutorBusy()
+
+    future = _get_executor().submit(_call, func, args, kwargs)
+    future.add_done_callback(_forget_cancelled)
+    return await asyncio.wrap_future(future)
+
+
+def stats():
+    """Текущая загрузка пула: потоки, выполняемые и ожидающие задачи, выполненные и отклоненные запросы."""
+    with _lock:
+        return ExecutorStats(DB_EXECUTOR_WORKERS, _running, _queued, _completed, _rejected)
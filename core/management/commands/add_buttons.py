@@ -1,5 +1,6 @@
 from django.core.management import BaseCommand
 
+from core import catalog
 from core.models import Button
 
 
@@ -54,27 +55,28 @@ class Command(BaseCommand):
             ['add_review', '💬 Оставить отзыв', '💬 השאר חוות דעת'],
             ['view_reviews', '💬 Посмотреть отзывы', '💬 צפה בחוות דעת'],
         ]
-        for item in buttons:
-            slug = item[0]
-            text_rus = item[1]
-            text_heb = item[2]
+        with catalog.batch():
+            for item in buttons:
+                slug = item[0]
+                text_rus = item[1]
+                text_heb = item[2]
 
-            prev_text = Button.objects.filter(slug=slug).first()
-            if not prev_text:
-                my_order = Button.objects.count()
-                new_text = Button(slug=slug, rus=text_rus, heb=text_heb, my_order=my_order)
-                new_text.save()
-                print(f'Создан текст {slug}: {text_rus}\n{text_heb}')
-            else:
-                if prev_text.rus != text_rus:
-                    prev_text.rus = text_rus
-                    prev_text.save()
-                    print(f'{slug}: заменен русский текст')
+                prev_text = Button.objects.filter(slug=slug).first()
+                if not prev_text:
+                    my_order = Button.objects.count()
+                    new_text = Button(slug=slug, rus=text_rus, heb=text_heb, my_order=my_order)
+                    new_text.save()
+                    print(f'Создан текст {slug}: {text_rus}\n{text_heb}')
+                else:
+                    if prev_text.rus != text_rus:
+                        prev_text.rus = text_rus
+                        prev_text.save()
+                        print(f'{slug}: заменен русский текст')
+
+                    if prev_text.heb != text_heb:
+                        prev_text.heb = text_heb
+                        prev_text.save()
+                        print(f'{slug}: заменен текст на иврите')
 
-                if prev_text.heb != text_heb:
-                    prev_text.heb = text_heb
-                    prev_text.save()
-                    print(f'{slug}: заменен текст на иврите')
-        
         print('done')
 
@@ -1,6 +1,7 @@
 from django.core.management import BaseCommand
 from django.db.models import Q
 
+from core import catalog
 from core.models import Text
 
 
@@ -107,29 +108,30 @@ class Command(BaseCommand):
             ['input_employer_name', 'Пожалуйста, укажите ваше имя или название компании', 'אנא ציין את שמך או את שם החברה שלך.'],
         ]
         
-        for item in texts:
-            slug = item[0]
-            text_rus = item[1]
-            text_heb = item[2]
+        with catalog.batch():
+            for item in texts:
+                slug = item[0]
+                text_rus = item[1]
+                text_heb = item[2]
 
-            prev_text = Text.objects.filter(slug=slug).first()
-            if not prev_text:
-                my_order = Text.objects.count()
-                new_text = Text(slug=slug, rus=text_rus, heb=text_heb, my_order=my_order)
-                new_text.save()
-                print(f'Создан текст {slug}: {text_rus}\n{text_heb}')
-            else:
-                if prev_text.rus != text_rus:
-                    prev_text.rus = text_rus
-                    prev_text.save()
-                    print(text_rus)
-                    print(prev_text.rus)
-                    print(f'{slug}: заменен русский текст')
+                prev_text = Text.objects.filter(slug=slug).first()
+                if not prev_text:
+                    my_order = Text.objects.count()
+                    new_text = Text(slug=slug, rus=text_rus, heb=text_heb, my_order=my_order)
+                    new_text.save()
+                    print(f'Создан текст {slug}: {text_rus}\n{text_heb}')
+                else:
+                    if prev_text.rus != text_rus:
+                        prev_text.rus = text_rus
+                        prev_text.save()
+                        print(text_rus)
+                        print(prev_text.rus)
+                        print(f'{slug}: заменен русский текст')
+
+                    if prev_text.heb != text_heb:
+                        prev_text.heb = text_heb
+                        prev_text.save()
+                        print(f'{slug}: заменен текст на иврите')
 
-                if prev_text.heb != text_heb:
-                    prev_text.heb = text_heb
-                    prev_text.save()
-                    print(f'{slug}: заменен текст на иврите')
-        
         print('done')
 
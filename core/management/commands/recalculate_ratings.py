@@ -0,0 +1,35 @@
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.db.models import Sum, Count
+
+from core.models import Worker, Employer, WorkerReview, EmployerReview
+
+
+class Command(BaseCommand):
+    help = 'Пересчет рейтингов работников и работодателей по одобренным отзывам'
+
+    def handle(self, *args, **options):
+        targets = (
+            (Worker, EmployerReview, 'worker'),
+            (Employer, WorkerReview, 'employer'),
+        )
+        for model, review_model, field in targets:
+            with transaction.atomic():
+                # сначала блокируем получателей, затем считаем отзывы: одобрение, которое закоммитится
+                # позже, ждет блокировки и добавит свою оценку уже к пересчитанному рейтингу
+                objects = list(model.objects.select_for_update().only('id', 'rating_sum', 'rating_count'))
+                ratings = {
+                    row[field]: (row['rating_sum'], row['rating_count'])
+                    for row in review_model.objects.filter(is_approved=True, **{f'{field}__isnull': False}).values(field).annotate(
+                        rating_sum=Sum('rate'),
+                        rating_count=Count('id'),
+                        ).order_by()
+                }
+
+                for obj in objects:
+                    obj.rating_sum, obj.rating_count = ratings.get(obj.id, (0, 0))
+                model.objects.bulk_update(objects, ('rating_sum', 'rating_count'), batch_size=1000)
+
+            print(f'{model._meta.verbose_name_plural}: пересчитано {len(objects)}')
+
+        print('done')
@@ -0,0 +1,291 @@
+import bisect
+import threading
+import time
+from collections import defaultdict, namedtuple
+
+from django.db import transaction
+
+from config import MATCHING_INDEX_TTL
+from core.models import Job, Worker
+
+
+# Индекс для подбора "подходящих" вакансий и работников без JOIN-запросов на каждый просмотр.
+# Для каждой профессии хранятся отсортированные по ставке пары (ставка, id) активных одобренных
+# вакансий и ищущих работу одобренных работников. Индекс обновляется точечно по сигналам
+# (core/signals.py), а раз в MATCHING_INDEX_TTL секунд перестраивается целиком, чтобы подхватить
+# изменения, сделанные в других процессах (админка).
+JobEntry = namedtuple('JobEntry', ('employer_id', 'min_salary', 'occupations', 'key'))
+WorkerEntry = namedtuple('WorkerEntry', ('min_salary', 'occupations', 'key'))
+
+_lock = threading.RLock()
+_rebuild_lock = threading.Lock()
+_loaded_at = None
+# id, изменившиеся во время перестройки: перечитываются и накатываются на новый индекс перед подменой
+_pending_jobs = None
+_pending_workers = None
+_jobs = {}
+_workers = {}
+_employer_jobs = defaultdict(set)
+_jobs_by_occupation = defaultdict(list)
+_workers_by_occupation = defaultdict(list)
+
+
+def _suitable_jobs():
+    return Job.objects.filter(is_active=True, is_approved=True)
+
+
+def _suitable_workers():
+    return Worker.objects.filter(is_searching=True, is_approved=True)
+
+
+def _group_occupations(pairs):
+    occupations = defaultdict(set)
+    for object_id, occupation_id in pairs:
+        occupations[object_id].add(occupation_id)
+
+    return occupations
+
+
+def rebuild():
+    """Полная перестройка индекса (синхронно)."""
+    global _pending_jobs, _pending_workers
+
+    with _rebuild_lock:
+        with _lock:
+            _pending_jobs = set()
+            _pending_workers = set()
+        try:
+            _build()
+        finally:
+            with _lock:
+                _pending_jobs = None
+                _pending_workers = None
+
+
+def _build():
+    global _loaded_at, _jobs, _workers, _employer_jobs, _jobs_by_occupation, _workers_by_occupation
+    global _pending_jobs, _pending_workers
+
+    job_occupations = _group_occupations(Job.occupations.through.objects.filter(
+        job__is_active=True,
+        job__is_approved=True,
+        ).values_list('job_id', 'occupation_id'))
+    worker_occupations = _group_occupations(Worker.occupations.through.objects.filter(
+        worker__is_searching=True,
+        worker__is_approved=True,
+        ).values_list('worker_id', 'occupation_id'))
+
+    jobs = {}
+    employer_jobs = defaultdict(set)
+    jobs_by_occupation = defaultdict(list)
+    for job_id, employer_id, min_salary, created_at in _suitable_jobs().values_list('id', 'employer_id', 'min_salary', 'created_at'):
+        occupations = frozenset(job_occupations.get(job_id, ()))
+        jobs[job_id] = JobEntry(employer_id, min_salary, occupations, (created_at, job_id))
+        employer_jobs[employer_id].add(job_id)
+        for occupation_id in occupations:
+            jobs_by_occupation[occupation_id].append((min_salary, job_id))
+
+    workers = {}
+    workers_by_occupation = defaultdict(list)
+    for worker_id, min_salary, created_at in _suitable_workers().values_list('id', 'min_salary', 'created_at'):
+        occupations = frozenset(worker_occupations.get(worker_id, ()))
+        workers[worker_id] = WorkerEntry(min_salary, occupations, (created_at, worker_id))
+        for occupation_id in occupations:
+            workers_by_occupation[occupation_id].append((min_salary, worker_id))
+
+    for pairs in jobs_by_occupation.values():
+        pairs.sort()
+    for pairs in workers_by_occupation.values():
+        pairs.sort()
+
+    # Пока строился индекс, сигналы обновляли старый. Перечитываем затронутые id, пока за время
+    # чтения не перестанут появляться новые, и накатываем их на новый индекс под той же блокировкой,
+    # что и подмену, иначе свежие изменения были бы затерты снимком, прочитанным раньше них.
+    replay_jobs = {}
+    replay_workers = {}
+    while True:
+        with _lock:
+            if not _pending_jobs and not _pending_workers:
+                _jobs = jobs
+                _workers = workers
+                _employer_jobs = employer_jobs
+                _jobs_by_occupation = jobs_by_occupation
+                _workers_by_occupation = workers_by_occupation
+                for job_id, (row, occupations) in replay_jobs.items():
+                    _store_job(job_id, row, occupations)
+                for worker_id, (row, occupations) in replay_workers.items():
+                    _store_worker(worker_id, row, occupations)
+                _loaded_at = time.monotonic()
+                return
+
+            job_ids, _pending_jobs = _pending_jobs, set()
+            worker_ids, _pending_workers = _pending_workers, set()
+
+        for job_id in job_ids:
+            replay_jobs[job_id] = _load_job(job_id)
+        for worker_id in worker_ids:
+            replay_workers[worker_id] = _load_worker(worker_id)
+
+
+def _ensure_loaded():
+    if _loaded_at is None or time.monotonic() - _loaded_at > MATCHING_INDEX_TTL:
+        rebuild()
+
+
+def _remove_job(job_id):
+    entry = _jobs.pop(job_id, None)
+    if entry is None:
+        return
+
+    _employer_jobs[entry.employer_id].discard(job_id)
+    for occupation_id in entry.occupations:
+        pairs = _jobs_by_occupation[occupation_id]
+        index = bisect.bisect_left(pairs, (entry.min_salary, job_id))
+        if index < len(pairs) and pairs[index] == (entry.min_salary, job_id):
+            del pairs[index]
+
+
+def _remove_worker(worker_id):
+    entry = _workers.pop(worker_id, None)
+    if entry is None:
+        return
+
+    for occupation_id in entry.occupations:
+        pairs = _workers_by_occupation[occupation_id]
+        index = bisect.bisect_left(pairs, (entry.min_salary, worker_id))
+        if index < len(pairs) and pairs[index] == (entry.min_salary, worker_id):
+            del pairs[index]
+
+
+def _load_job(job_id):
+    row = _suitable_jobs().filter(id=job_id).values_list('employer_id', 'min_salary', 'created_at').first()
+    occupations = frozenset()
+    if row:
+        occupations = frozenset(Job.occupations.through.objects.filter(job_id=job_id).values_list('occupation_id', flat=True))
+
+    return row, occupations
+
+
+def _store_job(job_id, row, occupations):
+    _remove_job(job_id)
+    if row:
+        employer_id, min_salary, created_at = row
+        _jobs[job_id] = JobEntry(employer_id, min_salary, occupations, (created_at, job_id))
+        _employer_jobs[employer_id].add(job_id)
+        for occupation_id in occupations:
+            bisect.insort(_jobs_by_occupation[occupation_id], (min_salary, job_id))
+
+
+def _refresh_job(job_id):
+    row, occupations = _load_job(job_id)
+
+    with _lock:
+        _store_job(job_id, row, occupations)
+        if _pending_jobs is not None:
+            _pending_jobs.add(job_id)
+
+
+def _load_worker(worker_id):
+    row = _suitable_workers().filter(id=worker_id).values_list('min_salary', 'created_at').first()
+    occupations = frozenset()
+    if row:
+        occupations = frozenset(Worker.occupations.through.objects.filter(worker_id=worker_id).values_list('occupation_id', flat=True))
+
+    return row, occupations
+
+
+def _store_worker(worker_id, row, occupations):
+    _remove_worker(worker_id)
+    if row:
+        min_salary, created_at = row
+        _workers[worker_id] = WorkerEntry(min_salary, occupations, (created_at, worker_id))
+        for occupation_id in occupations:
+            bisect.insort(_workers_by_occupation[occupation_id], (min_salary, worker_id))
+
+
+def _refresh_worker(worker_id):
+    row, occupations = _load_worker(worker_id)
+
+    with _lock:
+        _store_worker(worker_id, row, occupations)
+        if _pending_workers is not None:
+            _pending_workers.add(worker_id)
+
+
+def _tracked():
+    return _loaded_at is not None or _pending_jobs is not None
+
+
+def job_changed(job_id):
+    """Вызывается из сигналов: обновление вакансии в индексе после коммита."""
+    if _tracked():
+        transaction.on_commit(lambda: _refresh_job(job_id))
+
+
+def job_deleted(job_id):
+    if _tracked():
+        with _lock:
+            _remove_job(job_id)
+            if _pending_jobs is not None:
+                _pending_jobs.add(job_id)
+
+
+def worker_changed(worker_id):
+    """Вызывается из сигналов: обновление работника в индексе после коммита."""
+    if _tracked():
+        transaction.on_commit(lambda: _refresh_worker(worker_id))
+
+
+def worker_deleted(worker_id):
+    if _tracked():
+        with _lock:
+            _remove_worker(worker_id)
+            if _pending_workers is not None:
+                _pending_workers.add(worker_id)
+
+
+def reset():
+    """Сброс индекса, следующее обращение перестроит его целиком."""
+    global _loaded_at
+    _loaded_at = None
+
+
+def _newest_first(ids, entries):
+    return sorted(ids, key=lambda object_id: entries[object_id].key, reverse=True)
+
+
+def suitable_job_ids(occupation_ids, min_salary):
+    """Id активных одобренных вакансий с любой из профессий и ставкой не ниже min_salary (синхронно).
+
+    Порядок - как у Job.objects (сначала новые).
+    """
+    _ensure_loaded()
+
+    with _lock:
+        ids = set()
+        for occupation_id in occupation_ids:
+            pairs = _jobs_by_occupation.get(occupation_id, ())
+            start = bisect.bisect_left(pairs, (min_salary, 0))
+            ids.update(job_id for _, job_id in pairs[start:])
+
+        return _newest_first(ids, _jobs)
+
+
+def suitable_worker_ids(employer_id):
+    """Id ищущих работу одобренных работников, подходящих под любую активную вакансию работодателя (синхронно).
+
+    Работник подходит вакансии, если у них есть общая профессия и его ставка не выше ставки вакансии.
+    """
+    _ensure_loaded()
+
+    with _lock:
+        ids = set()
+        for job_id in _employer_jobs.get(employer_id, ()):
+            job = _jobs[job_id]
+            for occupation_id in job.occupations:
+                pairs = _workers_by_occupation.get(occupation_id, ())
+                end = bisect.bisect_right(pairs, (job.min_salary, float('inf')))
+                ids.update(worker_id for _, worker_id in pairs[:end])
+
+        return _newest_first(ids, _workers)
+
@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-18 11:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_employer_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['created_at', 'id'], name='core_job_created_1dd44e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='worker',
+            index=models.Index(fields=['created_at', 'id'], name='core_worker_created_a91b03_idx'),
+        ),
+    ]
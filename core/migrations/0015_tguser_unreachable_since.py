@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-18 11:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_rating_aggregates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tguser',
+            name='unreachable_since',
+            field=models.DateTimeField(blank=True, default=None, null=True, verbose_name='Недоступен с'),
+        ),
+    ]
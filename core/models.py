@@ -1,7 +1,7 @@
 import datetime
 
-from django.db import models
-from django.db.models import Min, Max, Q, Avg
+from django.db import models, transaction
+from django.db.models import Q, F, Prefetch
 from django.utils.html import format_html
 from django.db.models.signals import post_save
 from django.dispatch import receiver
@@ -15,12 +15,30 @@ TARGETS = (
 )
 
 
+class TextManager(models.Manager):
+    """Чтение текстов пачкой из каталога (core/catalog.py) без обращения к базе."""
+
+    def require(self, *slugs):
+        from core import catalog
+        return catalog.require(*slugs)
+
+    def resolve(self, *slugs, lang=None):
+        from core import catalog
+        return catalog.resolve(*slugs, lang=lang)
+
+    async def aresolve(self, *slugs, lang=None):
+        from core import catalog
+        return await catalog.aresolve(*slugs, lang=lang)
+
+
 class Text(models.Model):
     slug = models.CharField(verbose_name='Идентификатор', max_length=100, unique=True)
     rus = models.TextField(verbose_name='Текст (русский)', max_length=1024, null=True, blank=True)
     heb = models.TextField(verbose_name='Текст (иврит)', max_length=1024, null=True, blank=True)
     my_order = models.PositiveIntegerField(verbose_name='Порядок', default=0, blank=False, null=False)
 
+    objects = TextManager()
+
     class Meta:
         verbose_name = 'текст'
         verbose_name_plural = 'тексты'
@@ -72,6 +90,8 @@ class TGUser(models.Model):
     tg_id = models.CharField(verbose_name='Телеграм id', max_length=100, unique=True)
     target = models.CharField(verbose_name='Тип пользователя', choices=TARGETS, max_length=10)
     created_at = models.DateTimeField(verbose_name='Дата создания', auto_now_add=True)
+    # заблокировал бота или удалил аккаунт: рассылки его пропускают, пока он снова не напишет боту (core/unreachable.py)
+    unreachable_since = models.DateTimeField(verbose_name='Недоступен с', null=True, blank=True, default=None)
 
     class Meta:
         verbose_name = 'пользователь'
@@ -86,6 +106,37 @@ class ObjectPhoto(models.Model):
     photo_id = models.CharField(verbose_name='TG id фото', max_length=200, unique=True)
 
 
+def _readable_occupations(obj, lang):
+    """Профессии через запятую, из with_occupations(), если они были подгружены."""
+    occupations = getattr(obj, 'prefetched_occupations', None)
+    if occupations is None:
+        occupations = obj.occupations.all()
+
+    return ', '.join(getattr(occupation, lang) for occupation in occupations)
+
+
+class OccupationsQuerySet(models.QuerySet):
+    def with_occupations(self):
+        """Подгрузка профессий одним запросом на всю выборку (для списков)."""
+        return self.prefetch_related(Prefetch('occupations', queryset=Occupation.objects.all(), to_attr='prefetched_occupations'))
+
+
+class WorkerQuerySet(OccupationsQuerySet):
+    def suitable_for_employer(self, employer):
+        """Ищущие работу работники, подходящие под любую активную вакансию работодателя, одним запросом.
+
+        Условия на вакансию заданы в одном filter, поэтому относятся к одной и той же вакансии.
+        """
+        return self.filter(
+            is_searching=True,
+            is_approved=True,
+            occupations__jobs__employer=employer,
+            occupations__jobs__is_active=True,
+            occupations__jobs__is_approved=True,
+            min_salary__lte=F('occupations__jobs__min_salary'),
+            ).distinct()
+
+
 class Worker(models.Model):
     tg_id = models.CharField(verbose_name='Телеграм id', max_length=100, unique=True)
     username = models.CharField(verbose_name='Ник телеграм', max_length=100, null=True, blank=True)
@@ -101,12 +152,18 @@ class Worker(models.Model):
     notifications = models.BooleanField(verbose_name='Подписан на уведомления?', default=False)
     is_searching = models.BooleanField(verbose_name='В поисках работы?', default=True)
     is_approved = models.BooleanField(verbose_name='Аккаунт подтвержден?', default=None, null=True, blank=True)
+    rating_sum = models.PositiveIntegerField(verbose_name='Сумма оценок', default=0)
+    rating_count = models.PositiveIntegerField(verbose_name='Количество оценок', default=0)
     created_at = models.DateTimeField(verbose_name='Дата создания', auto_now_add=True)
 
+    objects = WorkerQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'работник'
         verbose_name_plural = 'работники'
         ordering = ('-created_at',)
+        # постраничный вывод по курсору (keyboards/pagination.py)
+        indexes = [models.Index(fields=('created_at', 'id'))]
 
     def __str__(self):
         if self.name:
@@ -124,23 +181,11 @@ class Worker(models.Model):
 
     @property
     def readable_rus_occupations(self):
-        readable_occupations = ''
-        for occupation in self.occupations.all():
-            readable_occupations += f'{occupation.rus}, '
-        
-        readable_occupations = readable_occupations.strip(', ')
-
-        return readable_occupations
+        return _readable_occupations(self, 'rus')
     
     @property
     def readable_heb_occupations(self):
-        readable_occupations = ''
-        for occupation in self.occupations.all():
-            readable_occupations += f'{occupation.heb}, '
-        
-        readable_occupations = readable_occupations.strip(', ')
-
-        return readable_occupations
+        return _readable_occupations(self, 'heb')
     
     @property
     def readable_approved_status(self):
@@ -169,19 +214,15 @@ class Worker(models.Model):
     
     @property
     def rating_rus(self):
-        reviews = self.received_reviews.all()
-        if reviews.exists():
-            average = reviews.aggregate(Avg('rate'))['rate__avg']
-            return f'{round(average, 1)} ⭐️'
+        if self.rating_count:
+            return f'{round(self.rating_sum / self.rating_count, 1)} ⭐️'
         else:
             return 'нет оценок'
     
     @property
     def rating_heb(self):
-        reviews = self.received_reviews.all()
-        if reviews.exists():
-            average = reviews.aggregate(Avg('rate'))['rate__avg']
-            return f'{round(average, 1)} ⭐️'
+        if self.rating_count:
+            return f'{round(self.rating_sum / self.rating_count, 1)} ⭐️'
         else:
             return 'אין דירוגים'
 
@@ -191,6 +232,8 @@ class Employer(models.Model):
     username = models.CharField(verbose_name='Ник телеграм', max_length=100, null=True, blank=True)
     name = models.CharField(verbose_name='Имя/название компании', default='Company', max_length=150)
     phone = models.CharField(verbose_name='Номер телефона', max_length=25, null=True, blank=True)
+    rating_sum = models.PositiveIntegerField(verbose_name='Сумма оценок', default=0)
+    rating_count = models.PositiveIntegerField(verbose_name='Количество оценок', default=0)
     created_at = models.DateTimeField(verbose_name='Дата создания', auto_now_add=True)
 
     class Meta:
@@ -201,32 +244,38 @@ class Employer(models.Model):
     def __str__(self):
         return f'{self.tg_id} - {self.name}'
     
-    def _all_offered_occupations(self):
-        occupations = []
-        for job in self.jobs.filter(Q(is_approved=True) & Q(is_active=True)).all():
-            for occupation in job.occupations.all():
-                if occupation not in occupations:
-                    occupations.append(occupation)
-        
-        return occupations
+    _offered_summary = None
+
+    def offered_summary(self):
+        """Профессии и разброс ставок по активным вакансиям одним запросом (результат запоминается в объекте).
+
+        Возвращает список профессий (rus) без повторов, минимальную и максимальную ставку.
+        """
+        if self._offered_summary is None:
+            rows = self.jobs.filter(Q(is_approved=True) & Q(is_active=True)).order_by('-created_at', 'occupations__my_order').values_list('min_salary', 'occupations__rus')
+
+            occupations = {}
+            salaries = set()
+            for min_salary, occupation in rows:
+                salaries.add(min_salary)
+                if occupation is not None:
+                    occupations[occupation] = None
+
+            self._offered_summary = (list(occupations), min(salaries, default=None), max(salaries, default=None))
+
+        return self._offered_summary
     
     @property
     def readable_occupations(self):
-        occupations = self._all_offered_occupations()
-        readable_occupations = ''
-        for occupation in occupations:
-            readable_occupations += f'{occupation.rus}, '
+        occupations, _, _ = self.offered_summary()
+        if occupations:
+            return ', '.join(occupations)
         
-        if readable_occupations:
-            readable_occupations = readable_occupations.strip(', ')
-        else:
-            readable_occupations = 'работодатель не разместил активных вакансий'
-        
-        return readable_occupations
+        return 'работодатель не разместил активных вакансий'
 
     @property
     def min_min_salary(self):
-        min_salary = self.jobs.filter(Q(is_approved=True) & Q(is_active=True)).aggregate(Min('min_salary'))['min_salary__min']
+        _, min_salary, _ = self.offered_summary()
         if min_salary is None:
             return 'не указана'
         else:
@@ -234,27 +283,23 @@ class Employer(models.Model):
     
     @property
     def max_min_salary(self):
-        min_salary = self.jobs.filter(Q(is_approved=True) & Q(is_active=True)).aggregate(Max('min_salary'))['min_salary__max']
-        if min_salary is None:
+        _, _, max_salary = self.offered_summary()
+        if max_salary is None:
             return 'не указана'
         else:
-            return f'{min_salary} ₪/час'
+            return f'{max_salary} ₪/час'
     
     @property
     def rating_rus(self):
-        reviews = self.received_reviews.all()
-        if reviews.exists():
-            average = reviews.aggregate(Avg('rate'))['rate__avg']
-            return f'{round(average, 1)} ⭐️'
+        if self.rating_count:
+            return f'{round(self.rating_sum / self.rating_count, 1)} ⭐️'
         else:
             return 'нет оценок'
     
     @property
     def rating_heb(self):
-        reviews = self.received_reviews.all()
-        if reviews.exists():
-            average = reviews.aggregate(Avg('rate'))['rate__avg']
-            return f'{round(average, 1)} ⭐️'
+        if self.rating_count:
+            return f'{round(self.rating_sum / self.rating_count, 1)} ⭐️'
         else:
             return 'אין דירוגים'
     
@@ -271,18 +316,17 @@ class Job(models.Model):
     created_at = models.DateTimeField(verbose_name='Дата создания', auto_now_add=True)
     updated_at = models.DateTimeField(verbose_name='Дата обновления', auto_now=True, null=True)
 
+    objects = OccupationsQuerySet.as_manager()
+
     class Meta:
         verbose_name = 'вакансия'
         verbose_name_plural = 'вакансии'
         ordering = ('-created_at',)
+        # постраничный вывод по курсору (keyboards/pagination.py)
+        indexes = [models.Index(fields=('created_at', 'id'))]
         
     def __str__(self):
-        text = ''
-        for occupation in self.occupations.all():
-            text += f'{occupation.rus}, '
-        
-        text = text.rstrip(', ')
-        return f'{self.min_salary} ₪/час: {text}'
+        return f'{self.min_salary} ₪/час: {self.readable_rus_occupations}'
     
     @property
     def readable_notifications_rus_status(self):
@@ -300,23 +344,11 @@ class Job(models.Model):
 
     @property
     def readable_rus_occupations(self):
-        readable_occupations = ''
-        for occupation in self.occupations.all():
-            readable_occupations += f'{occupation.rus}, '
-        
-        readable_occupations = readable_occupations.strip(', ')
-
-        return readable_occupations
+        return _readable_occupations(self, 'rus')
     
     @property
     def readable_heb_occupations(self):
-        readable_occupations = ''
-        for occupation in self.occupations.all():
-            readable_occupations += f'{occupation.heb}, '
-        
-        readable_occupations = readable_occupations.strip(', ')
-
-        return readable_occupations
+        return _readable_occupations(self, 'heb')
 
     @property
     def readable_approved_status(self):
@@ -338,6 +370,62 @@ class Job(models.Model):
             return 'לא'
 
 
+def _change_rating(review_model, target_id, rate, delta):
+    """Добавляет (delta=1) или убирает (delta=-1) оценку отзыва из рейтинга получателя."""
+    if target_id:
+        target_model = review_model._meta.get_field(review_model.RATING_TARGET).related_model
+        target_model.objects.filter(id=target_id).update(
+            rating_sum=F('rating_sum') + delta * rate,
+            rating_count=F('rating_count') + delta,
+        )
+
+
+def _set_review_approval(review, is_approved):
+    """Смена статуса отзыва вместе с рейтингом получателя (синхронно, атомарно).
+
+    В рейтинге учитываются только одобренные отзывы, поэтому он меняется лишь при переходе
+    в одобренный статус и обратно.
+    """
+    reviews = type(review).objects.filter(id=review.id)
+    with transaction.atomic():
+        was_approved = reviews.select_for_update().values_list('is_approved', flat=True).first() is True
+        reviews.update(is_approved=is_approved)
+
+        if was_approved != is_approved:
+            delta = 1 if is_approved else -1
+            _change_rating(type(review), review.rating_target_id, review.rate, delta)
+
+    review.is_approved = is_approved
+
+
+def remember_review_rating(review, update_fields=None):
+    """Перед сохранением отзыва в обход set_approved (админка): запоминает, как он учтен в рейтинге сейчас."""
+    review._rating_before = None
+    if review.pk and (update_fields is None or set(update_fields) & {'is_approved', 'rate', review.RATING_TARGET}):
+        review._rating_before = type(review).objects.filter(id=review.pk).values_list(
+            'is_approved', 'rate', f'{review.RATING_TARGET}_id').first()
+
+
+def update_review_rating(review, update_fields=None):
+    """После сохранения отзыва: убирает из рейтинга прежнюю оценку и добавляет новую (вызывается из сигналов)."""
+    if update_fields is not None and not set(update_fields) & {'is_approved', 'rate', review.RATING_TARGET}:
+        return
+
+    before = getattr(review, '_rating_before', None)
+    if before and before[0] is True:
+        _change_rating(type(review), before[2], before[1], -1)
+    if review.is_approved is True:
+        _change_rating(type(review), review.rating_target_id, review.rate, 1)
+
+    review._rating_before = None
+
+
+def remove_review_rating(review):
+    """Удаленный одобренный отзыв больше не учитывается в рейтинге (вызывается из сигналов)."""
+    if review.is_approved is True:
+        _change_rating(type(review), review.rating_target_id, review.rate, -1)
+
+
 class WorkerReview(models.Model):
     worker = models.ForeignKey(Worker, verbose_name='Сотрудник, оставивший отзыв', related_name='leaved_reviews', on_delete=models.SET_NULL, null=True)
     employer = models.ForeignKey(Employer, verbose_name='Работодатель, получивший отзыв', related_name='received_reviews', on_delete=models.SET_NULL, null=True)
@@ -347,6 +435,8 @@ class WorkerReview(models.Model):
     is_approved = models.BooleanField(default=None, null=True)
     created_at = models.DateTimeField(verbose_name='Дата создания', auto_now_add=True)
 
+    RATING_TARGET = 'employer' # чей рейтинг меняет отзыв
+
     class Meta:
         verbose_name = 'отзыв работника'
         verbose_name_plural = 'отзывы работников'
@@ -354,6 +444,13 @@ class WorkerReview(models.Model):
         
     def __str__(self):
         return str(self.rate)
+
+    @property
+    def rating_target_id(self):
+        return self.employer_id
+
+    def set_approved(self, is_approved):
+        _set_review_approval(self, is_approved)
     
     @property
     def readable_approved_status(self):
@@ -376,6 +473,8 @@ class EmployerReview(models.Model):
     is_approved = models.BooleanField(default=None, null=True)
     created_at = models.DateTimeField(verbose_name='Дата создания', auto_now_add=True)
 
+    RATING_TARGET = 'worker'
+
     class Meta:
         verbose_name = 'отзыв работодателя'
         verbose_name_plural = 'отзывы работодателей'
@@ -384,6 +483,13 @@ class EmployerReview(models.Model):
     def __str__(self):
         return str(self.rate)
 
+    @property
+    def rating_target_id(self):
+        return self.worker_id
+
+    def set_approved(self, is_approved):
+        _set_review_approval(self, is_approved)
+
     @property
     def readable_approved_status(self):
         if self.is_approved is None:
@@ -0,0 +1,73 @@
+import json
+import logging
+from collections import namedtuple
+
+import redis
+from django.db import transaction
+
+from core import executor
+from core.redis_connections import get_redis, get_async_redis
+from core.models import TGUser, Worker, Employer
+
+
+# Краткий статус пользователя по tg_id: тип пользователя, есть ли профиль, флаги профиля работника и ник профиля.
+# Его читают middleware на каждом апдейте, поэтому он хранится в redis, а не запрашивается из базы.
+# Запись сбрасывается сигналами при сохранении TGUser/Worker/Employer (core/signals.py).
+# is_unreachable - пользователь отмечен недоступным для рассылок (core/unreachable.py),
+# username - ник из профиля, с ним сравнивает UpdateUsernameMiddleware (core/usernames.py)
+ProfileStatus = namedtuple('ProfileStatus', ('target', 'has_profile', 'is_approved', 'is_searching', 'notifications', 'is_unreachable', 'username'), defaults=(False, None))
+EMPTY = ProfileStatus('', False, None, None, None)
+
+STATUS_KEY = 'profile:status:{}'
+STATUS_TTL = 600 # страховка на случай изменений в обход сигналов (queryset.update)
+
+logger = logging.getLogger(__name__)
+
+
+def load(tg_id):
+    """Статус из базы (синхронно)."""
+    target, unreachable_since = TGUser.objects.filter(tg_id=tg_id).values_list('target', 'unreachable_since').first() or (None, None)
+    is_unreachable = unreachable_since is not None
+    if target == '1':
+        row = Worker.objects.filter(tg_id=tg_id).values_list('is_approved', 'is_searching', 'notifications', 'username').first()
+        if row:
+            *flags, username = row
+            return ProfileStatus(target, True, *flags, is_unreachable, username)
+    elif target == '2':
+        row = Employer.objects.filter(tg_id=tg_id).values_list('username').first()
+        if row:
+            return ProfileStatus(target, True, None, None, None, is_unreachable, row[0])
+
+    return EMPTY._replace(target=target or '', is_unreachable=is_unreachable)
+
+
+async def get(tg_id):
+    key = STATUS_KEY.format(tg_id)
+    try:
+        raw = await get_async_redis().get(key)
+    except redis.RedisError:
+        logger.exception('Статус профиля недоступен в redis')
+        return await executor.run(load, tg_id)
+
+    if raw is not None:
+        return ProfileStatus(*json.loads(raw))
+
+    status = await executor.run(load, tg_id)
+    try:
+        await get_async_redis().set(key, json.dumps(status), ex=STATUS_TTL)
+    except redis.RedisError:
+        pass
+
+    return status
+
+
+def _delete(tg_id):
+    try:
+        get_redis().delete(STATUS_KEY.format(tg_id))
+    except redis.RedisError:
+        logger.exception('Не удалось сбросить статус профиля')
+
+
+def invalidate(tg_id):
+    """Сброс статуса после коммита (вызывается из сигналов)."""
+    transaction.on_commit(lambda: _delete(tg_id))
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+
+import redis
+
+from config import TELEGRAM_GLOBAL_RATE, TELEGRAM_CHAT_RATE, TELEGRAM_GROUP_RATE, TELEGRAM_CHAT_BURST
+from core.redis_connections import get_async_redis
+
+
+# Общий ограничитель исходящих сообщений телеграма (token bucket в redis), им пользуются
+# бот (middlewares/rate_limit.py) и задачи celery, поэтому одновременные рассылки делят общие лимиты:
+# глобальный на бота, на личный чат и на группу/канал. Корзины проверяются и списываются атомарно.
+GLOBAL_KEY = 'ratelimit:global'
+CHAT_KEY = 'ratelimit:chat:{}'
+
+# KEYS - корзины, ARGV - число сообщений, затем пары (емкость, мс на токен) для каждой корзины.
+# Число сообщений больше емкости корзины - ошибка (такие отправки acquire списывает частями).
+# Возвращает 0, если токены списаны, иначе сколько мс ждать до повторной попытки.
+_ACQUIRE_SCRIPT = '''
+local now_time = redis.call('TIME')
+local now = now_time[1] * 1000 + now_time[2] / 1000
+local cost = tonumber(ARGV[1])
+local wait = 0
+local tokens = {}
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local interval = tonumber(ARGV[i * 2 + 1])
+    local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+    local available = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now
+    if cost > capacity then
+        return redis.error_reply('cost above bucket capacity')
+    end
+    available = math.min(capacity, available + (now - ts) / interval)
+    tokens[i] = available - cost
+    if available < cost then
+        wait = math.max(wait, math.ceil((cost - available) * interval))
+    end
+end
+if wait > 0 then
+    return wait
+end
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local interval = tonumber(ARGV[i * 2 + 1])
+    redis.call('HSET', key, 'tokens', tokens[i], 'ts', now)
+    redis.call('PEXPIRE', key, math.ceil(capacity * interval) + 1000)
+end
+return 0
+'''
+
+logger = logging.getLogger(__name__)
+
+
+def _interval(rate):
+    # rate - (сообщений, за секунд)
+    count, seconds = rate
+    return seconds * 1000 / count
+
+
+def is_group(chat_id):
+    """Группы и каналы: отрицательный id или @username."""
+    chat_id = str(chat_id)
+    return chat_id.startswith('-') or chat_id.startswith('@')
+
+
+def _buckets(chat_id):
+    keys = [GLOBAL_KEY, CHAT_KEY.format(chat_id)]
+    # глобальная корзина допускает всплеск в пределах секундного лимита, личный чат - несколько
+    # сообщений подряд (ответ обработчика), группа или канал - одно сообщение
+    if is_group(chat_id):
+        chat_capacity, chat_rate = 1, TELEGRAM_GROUP_RATE
+    else:
+        chat_capacity, chat_rate = TELEGRAM_CHAT_BURST, TELEGRAM_CHAT_RATE
+    args = [TELEGRAM_GLOBAL_RATE[0], _interval(TELEGRAM_GLOBAL_RATE), chat_capacity, _interval(chat_rate)]
+    return keys, args
+
+
+def _fallback_delay(cost):
+    # без redis темп держится только внутри процесса - по глобальному лимиту
+    return cost * _interval(TELEGRAM_GLOBAL_RATE) / 1000
+
+
+async def _acquire(keys, args, cost):
+    while True:
+        try:
+            wait = await get_async_redis().eval(_ACQUIRE_SCRIPT, len(keys), *keys, cost, *args)
+        except redis.RedisError:
+            logger.exception('Ограничитель сообщений недоступен')
+            await asyncio.sleep(_fallback_delay(cost))
+            return
+
+        if not wait:
+            return
+
+        await asyncio.sleep(int(wait) / 1000)
+
+
+async def acquire(chat_id, cost=1):
+    """Ждет, пока в корзинах будут токены для cost сообщений в чат chat_id."""
+    keys, args = _buckets(chat_id)
+    # альбом больше емкости корзины (в группу) списывается частями, каждое сообщение оплачивается
+    step = min(args[0::2])
+    while cost > 0:
+        part = min(cost, step)
+        await _acquire(keys, args, part)
+        cost -= part
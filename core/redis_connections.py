@@ -0,0 +1,43 @@
+import redis
+import redis.asyncio
+
+import config
+
+
+# Общие клиенты redis для модулей core (каталог, статусы профилей, ники).
+# Каждый процесс создает их один раз, соединения берутся из пула клиента.
+_redis = None
+_async_redis = None
+
+
+def _connection_kwargs():
+    return {
+        'host': config.REDIS_HOST,
+        'port': config.REDIS_PORT,
+        'db': config.REDIS_DB,
+        'decode_responses': True,
+    }
+
+
+def get_redis():
+    global _redis
+    if _redis is None:
+        _redis = redis.Redis(**_connection_kwargs())
+
+    return _redis
+
+
+def get_async_redis():
+    global _async_redis
+    if _async_redis is None:
+        _async_redis = redis.asyncio.Redis(**_connection_kwargs())
+
+    return _async_redis
+
+
+async def close_async_redis():
+    """Закрывает асинхронный клиент (для кода, запускающего свой event loop, например задач celery)."""
+    global _async_redis
+    if _async_redis is not None:
+        await _async_redis.aclose()
+        _async_redis = None
@@ -0,0 +1,100 @@
+from collections import namedtuple
+
+from django.db.models import Q
+
+from core import executor
+from core.models import Job, WorkerCooperationProposal, EmployerCooperationProposal
+
+
+# Данные для экранов бота одним переходом в поток базы: все запросы экрана выполняются
+# в одной синхронной функции, обработчик получает готовые значения (namedtuple) без ленивых связей.
+JobCard = namedtuple('JobCard', ('id', 'min_salary', 'occupations', 'description', 'employer_name', 'employer_rating'))
+EmployerCard = namedtuple('EmployerCard', ('id', 'name', 'occupations', 'min_salary', 'max_salary', 'rating'))
+ProposalCard = namedtuple('ProposalCard', ('id', 'status', 'created_at', 'updated_at', 'job', 'employer'))
+
+
+def _job_card(job, lang):
+    employer = job.employer
+    return JobCard(
+        job.id,
+        job.min_salary,
+        getattr(job, f'readable_{lang}_occupations'),
+        job.description_rus if lang == 'rus' else job.description,
+        employer.name,
+        getattr(employer, f'rating_{lang}'),
+    )
+
+
+def _employer_card(employer):
+    # сводка по вакансиям работодателя есть только на русском (для работников)
+    return EmployerCard(
+        employer.id,
+        employer.name,
+        employer.readable_occupations,
+        employer.min_min_salary,
+        employer.max_min_salary,
+        employer.rating_rus,
+    )
+
+
+def _proposal_card(proposal, lang, job=None, employer=None):
+    return ProposalCard(
+        proposal.id,
+        getattr(proposal, f'readable_{lang}_accepted_status'),
+        proposal.created_at,
+        proposal.updated_at,
+        job,
+        employer,
+    )
+
+
+def get_job_card(job_id, lang):
+    job = Job.objects.select_related('employer').with_occupations().filter(id=job_id).first()
+    if job is None:
+        return None
+
+    return _job_card(job, lang)
+
+
+def get_worker_proposal_card(proposal_id, lang):
+    """Предложение работника вместе с карточкой вакансии."""
+    proposal = WorkerCooperationProposal.objects.select_related('job', 'job__employer').filter(id=proposal_id).first()
+    if proposal is None or proposal.job is None:
+        return None
+
+    return _proposal_card(proposal, lang, job=_job_card(proposal.job, lang))
+
+
+def get_employer_proposal_card(proposal_id, lang):
+    """Предложение работодателя вместе со сводкой по работодателю."""
+    proposal = EmployerCooperationProposal.objects.select_related('employer').filter(id=proposal_id).first()
+    if proposal is None or proposal.employer is None:
+        return None
+
+    return _proposal_card(proposal, lang, employer=_employer_card(proposal.employer))
+
+
+def get_employer_proposal_jobs(proposal_id, lang):
+    """Название работодателя из предложения и карточки его активных вакансий."""
+    proposal = EmployerCooperationProposal.objects.select_related('employer').filter(id=proposal_id).first()
+    if proposal is None or proposal.employer is None:
+        return None
+
+    jobs = proposal.employer.jobs.filter(Q(is_approved=True) & Q(is_active=True)).select_related('employer').with_occupations().order_by('-min_salary')
+    return proposal.employer.name, [_job_card(job, lang) for job in jobs]
+
+
+async def job_card(job_id, lang):
+    return await executor.run(get_job_card, job_id, lang)
+
+
+async def worker_proposal_card(proposal_id, lang):
+    return await executor.run(get_worker_proposal_card, proposal_id, lang)
+
+
+async def employer_proposal_card(proposal_id, lang):
+    return await executor.run(get_employer_proposal_card, proposal_id, lang)
+
+
+async def employer_proposal_jobs(proposal_id, lang):
+    return await executor.run(get_employer_proposal_jobs, proposal_id, lang)
@@ -0,0 +1,85 @@
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from core import catalog, matching, profile_status
+from core.models import (Text, Button, Occupation, Job, Worker, Employer, TGUser, WorkerReview, EmployerReview,
+                         remember_review_rating, update_review_rating, remove_review_rating)
+
+
+@receiver(post_save, sender=Text)
+@receiver(post_delete, sender=Text)
+@receiver(post_save, sender=Button)
+@receiver(post_delete, sender=Button)
+@receiver(post_save, sender=Occupation)
+@receiver(post_delete, sender=Occupation)
+def invalidate_catalog(sender, **kwargs):
+    catalog.on_change()
+
+
+@receiver(post_delete, sender=Occupation)
+def reset_matching(sender, **kwargs):
+    matching.reset()
+
+
+@receiver(post_save, sender=Job)
+def update_matching_job(sender, instance, **kwargs):
+    matching.job_changed(instance.id)
+
+
+@receiver(post_delete, sender=Job)
+def delete_matching_job(sender, instance, **kwargs):
+    matching.job_deleted(instance.id)
+
+
+@receiver(post_save, sender=Worker)
+def update_matching_worker(sender, instance, **kwargs):
+    matching.worker_changed(instance.id)
+
+
+@receiver(post_delete, sender=Worker)
+def delete_matching_worker(sender, instance, **kwargs):
+    matching.worker_deleted(instance.id)
+
+
+@receiver(m2m_changed, sender=Job.occupations.through)
+@receiver(m2m_changed, sender=Worker.occupations.through)
+def update_matching_occupations(sender, instance, action, reverse, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    # изменение со стороны профессии затрагивает сразу много записей
+    if reverse:
+        matching.reset()
+    elif isinstance(instance, Job):
+        matching.job_changed(instance.id)
+    else:
+        matching.worker_changed(instance.id)
+
+
+@receiver(post_save, sender=TGUser)
+@receiver(post_delete, sender=TGUser)
+@receiver(post_save, sender=Worker)
+@receiver(post_delete, sender=Worker)
+@receiver(post_save, sender=Employer)
+@receiver(post_delete, sender=Employer)
+def invalidate_profile_status(sender, instance, **kwargs):
+    profile_status.invalidate(instance.tg_id)
+
+
+# рейтинг при изменении отзыва в обход set_approved (админка: статус, оценка, удаление)
+@receiver(pre_save, sender=WorkerReview)
+@receiver(pre_save, sender=EmployerReview)
+def remember_rating(sender, instance, update_fields=None, **kwargs):
+    remember_review_rating(instance, update_fields)
+
+
+@receiver(post_save, sender=WorkerReview)
+@receiver(post_save, sender=EmployerReview)
+def update_rating(sender, instance, update_fields=None, **kwargs):
+    update_review_rating(instance, update_fields)
+
+
+@receiver(post_delete, sender=WorkerReview)
+@receiver(post_delete, sender=EmployerReview)
+def remove_rating(sender, instance, **kwargs):
+    remove_review_rating(instance)
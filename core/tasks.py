@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from core import usernames
+
+
+@shared_task
+def flush_usernames():
+    usernames.flush()
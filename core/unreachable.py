@@ -0,0 +1,47 @@
+from django.utils import timezone
+
+from core import profile_status
+from core.models import TGUser
+
+
+# Пользователи, которым не доставить сообщение (заблокировали бота, удалили аккаунт).
+# Отмечаются по ошибкам отправки (middlewares/rate_limit.py, notifications/sender.py),
+# пропускаются рассылками и снова становятся доступными, как только пишут боту (UserContextMiddleware).
+UNREACHABLE_ERRORS = (
+    'bot was blocked by the user',
+    'user is deactivated',
+    'chat not found',
+    "bot can't initiate conversation",
+)
+
+
+def is_unreachable_error(error_code, description):
+    """Ошибка отправки, после которой писать пользователю бесполезно."""
+    if error_code == 403:
+        return True
+
+    description = (description or '').lower()
+    return error_code == 400 and any(error in description for error in UNREACHABLE_ERRORS)
+
+
+def mark(tg_ids):
+    """Отмечает пользователей недоступными (синхронно)."""
+    tg_ids = [str(tg_id) for tg_id in tg_ids]
+    if not tg_ids:
+        return
+
+    TGUser.objects.filter(tg_id__in=tg_ids, unreachable_since__isnull=True).update(unreachable_since=timezone.now())
+    for tg_id in tg_ids:
+        profile_status.invalidate(tg_id)
+
+
+def reactivate(tg_id):
+    """Снимает отметку, когда пользователь снова пишет боту (синхронно)."""
+    if TGUser.objects.filter(tg_id=tg_id, unreachable_since__isnull=False).update(unreachable_since=None):
+        profile_status.invalidate(tg_id)
+
+
+def reachable(queryset, field='tg_id'):
+    """Исключает из queryset получателей недоступных пользователей (по полю с tg_id)."""
+    unreachable_ids = TGUser.objects.filter(unreachable_since__isnull=False).values('tg_id')
+    return queryset.exclude(**{f'{field}__in': unreachable_ids})
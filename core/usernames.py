@@ -0,0 +1,81 @@
+import logging
+
+import redis
+from asgiref.sync import sync_to_async
+from django.db import transaction
+
+from core import profile_status
+from core.redis_connections import get_redis, get_async_redis
+from core.models import Worker, Employer
+
+
+# Ники пользователей меняются редко, а проверяются почти на каждом апдейте (UpdateUsernameMiddleware).
+# Изменения копятся в redis (hash tg_id -> ник на каждый тип профиля) и раз в минуту
+# записываются в базу одним bulk_update задачей core.tasks.flush_usernames. Текущий ник профиля
+# берется из статуса пользователя (core/profile_status.py), строка профиля на апдейт не читается.
+PENDING_KEY = 'usernames:pending:{}'
+MODELS = (Worker, Employer)
+
+# KEYS[1] - буфер ников, ARGV - пары tg_id, ник: поле удаляется, только если ник в нем не изменился
+_DELETE_WRITTEN_SCRIPT = '''
+for i = 1, #ARGV, 2 do
+    if redis.call('HGET', KEYS[1], ARGV[i]) == ARGV[i + 1] then
+        redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+end
+return 0
+'''
+
+logger = logging.getLogger(__name__)
+
+
+def _key(model):
+    return PENDING_KEY.format(model._meta.model_name)
+
+
+def _save(model, tg_id, username):
+    model.objects.filter(tg_id=tg_id).update(username=username)
+    profile_status.invalidate(tg_id)
+
+
+async def record(model, tg_id, username):
+    """Запоминает новый ник профиля (Worker или Employer) до следующей записи в базу."""
+    try:
+        await get_async_redis().hset(_key(model), tg_id, username)
+    except redis.RedisError:
+        logger.exception('Не удалось отложить запись ника, сохраняем сразу')
+        await sync_to_async(_save)(model, tg_id, username)
+
+
+async def current(profile):
+    """Актуальный ник профиля с учетом еще не записанных в базу изменений."""
+    try:
+        username = await get_async_redis().hget(_key(type(profile)), profile.tg_id)
+    except redis.RedisError:
+        username = None
+
+    return username or profile.username
+
+
+def flush():
+    """Запись накопленных ников в базу (синхронно)."""
+    connection = get_redis()
+    for model in MODELS:
+        key = PENDING_KEY.format(model._meta.model_name)
+
+        pending = connection.hgetall(key)
+        if not pending:
+            continue
+
+        with transaction.atomic():
+            profiles = list(model.objects.filter(tg_id__in=pending.keys()).only('id', 'tg_id', 'username'))
+            for profile in profiles:
+                profile.username = pending[profile.tg_id]
+            model.objects.bulk_update(profiles, ['username'], batch_size=500)
+            # bulk_update не вызывает сигналы, статус с прежним ником сбрасываем сами
+            for profile in profiles:
+                profile_status.invalidate(profile.tg_id)
+
+        # из буфера убираются только записанные ники; при ошибке записи буфер остается целым,
+        # ник, измененный во время записи, дождется следующего раза
+        connection.eval(_DELETE_WRITTEN_SCRIPT, 1, key, *[item for pair in pending.items() for item in pair])
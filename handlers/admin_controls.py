@@ -1,6 +1,5 @@
 import os
 
-import asyncio
 import django
 from aiogram import Router, F
 from aiogram.types import CallbackQuery
@@ -10,15 +9,12 @@ from aiogram.utils.keyboard import InlineKeyboardBuilder
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'work_exchange.settings')
 django.setup()
 
-from core.models import Worker, Text, Job, WorkerReview, EmployerReview
+from core.models import Worker, Job, WorkerReview, EmployerReview
+from core import catalog
 from keyboards.callbacks import AdminControlsCallBackFactory
 from keyboards import keyboards
 from utils import translate_to_heb, translate_to_rus, escape_markdown
-from notifications_center import (new_worker_to_employers_channels, 
-                                  new_jobs_to_workers_channels, 
-                                  new_job_to_workers,
-                                  new_worker_to_employers,
-                                  )
+from notifications_center import new_worker_broadcast, new_job_broadcast
 
 router = Router()
 
@@ -28,27 +24,31 @@ async def admin_worker_controls(callback: CallbackQuery, callback_data: AdminCon
     worker_id = callback_data.object_id
     worker = await sync_to_async(Worker.objects.filter(id=worker_id).first)()
     if worker:
+        broadcast = False
         if callback_data.action == 'accept':
             worker.is_approved = True
             admin_reply_text = 'Резюме одобрено. Инициализирована рассылка по работодателям и каналам.'
             keyboard = await keyboards.worker_to_main_menu_keyboard()
-            reply_text = await sync_to_async(Text.objects.get)(slug='worker_cv_approved')
+            reply_text = await catalog.text('worker_cv_approved')
 
             about_heb = await translate_to_heb(worker.about)
             if about_heb:
                 about_heb = await escape_markdown(about_heb)
                 worker.about_heb = about_heb
-                asyncio.create_task(new_worker_to_employers_channels(callback.bot, worker, about_heb))
-                asyncio.create_task(new_worker_to_employers(callback.bot, worker, about_heb))
+                broadcast = True
             
         elif callback_data.action == 'decline':
             admin_reply_text = 'Резюме отклонено, пользователь уведомлен о необходимости заполнить заново.'
             worker.is_approved = False
             keyboard = await keyboards.worker_change_cv_keyboard()
-            reply_text = await sync_to_async(Text.objects.get)(slug='worker_cv_declined')
+            reply_text = await catalog.text('worker_cv_declined')
         
         await sync_to_async(worker.save)()
 
+        # рассылка ставится в очередь после сохранения: получатели и текст берутся из базы
+        if broadcast:
+            await new_worker_broadcast(callback.bot, worker.id)
+
         try:
             await callback.bot.send_message(
                 chat_id=worker.tg_id,
@@ -74,19 +74,20 @@ async def admin_job_controls(callback: CallbackQuery, callback_data: AdminContro
         if callback_data.action == 'accept':
             job.is_approved = True
             admin_reply_text = 'Вакансия одобрена. Инициализирована рассылка по работникам и каналам.'
-            reply_text = await sync_to_async(Text.objects.get)(slug='job_approved')
+            reply_text = await catalog.text('job_approved')
             keyboard = await keyboards.employer_job_detail_redirect('jobs-active', job_id)
-            asyncio.create_task(new_jobs_to_workers_channels(callback.bot, job))
-            asyncio.create_task(new_job_to_workers(callback.bot, job))
 
         elif callback_data.action == 'decline':
             admin_reply_text = 'Вакансия отклонена, работодатель уведомлен.'
             job.is_approved = False
             keyboard = await keyboards.employer_job_detail_redirect('jobs-declined', job_id)
-            reply_text = await sync_to_async(Text.objects.get)(slug='job_declined')
+            reply_text = await catalog.text('job_declined')
         
         await sync_to_async(job.save)()
 
+        if job.is_approved:
+            await new_job_broadcast(callback.bot, job.id)
+
         try:
             await callback.bot.send_message(
                 chat_id=employer.tg_id,
@@ -109,19 +110,17 @@ async def admin_review_controls(callback: CallbackQuery, callback_data: AdminCon
     review = await sync_to_async(EmployerReview.objects.filter(id=review_id).first)()
     if review:
         if callback_data.action == 'accept':
-            review.is_approved = True
+            await sync_to_async(review.set_approved)(True)
             admin_reply_text = 'Отзыв одобрен.'
-            reply_employer_text = await sync_to_async(Text.objects.get)(slug='review_accepted')
-            reply_worker_text = await sync_to_async(Text.objects.get)(slug='review_new')
+            reply_employer_text = await catalog.text('review_accepted')
+            reply_worker_text = await catalog.text('review_new')
 
             
         elif callback_data.action == 'decline':
-            review.is_approved = False
+            await sync_to_async(review.set_approved)(False)
             admin_reply_text = 'Отзыв отклонен.'
-            reply_employer_text = await sync_to_async(Text.objects.get)(slug='review_declined')
+            reply_employer_text = await catalog.text('review_declined')
             reply_worker_text = ''
-        
-        await sync_to_async(review.save)()
 
         try:
             await callback.message.edit_reply_markup(reply_markup=InlineKeyboardBuilder().as_markup())
@@ -157,21 +156,19 @@ async def admin_worker_review_controls(callback: CallbackQuery, callback_data: A
     review = await sync_to_async(WorkerReview.objects.filter(id=review_id).first)()
     if review:
         if callback_data.action == 'accept':
-            review.is_approved = True
+            await sync_to_async(review.set_approved)(True)
             admin_reply_text = 'Отзыв одобрен.'
-            reply_worker_text = await sync_to_async(Text.objects.get)(slug='review_accepted')
-            reply_employer_text = await sync_to_async(Text.objects.get)(slug='review_new')
+            reply_worker_text = await catalog.text('review_accepted')
+            reply_employer_text = await catalog.text('review_new')
             review_heb = await translate_to_heb(review.review)
             review.review_heb = review_heb
-            await sync_to_async(review.save)()
+            await sync_to_async(review.save)(update_fields=['review_heb'])
             
         elif callback_data.action == 'decline':
-            review.is_approved = False
+            await sync_to_async(review.set_approved)(False)
             admin_reply_text = 'Отзыв отклонен.'
-            reply_worker_text = await sync_to_async(Text.objects.get)(slug='review_declined')
+            reply_worker_text = await catalog.text('review_declined')
             reply_employer_text = ''
-        
-        await sync_to_async(review.save)()
 
         try:
             await callback.message.edit_reply_markup(reply_markup=InlineKeyboardBuilder().as_markup())
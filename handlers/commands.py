@@ -4,14 +4,13 @@ import django
 from aiogram import Router, F
 from aiogram.filters import CommandStart, Command
 from aiogram.types import Message
-from asgiref.sync import sync_to_async
 from aiogram.fsm.context import FSMContext
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'work_exchange.settings')
 django.setup()
 
 from middlewares.change_username import UpdateUsernameMiddleware
-from core.models import TGUser, Worker, Employer, Text
+from core import catalog
 from keyboards import keyboards
 from filters import ChatTypeFilter
 
@@ -21,15 +20,12 @@ router.message.middleware(UpdateUsernameMiddleware())
 
 
 @router.message(ChatTypeFilter(chat_type='private'), CommandStart())
-async def process_start_command(message: Message, state: FSMContext):
+async def process_start_command(message: Message, state: FSMContext, profile_status=None):
     await state.clear()
-    user_id = message.from_user.id
-    user = await sync_to_async(TGUser.objects.filter(tg_id=user_id).first)()
-    if user:
-        if user.target == '1':
-            worker = await sync_to_async(Worker.objects.filter(tg_id=user_id).first)()
-            if worker:
-                choose_menu_section = await sync_to_async(Text.objects.get)(slug='choose_menu_section')
+    if profile_status and profile_status.target:
+        if profile_status.target == '1':
+            if profile_status.has_profile:
+                choose_menu_section = await catalog.text('choose_menu_section')
 
                 try:
                     await message.answer(
@@ -41,10 +37,9 @@ async def process_start_command(message: Message, state: FSMContext):
 
                 return True
 
-        elif user.target == '2':
-            employer = await sync_to_async(Employer.objects.filter(tg_id=user_id).first)()
-            if employer:
-                choose_menu_section = await sync_to_async(Text.objects.get)(slug='choose_menu_section')
+        elif profile_status.target == '2':
+            if profile_status.has_profile:
+                choose_menu_section = await catalog.text('choose_menu_section')
 
                 try:
                     await message.answer(
@@ -56,7 +51,7 @@ async def process_start_command(message: Message, state: FSMContext):
 
                 return True
 
-    choose_option_text = await sync_to_async(Text.objects.get)(slug='choose_option')
+    choose_option_text = await catalog.text('choose_option')
     reply_text=f'{choose_option_text.rus}\n\u202B{choose_option_text.heb}\u202C'
     try:
         await message.answer(
@@ -68,13 +63,12 @@ async def process_start_command(message: Message, state: FSMContext):
 
 
 @router.message(F.text, ChatTypeFilter(chat_type='private'), Command('cancel'))
-async def process_cancel_command(message: Message, state: FSMContext):
+async def process_cancel_command(message: Message, state: FSMContext, profile_status=None):
     await state.clear()
 
-    user = await sync_to_async(TGUser.objects.filter(tg_id=message.from_user.id).first)()
-    if user:
-        if user.target == '2':
-            reply_text = await sync_to_async(Text.objects.get)(slug='input_cancel')
+    if profile_status and profile_status.target:
+        if profile_status.target == '2':
+            reply_text = await catalog.text('input_cancel')
             try:
                 await message.reply(
                     text=f'\u202B{reply_text.heb}'
@@ -83,7 +77,7 @@ async def process_cancel_command(message: Message, state: FSMContext):
                 pass
             return True
     
-    reply_text = await sync_to_async(Text.objects.get)(slug='input_cancel')
+    reply_text = await catalog.text('input_cancel')
     try:
         await message.reply(text=reply_text.rus)
     except:
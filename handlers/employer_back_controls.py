@@ -3,7 +3,6 @@ import os
 import django
 from aiogram import Router, F
 from aiogram.types import CallbackQuery
-from asgiref.sync import sync_to_async
 from aiogram.fsm.context import FSMContext
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'work_exchange.settings')
@@ -11,7 +10,7 @@ django.setup()
 
 from states.pages_navigation import PageNavigation
 from middlewares.change_username import UpdateUsernameMiddleware
-from core.models import Text
+from core import catalog
 from keyboards.callbacks import EmployerBackCallBackFactory
 from keyboards import keyboards
 
@@ -24,7 +23,7 @@ router.callback_query.middleware(UpdateUsernameMiddleware())
 async def handle_search_controls(callback: CallbackQuery, callback_data: EmployerBackCallBackFactory, state=FSMContext):
     await state.clear()
 
-    choose_menu_section = await sync_to_async(Text.objects.get)(slug='choose_menu_section')
+    choose_menu_section = await catalog.text('choose_menu_section')
 
     try:
         await callback.message.edit_text(
@@ -35,19 +34,19 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: Employe
         pass
 
 
-@router.callback_query(EmployerBackCallBackFactory.filter(F.destination == 'jobs-list'), PageNavigation.page_navigation)
-async def back_jobs_list(callback: CallbackQuery, callback_data: EmployerBackCallBackFactory, state=FSMContext):
+@router.callback_query(EmployerBackCallBackFactory.filter(F.destination == 'jobs-list'), PageNavigation.page_navigation, flags={'profile': True})
+async def back_jobs_list(callback: CallbackQuery, callback_data: EmployerBackCallBackFactory, state=FSMContext, employer=None):
     state_data = await state.get_data()
     page = state_data.get('page')
     destination = state_data.get('destination')
 
     if page and destination:
         if destination == 'jobs-active':
-            reply_text = await sync_to_async(Text.objects.get)(slug='jobs_active')
+            reply_text = await catalog.text('jobs_active')
         elif destination == 'jobs-archive':
-            reply_text = await sync_to_async(Text.objects.get)(slug='jobs_archive')
+            reply_text = await catalog.text('jobs_archive')
         elif destination == 'jobs-declined':
-            reply_text = await sync_to_async(Text.objects.get)(slug='jobs_declined')
+            reply_text = await catalog.text('jobs_declined')
 
         try:
             await callback.message.edit_text(
@@ -55,7 +54,7 @@ async def back_jobs_list(callback: CallbackQuery, callback_data: EmployerBackCal
                 reply_markup=await keyboards.employer_jobs_list_keyboard(
                     page, 
                     destination, 
-                    callback.from_user.id),
+                    employer),
             )
         except:
             pass
@@ -63,7 +62,7 @@ async def back_jobs_list(callback: CallbackQuery, callback_data: EmployerBackCal
     else:
         await state.clear()
 
-        choose_jobs_type = await sync_to_async(Text.objects.get)(slug='choose_jobs_type')
+        choose_jobs_type = await catalog.text('choose_jobs_type')
 
         try:
             await callback.message.edit_text(
@@ -78,7 +77,7 @@ async def back_jobs_list(callback: CallbackQuery, callback_data: EmployerBackCal
 async def back_jobs_section(callback: CallbackQuery, callback_data: EmployerBackCallBackFactory, state=FSMContext):
     await state.clear()
 
-    choose_jobs_type = await sync_to_async(Text.objects.get)(slug='choose_jobs_type')
+    choose_jobs_type = await catalog.text('choose_jobs_type')
 
     try:
         await callback.message.edit_text(
@@ -89,17 +88,18 @@ async def back_jobs_section(callback: CallbackQuery, callback_data: EmployerBack
         pass
 
 
-@router.callback_query(EmployerBackCallBackFactory.filter(F.destination == 'workers-list'), PageNavigation.page_navigation)
-async def back_workers_list(callback: CallbackQuery, callback_data: EmployerBackCallBackFactory, state=FSMContext):
+@router.callback_query(EmployerBackCallBackFactory.filter(F.destination == 'workers-list'), PageNavigation.page_navigation, flags={'profile': True})
+async def back_workers_list(callback: CallbackQuery, callback_data: EmployerBackCallBackFactory, state=FSMContext, employer=None):
     state_data = await state.get_data()
     page = state_data.get('page')
     destination = state_data.get('destination')
+    cursor = state_data.get('cursor', '')
 
     if page and destination:
         if destination == 'workers-all':
-            reply_text = await sync_to_async(Text.objects.get)(slug='workers_all')
+            reply_text = await catalog.text('workers_all')
         elif destination == 'workers-suitable':
-            reply_text = await sync_to_async(Text.objects.get)(slug='workers_suitable')
+            reply_text = await catalog.text('workers_suitable')
 
         try:
             await callback.message.edit_text(
@@ -107,7 +107,8 @@ async def back_workers_list(callback: CallbackQuery, callback_data: EmployerBack
                 reply_markup=await keyboards.employer_workers_list_keyboard(
                     page, 
                     destination, 
-                    callback.from_user.id),
+                    employer,
+                    cursor),
             )
         except:
             pass
@@ -115,7 +116,7 @@ async def back_workers_list(callback: CallbackQuery, callback_data: EmployerBack
     else:
         await state.clear()
 
-        choose_workers_type = await sync_to_async(Text.objects.get)(slug='choose_workers_type')
+        choose_workers_type = await catalog.text('choose_workers_type')
 
         try:
             await callback.message.edit_text(
@@ -130,7 +131,7 @@ async def back_workers_list(callback: CallbackQuery, callback_data: EmployerBack
 async def back_jobs_section(callback: CallbackQuery, callback_data: EmployerBackCallBackFactory, state=FSMContext):
     await state.clear()
 
-    choose_workers_type = await sync_to_async(Text.objects.get)(slug='choose_workers_type')
+    choose_workers_type = await catalog.text('choose_workers_type')
 
     try:
         await callback.message.edit_text(
@@ -141,17 +142,17 @@ async def back_jobs_section(callback: CallbackQuery, callback_data: EmployerBack
         pass
 
 
-@router.callback_query(EmployerBackCallBackFactory.filter(F.destination == 'proposals-list'), PageNavigation.page_navigation)
-async def back_proposals_list(callback: CallbackQuery, callback_data: EmployerBackCallBackFactory, state=FSMContext):
+@router.callback_query(EmployerBackCallBackFactory.filter(F.destination == 'proposals-list'), PageNavigation.page_navigation, flags={'profile': True})
+async def back_proposals_list(callback: CallbackQuery, callback_data: EmployerBackCallBackFactory, state=FSMContext, employer=None):
     state_data = await state.get_data()
     page = state_data.get('page')
     destination = state_data.get('destination')
 
     if page and destination:
         if destination == 'outbox-proposals':
-            reply_text = await sync_to_async(Text.objects.get)(slug='outbox_proposals')
+            reply_text = await catalog.text('outbox_proposals')
         elif destination == 'inbox-proposals':
-            reply_text = await sync_to_async(Text.objects.get)(slug='inbox_proposals')
+            reply_text = await catalog.text('inbox_proposals')
 
         try:
             await callback.message.edit_text(
@@ -159,7 +160,7 @@ async def back_proposals_list(callback: CallbackQuery, callback_data: EmployerBa
                 reply_markup=await keyboards.employer_proposals_list_keyboard(
                     page, 
                     destination, 
-                    callback.from_user.id),
+                    employer),
             )
         except:
             pass
@@ -167,7 +168,7 @@ async def back_proposals_list(callback: CallbackQuery, callback_data: EmployerBa
     else:
         await state.clear()
 
-        choose_proposals_type = await sync_to_async(Text.objects.get)(slug='choose_proposals_type')
+        choose_proposals_type = await catalog.text('choose_proposals_type')
 
         try:
             await callback.message.edit_text(
@@ -182,7 +183,7 @@ async def back_proposals_list(callback: CallbackQuery, callback_data: EmployerBa
 async def back_proposals_section(callback: CallbackQuery, callback_data: EmployerBackCallBackFactory, state=FSMContext):
     await state.clear()
 
-    choose_proposals_type = await sync_to_async(Text.objects.get)(slug='choose_proposals_type')
+    choose_proposals_type = await catalog.text('choose_proposals_type')
 
     try:
         await callback.message.edit_text(
@@ -193,17 +194,17 @@ async def back_proposals_section(callback: CallbackQuery, callback_data: Employe
         pass
 
 
-@router.callback_query(EmployerBackCallBackFactory.filter(F.destination == 'reviews-list'), PageNavigation.page_navigation)
-async def back_reviews_list(callback: CallbackQuery, callback_data: EmployerBackCallBackFactory, state=FSMContext):
+@router.callback_query(EmployerBackCallBackFactory.filter(F.destination == 'reviews-list'), PageNavigation.page_navigation, flags={'profile': True})
+async def back_reviews_list(callback: CallbackQuery, callback_data: EmployerBackCallBackFactory, state=FSMContext, employer=None):
     state_data = await state.get_data()
     page = state_data.get('page')
     destination = state_data.get('destination')
 
     if page and destination:
         if destination == 'outbox-reviews':
-            reply_text = await sync_to_async(Text.objects.get)(slug='outbox_reviews')
+            reply_text = await catalog.text('outbox_reviews')
         elif destination == 'inbox-reviews':
-            reply_text = await sync_to_async(Text.objects.get)(slug='inbox_reviews')
+            reply_text = await catalog.text('inbox_reviews')
 
         try:
             await callback.message.edit_text(
@@ -211,7 +212,7 @@ async def back_reviews_list(callback: CallbackQuery, callback_data: EmployerBack
                 reply_markup=await keyboards.employer_reviews_list_keyboard(
                     page, 
                     destination, 
-                    callback.from_user.id),
+                    employer),
             )
         except:
             pass
@@ -219,7 +220,7 @@ async def back_reviews_list(callback: CallbackQuery, callback_data: EmployerBack
     else:
         await state.clear()
 
-        choose_reviews_type = await sync_to_async(Text.objects.get)(slug='choose_reviews_type')
+        choose_reviews_type = await catalog.text('choose_reviews_type')
 
         try:
             await callback.message.edit_text(
@@ -234,7 +235,7 @@ async def back_reviews_list(callback: CallbackQuery, callback_data: EmployerBack
 async def back_reviews_section(callback: CallbackQuery, callback_data: EmployerBackCallBackFactory, state=FSMContext):
     await state.clear()
 
-    choose_reviews_type = await sync_to_async(Text.objects.get)(slug='choose_reviews_type')
+    choose_reviews_type = await catalog.text('choose_reviews_type')
 
     try:
         await callback.message.edit_text(
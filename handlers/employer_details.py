@@ -14,10 +14,31 @@ from config import MAX_SYMBOLS
 from middlewares.change_username import UpdateUsernameMiddleware
 from states.pages_navigation import PageNavigation
 from core.models import Text, Job, Worker, EmployerCooperationProposal, WorkerCooperationProposal, WorkerReview, EmployerReview
+from core import catalog
 from keyboards.callbacks import EmployerDetailsCallBackFactory, EmployerRedirectDetailsCallBackFactory
 from keyboards import keyboards
 
 
+JOB_TEXTS = Text.objects.require(
+    'job_approved_text', 'is_job_active', 'notifications', 'min_salary', 'salary_hourly',
+    'occupations', 'description',
+)
+WORKER_TEXTS = Text.objects.require('occupations', 'min_salary', 'about', 'salary_hourly', 'rating_worker')
+PROPOSAL_TEXTS = Text.objects.require('status', 'created_at', 'updated_at')
+OUTBOX_PROPOSAL_TEXTS = Text.objects.require(
+    'worker', 'outbox_proposal', 'occupations', 'min_salary', 'about', 'salary_hourly', 'status',
+    'created_at', 'updated_at',
+)
+INBOX_PROPOSAL_TEXTS = Text.objects.require(
+    'worker', 'job', 'inbox_proposal', 'occupations', 'min_salary', 'about', 'salary_hourly',
+    'rating_worker', 'job_approved_text', 'is_job_active', 'notifications', 'description',
+    'status', 'created_at', 'updated_at',
+)
+INBOX_REVIEW_TEXTS = Text.objects.require('inbox_review', 'rate', 'review', 'created_at')
+OUTBOX_REVIEW_TEXTS = Text.objects.require('outbox_review', 'status', 'rate', 'review', 'created_at')
+REVIEWS_TEXTS = Text.objects.require('rate', 'review', 'created_at')
+
+
 router = Router()
 router.callback_query.middleware(UpdateUsernameMiddleware())
 
@@ -32,22 +53,15 @@ async def view_detailed_job(callback: CallbackQuery, callback_data: EmployerDeta
         readable_notifications_status = await sync_to_async(lambda: job.readable_notifications_heb_status)()
         readable_occupations = await sync_to_async(lambda: job.readable_heb_occupations)()
 
-        job_approved_text = await sync_to_async(Text.objects.get)(slug='job_approved_text')
-        job_active_text = await sync_to_async(Text.objects.get)(slug='is_job_active')
-        notifications_text = await sync_to_async(Text.objects.get)(slug='notifications')
+        texts = await Text.objects.aresolve(*JOB_TEXTS, lang='heb')
         
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        salary_hourly_text = await sync_to_async(Text.objects.get)(slug='salary_hourly')
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        description_text = await sync_to_async(Text.objects.get)(slug='description')
-
-        reply_text = f'''\u202B*{job_approved_text.heb}* {readable_approve_status}\
-                      \n*{job_active_text.heb}* {readable_active_status}\
-                      \n*{notifications_text.heb}* {readable_notifications_status}\
+        reply_text = f'''\u202B*{texts.job_approved_text}* {readable_approve_status}\
+                      \n*{texts.is_job_active}* {readable_active_status}\
+                      \n*{texts.notifications}* {readable_notifications_status}\
                       \n\
-                      \n*{occupations_text.heb}* {readable_occupations}\
-                      \n*{min_salary_text.heb}* {job.min_salary} {salary_hourly_text.heb}\
-                      \n*{description_text.heb}* {job.description}'''
+                      \n*{texts.occupations}* {readable_occupations}\
+                      \n*{texts.min_salary}* {job.min_salary} {texts.salary_hourly}\
+                      \n*{texts.description}* {job.description}'''
 
         try:
             await callback.message.edit_text(
@@ -73,22 +87,15 @@ async def view_detailed_job_redirect(callback: CallbackQuery, callback_data: Emp
         readable_notifications_status = await sync_to_async(lambda: job.readable_notifications_heb_status)()
         readable_occupations = await sync_to_async(lambda: job.readable_heb_occupations)()
 
-        job_approved_text = await sync_to_async(Text.objects.get)(slug='job_approved_text')
-        job_active_text = await sync_to_async(Text.objects.get)(slug='is_job_active')
-        notifications_text = await sync_to_async(Text.objects.get)(slug='notifications')
+        texts = await Text.objects.aresolve(*JOB_TEXTS, lang='heb')
         
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        salary_hourly_text = await sync_to_async(Text.objects.get)(slug='salary_hourly')
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        description_text = await sync_to_async(Text.objects.get)(slug='description')
-
-        reply_text = f'''\u202B*{job_approved_text.heb}* {readable_approve_status}\
-                      \n*{job_active_text.heb}* {readable_active_status}\
-                      \n*{notifications_text.heb}* {readable_notifications_status}\
+        reply_text = f'''\u202B*{texts.job_approved_text}* {readable_approve_status}\
+                      \n*{texts.is_job_active}* {readable_active_status}\
+                      \n*{texts.notifications}* {readable_notifications_status}\
                       \n\
-                      \n*{occupations_text.heb}* {readable_occupations}\
-                      \n*{min_salary_text.heb}* {job.min_salary} {salary_hourly_text.heb}\
-                      \n*{description_text.heb}* {job.description}'''
+                      \n*{texts.occupations}* {readable_occupations}\
+                      \n*{texts.min_salary}* {job.min_salary} {texts.salary_hourly}\
+                      \n*{texts.description}* {job.description}'''
 
         try:
             await callback.message.edit_text(
@@ -100,19 +107,15 @@ async def view_detailed_job_redirect(callback: CallbackQuery, callback_data: Emp
             pass
 
 
-@router.callback_query(EmployerDetailsCallBackFactory.filter(F.object_name == 'worker'))
-async def view_detailed_worker(callback: CallbackQuery, callback_data: EmployerDetailsCallBackFactory, state=FSMContext):
+@router.callback_query(EmployerDetailsCallBackFactory.filter(F.object_name == 'worker'), flags={'profile': True})
+async def view_detailed_worker(callback: CallbackQuery, callback_data: EmployerDetailsCallBackFactory, state=FSMContext, employer=None):
     worker_id = callback_data.object_id
     worker = await sync_to_async(Worker.objects.filter(id=worker_id).first)()
     if worker:
         readable_occupations = await sync_to_async(lambda: worker.readable_heb_occupations)()
 
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        about_text = await sync_to_async(Text.objects.get)(slug='about')
-        salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
+        texts = await Text.objects.aresolve(*WORKER_TEXTS, lang='heb')
         objects_photos = await sync_to_async(lambda: list(worker.objects_photos.all()))()
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating_worker')
 
         rating = await sync_to_async(lambda: worker.rating_heb)()
 
@@ -120,10 +123,10 @@ async def view_detailed_worker(callback: CallbackQuery, callback_data: EmployerD
         for object_photo in objects_photos:
             input_media_photos.append(InputMediaPhoto(media=object_photo.photo_id))
         
-        reply_text = f'''\u202B*{occupations_text.heb}* {readable_occupations}\
-                \n*{rating_text.heb}* {rating}\
-                \n*{min_salary_text.heb}* {worker.min_salary} {salary_hourly.heb}\
-                \n*{about_text.heb}* {worker.about_heb}'''
+        reply_text = f'''\u202B*{texts.occupations}* {readable_occupations}\
+                \n*{texts.rating_worker}* {rating}\
+                \n*{texts.min_salary}* {worker.min_salary} {texts.salary_hourly}\
+                \n*{texts.about}* {worker.about_heb}'''
 
         if input_media_photos:
             try:
@@ -133,7 +136,7 @@ async def view_detailed_worker(callback: CallbackQuery, callback_data: EmployerD
 
                 await callback.message.answer(
                     text=reply_text,
-                    reply_markup=await keyboards.employer_worker_details_keyboard(worker.id, callback.from_user.id),
+                    reply_markup=await keyboards.employer_worker_details_keyboard(worker.id, employer),
                     parse_mode='Markdown',
                 )
                 await callback.message.delete()
@@ -143,15 +146,15 @@ async def view_detailed_worker(callback: CallbackQuery, callback_data: EmployerD
             try:
                 await callback.message.edit_text(
                     text=reply_text,
-                    reply_markup=await keyboards.employer_worker_details_keyboard(worker.id, callback.from_user.id),
+                    reply_markup=await keyboards.employer_worker_details_keyboard(worker.id, employer),
                     parse_mode='Markdown',
                 )
             except:
                 pass
 
 
-@router.callback_query(EmployerRedirectDetailsCallBackFactory.filter(F.object_name == 'worker'))
-async def view_detailed_worker_redirect(callback: CallbackQuery, callback_data: EmployerRedirectDetailsCallBackFactory, state=FSMContext):
+@router.callback_query(EmployerRedirectDetailsCallBackFactory.filter(F.object_name == 'worker'), flags={'profile': True})
+async def view_detailed_worker_redirect(callback: CallbackQuery, callback_data: EmployerRedirectDetailsCallBackFactory, state=FSMContext, employer=None):
     worker_id = callback_data.object_id
     worker = await sync_to_async(Worker.objects.filter(id=worker_id).first)()
     if worker:
@@ -161,12 +164,8 @@ async def view_detailed_worker_redirect(callback: CallbackQuery, callback_data:
         
         readable_occupations = await sync_to_async(lambda: worker.readable_heb_occupations)()
 
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        about_text = await sync_to_async(Text.objects.get)(slug='about')
-        salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
+        texts = await Text.objects.aresolve(*WORKER_TEXTS, lang='heb')
         objects_photos = await sync_to_async(lambda: list(worker.objects_photos.all()))()
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating_worker')
 
         rating = await sync_to_async(lambda: worker.rating_heb)()
 
@@ -174,11 +173,10 @@ async def view_detailed_worker_redirect(callback: CallbackQuery, callback_data:
         for object_photo in objects_photos:
             input_media_photos.append(InputMediaPhoto(media=object_photo.photo_id))
         
-        reply_text = f'''\u202B*{occupations_text.heb}* {readable_occupations}\
-                \n*{rating_text.heb}* {rating}\
-                \n*{min_salary_text.heb}* {worker.min_salary} {salary_hourly.heb}\
-                \n*{about_text.heb}* {worker.about_heb}'''
-
+        reply_text = f'''\u202B*{texts.occupations}* {readable_occupations}\
+                \n*{texts.rating_worker}* {rating}\
+                \n*{texts.min_salary}* {worker.min_salary} {texts.salary_hourly}\
+                \n*{texts.about}* {worker.about_heb}'''
 
         if input_media_photos:
             try:
@@ -188,7 +186,7 @@ async def view_detailed_worker_redirect(callback: CallbackQuery, callback_data:
 
                 await callback.message.answer(
                     text=reply_text,
-                    reply_markup=await keyboards.employer_worker_details_keyboard(worker.id, callback.from_user.id),
+                    reply_markup=await keyboards.employer_worker_details_keyboard(worker.id, employer),
                     parse_mode='Markdown',
                 )
                 await callback.message.delete()
@@ -198,7 +196,7 @@ async def view_detailed_worker_redirect(callback: CallbackQuery, callback_data:
             try:
                 await callback.message.edit_text(
                     text=reply_text,
-                    reply_markup=await keyboards.employer_worker_details_keyboard(worker.id, callback.from_user.id),
+                    reply_markup=await keyboards.employer_worker_details_keyboard(worker.id, employer),
                     parse_mode='Markdown',
                 )
             except:
@@ -213,16 +211,14 @@ async def view_detailed_worker_redirect(callback: CallbackQuery, callback_data:
     if proposal:
         status = await sync_to_async(lambda: proposal.readable_heb_accepted_status)()
 
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-        updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
+        texts = await Text.objects.aresolve(*PROPOSAL_TEXTS, lang='heb')
 
         created_date = proposal.created_at.strftime('%d.%m.%Y')
         updated_date = proposal.updated_at.strftime('%d.%m.%Y')
 
-        reply_text = f'''\u202B*{status_text.heb}* {status}\
-                    \n*{created_at.heb}* {created_date}\
-                    \n*{updated_at.heb}* {updated_date}'''
+        reply_text = f'''\u202B*{texts.status}* {status}\
+                    \n*{texts.created_at}* {created_date}\
+                    \n*{texts.updated_at}* {updated_date}'''
         
         worker = await sync_to_async(lambda: proposal.worker)()
 
@@ -241,40 +237,30 @@ async def view_detailed_outbox_proposal(callback: CallbackQuery, callback_data:
     proposal = await sync_to_async(EmployerCooperationProposal.objects.filter(id=proposal_id).first)()
     worker = await sync_to_async(lambda: proposal.worker)()
     if worker and proposal:
-        worker_text = await sync_to_async(Text.objects.get)(slug='worker')
-        outbox_proposal_text = await sync_to_async(Text.objects.get)(slug='outbox_proposal')
+        texts = await Text.objects.aresolve(*OUTBOX_PROPOSAL_TEXTS, lang='heb')
 
         readable_occupations = await sync_to_async(lambda: worker.readable_heb_occupations)()
 
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        about_text = await sync_to_async(Text.objects.get)(slug='about')
-        salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
         objects_photos = await sync_to_async(lambda: list(worker.objects_photos.all()))()
 
         input_media_photos = []
         for object_photo in objects_photos:
             input_media_photos.append(InputMediaPhoto(media=object_photo.photo_id))
         
-
         status = await sync_to_async(lambda: proposal.readable_heb_accepted_status)()
 
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-        updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
-
         created_date = proposal.created_at.strftime('%d.%m.%Y')
         updated_date = proposal.updated_at.strftime('%d.%m.%Y')
 
-        reply_text = f'''\u202B*{worker_text.heb}*\
-                \n*{occupations_text.heb}* {readable_occupations}\
-                \n*{min_salary_text.heb}* {worker.min_salary} {salary_hourly.heb}\
-                \n*{about_text.heb}* {worker.about_heb}\
+        reply_text = f'''\u202B*{texts.worker}*\
+                \n*{texts.occupations}* {readable_occupations}\
+                \n*{texts.min_salary}* {worker.min_salary} {texts.salary_hourly}\
+                \n*{texts.about}* {worker.about_heb}\
                 \n\
-                \n*{outbox_proposal_text.heb}*\
-                \n*{status_text.heb}* {status}\
-                \n*{created_at.heb}* {created_date}\
-                \n*{updated_at.heb}* {updated_date}'''
+                \n*{texts.outbox_proposal}*\
+                \n*{texts.status}* {status}\
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.updated_at}* {updated_date}'''
 
         if input_media_photos:
             try:
@@ -311,40 +297,30 @@ async def view_detailed_outbox_proposal_redirect(callback: CallbackQuery, callba
         await state.set_state(PageNavigation.page_navigation)
         await state.set_data({'destination': callback_data.redirect, 'page': 1})
 
-        worker_text = await sync_to_async(Text.objects.get)(slug='worker')
-        outbox_proposal_text = await sync_to_async(Text.objects.get)(slug='outbox_proposal')
+        texts = await Text.objects.aresolve(*OUTBOX_PROPOSAL_TEXTS, lang='heb')
 
         readable_occupations = await sync_to_async(lambda: worker.readable_heb_occupations)()
 
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        about_text = await sync_to_async(Text.objects.get)(slug='about')
-        salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
         objects_photos = await sync_to_async(lambda: list(worker.objects_photos.all()))()
 
         input_media_photos = []
         for object_photo in objects_photos:
             input_media_photos.append(InputMediaPhoto(media=object_photo.photo_id))
         
-
         status = await sync_to_async(lambda: proposal.readable_heb_accepted_status)()
 
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-        updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
-
         created_date = proposal.created_at.strftime('%d.%m.%Y')
         updated_date = proposal.updated_at.strftime('%d.%m.%Y')
 
-        reply_text = f'''\u202B*{worker_text.heb}*\
-                \n*{occupations_text.heb}* {readable_occupations}\
-                \n*{min_salary_text.heb}* {worker.min_salary} {salary_hourly.heb}\
-                \n*{about_text.heb}* {worker.about_heb}\
+        reply_text = f'''\u202B*{texts.worker}*\
+                \n*{texts.occupations}* {readable_occupations}\
+                \n*{texts.min_salary}* {worker.min_salary} {texts.salary_hourly}\
+                \n*{texts.about}* {worker.about_heb}\
                 \n\
-                \n*{outbox_proposal_text.heb}*\
-                \n*{status_text.heb}* {status}\
-                \n*{created_at.heb}* {created_date}\
-                \n*{updated_at.heb}* {updated_date}'''
+                \n*{texts.outbox_proposal}*\
+                \n*{texts.status}* {status}\
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.updated_at}* {updated_date}'''
 
         if input_media_photos:
             try:
@@ -378,18 +354,11 @@ async def view_detailed_inbox_proposal(callback: CallbackQuery, callback_data: E
     worker = await sync_to_async(lambda: proposal.worker)()
     job = await sync_to_async(lambda: proposal.job)()
     if worker and proposal:
-        worker_text = await sync_to_async(Text.objects.get)(slug='worker')
-        job_text = await sync_to_async(Text.objects.get)(slug='job')
-        inbox_proposal_text = await sync_to_async(Text.objects.get)(slug='inbox_proposal')
+        texts = await Text.objects.aresolve(*INBOX_PROPOSAL_TEXTS, lang='heb')
 
         readable_occupations = await sync_to_async(lambda: worker.readable_heb_occupations)()
 
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        about_text = await sync_to_async(Text.objects.get)(slug='about')
-        salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
         objects_photos = await sync_to_async(lambda: list(worker.objects_photos.all()))()
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating_worker')
 
         rating = await sync_to_async(lambda: worker.rating_heb)()
 
@@ -402,39 +371,29 @@ async def view_detailed_inbox_proposal(callback: CallbackQuery, callback_data: E
         readable_notifications_status = await sync_to_async(lambda: job.readable_notifications_heb_status)()
         readable_job_occupations = await sync_to_async(lambda: job.readable_heb_occupations)()
 
-        job_approved_text = await sync_to_async(Text.objects.get)(slug='job_approved_text')
-        job_active_text = await sync_to_async(Text.objects.get)(slug='is_job_active')
-        notifications_text = await sync_to_async(Text.objects.get)(slug='notifications')
-
-        description_text = await sync_to_async(Text.objects.get)(slug='description')
-
         status = await sync_to_async(lambda: proposal.readable_heb_accepted_status)()
 
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-        updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
-
         created_date = proposal.created_at.strftime('%d.%m.%Y')
         updated_date = proposal.updated_at.strftime('%d.%m.%Y')
 
-        reply_text = f'''\u202B*{worker_text.heb}*\
-                \n*{occupations_text.heb}* {readable_occupations}\
-                \n*{rating_text.heb}* {rating}\
-                \n*{min_salary_text.heb}* {worker.min_salary} {salary_hourly.heb}\
-                \n*{about_text.heb}* {worker.about_heb}\
+        reply_text = f'''\u202B*{texts.worker}*\
+                \n*{texts.occupations}* {readable_occupations}\
+                \n*{texts.rating_worker}* {rating}\
+                \n*{texts.min_salary}* {worker.min_salary} {texts.salary_hourly}\
+                \n*{texts.about}* {worker.about_heb}\
                 \n\
-                \n*{job_text.heb}*\
-                \n*{job_approved_text.heb}* {readable_approve_status}\
-                \n*{job_active_text.heb}* {readable_active_status}\
-                \n*{notifications_text.heb}* {readable_notifications_status}\
-                \n*{occupations_text.heb}* {readable_job_occupations}\
-                \n*{min_salary_text.heb}* {job.min_salary} {salary_hourly.heb}\
-                \n*{description_text.heb}* {job.description}\
+                \n*{texts.job}*\
+                \n*{texts.job_approved_text}* {readable_approve_status}\
+                \n*{texts.is_job_active}* {readable_active_status}\
+                \n*{texts.notifications}* {readable_notifications_status}\
+                \n*{texts.occupations}* {readable_job_occupations}\
+                \n*{texts.min_salary}* {job.min_salary} {texts.salary_hourly}\
+                \n*{texts.description}* {job.description}\
                 \n\
-                \n*{inbox_proposal_text.heb}*\
-                \n*{status_text.heb}* {status}\
-                \n*{created_at.heb}* {created_date}\
-                \n*{updated_at.heb}* {updated_date}'''
+                \n*{texts.inbox_proposal}*\
+                \n*{texts.status}* {status}\
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.updated_at}* {updated_date}'''
 
         if input_media_photos:
             try:
@@ -472,18 +431,11 @@ async def view_detailed_inbox_proposal_redirect(callback: CallbackQuery, callbac
         await state.set_state(PageNavigation.page_navigation)
         await state.set_data({'destination': callback_data.redirect, 'page': 1})
 
-        worker_text = await sync_to_async(Text.objects.get)(slug='worker')
-        job_text = await sync_to_async(Text.objects.get)(slug='job')
-        inbox_proposal_text = await sync_to_async(Text.objects.get)(slug='inbox_proposal')
+        texts = await Text.objects.aresolve(*INBOX_PROPOSAL_TEXTS, lang='heb')
 
         readable_occupations = await sync_to_async(lambda: worker.readable_heb_occupations)()
 
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        about_text = await sync_to_async(Text.objects.get)(slug='about')
-        salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
         objects_photos = await sync_to_async(lambda: list(worker.objects_photos.all()))()
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating_worker')
 
         rating = await sync_to_async(lambda: worker.rating_heb)()
 
@@ -496,39 +448,29 @@ async def view_detailed_inbox_proposal_redirect(callback: CallbackQuery, callbac
         readable_notifications_status = await sync_to_async(lambda: job.readable_notifications_heb_status)()
         readable_job_occupations = await sync_to_async(lambda: job.readable_heb_occupations)()
 
-        job_approved_text = await sync_to_async(Text.objects.get)(slug='job_approved_text')
-        job_active_text = await sync_to_async(Text.objects.get)(slug='is_job_active')
-        notifications_text = await sync_to_async(Text.objects.get)(slug='notifications')
-
-        description_text = await sync_to_async(Text.objects.get)(slug='description')
-
         status = await sync_to_async(lambda: proposal.readable_heb_accepted_status)()
 
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-        updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
-
         created_date = proposal.created_at.strftime('%d.%m.%Y')
         updated_date = proposal.updated_at.strftime('%d.%m.%Y')
 
-        reply_text = f'''\u202B*{worker_text.heb}*\
-                \n*{occupations_text.heb}* {readable_occupations}\
-                \n*{rating_text.heb}* {rating}\
-                \n*{min_salary_text.heb}* {worker.min_salary} {salary_hourly.heb}\
-                \n*{about_text.heb}* {worker.about_heb}\
+        reply_text = f'''\u202B*{texts.worker}*\
+                \n*{texts.occupations}* {readable_occupations}\
+                \n*{texts.rating_worker}* {rating}\
+                \n*{texts.min_salary}* {worker.min_salary} {texts.salary_hourly}\
+                \n*{texts.about}* {worker.about_heb}\
                 \n\
-                \n*{job_text.heb}*\
-                \n*{job_approved_text.heb}* {readable_approve_status}\
-                \n*{job_active_text.heb}* {readable_active_status}\
-                \n*{notifications_text.heb}* {readable_notifications_status}\
-                \n*{occupations_text.heb}* {readable_job_occupations}\
-                \n*{min_salary_text.heb}* {job.min_salary} {salary_hourly.heb}\
-                \n*{description_text.heb}* {job.description}\
+                \n*{texts.job}*\
+                \n*{texts.job_approved_text}* {readable_approve_status}\
+                \n*{texts.is_job_active}* {readable_active_status}\
+                \n*{texts.notifications}* {readable_notifications_status}\
+                \n*{texts.occupations}* {readable_job_occupations}\
+                \n*{texts.min_salary}* {job.min_salary} {texts.salary_hourly}\
+                \n*{texts.description}* {job.description}\
                 \n\
-                \n*{inbox_proposal_text.heb}*\
-                \n*{status_text.heb}* {status}\
-                \n*{created_at.heb}* {created_date}\
-                \n*{updated_at.heb}* {updated_date}'''
+                \n*{texts.inbox_proposal}*\
+                \n*{texts.status}* {status}\
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.updated_at}* {updated_date}'''
 
         if input_media_photos:
             try:
@@ -560,24 +502,20 @@ async def view_detailed_inbox_review(callback: CallbackQuery, callback_data: Emp
     review_id = callback_data.object_id
     review = await sync_to_async(WorkerReview.objects.filter(id=review_id).first)()
     if review:
-        title = await sync_to_async(Text.objects.get)(slug='inbox_review')
-
-        rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-        review_text = await sync_to_async(Text.objects.get)(slug='review')
-        created_text = await sync_to_async(Text.objects.get)(slug='created_at')
+        texts = await Text.objects.aresolve(*INBOX_REVIEW_TEXTS, lang='heb')
 
         created_date = review.created_at.strftime('%d.%m.%Y')
 
         comment = review.review_heb
         if not comment:
-            comment = await sync_to_async(Text.objects.get)(slug='empty')
+            comment = await catalog.text('empty')
             comment = comment.heb
 
-        reply_text = f'''\u202B*{title.heb}*\
+        reply_text = f'''\u202B*{texts.inbox_review}*\
                 \n\
-                \n*{created_text.heb}* {created_date}\
-                \n*{rate_text.heb}* {review.rate} ⭐️\
-                \n*{review_text.heb}* {comment}'''
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.rate}* {review.rate} ⭐️\
+                \n*{texts.review}* {comment}'''
 
         try:
             await callback.message.edit_text(
@@ -598,24 +536,20 @@ async def view_detailed_inbox_review_redirect(callback: CallbackQuery, callback_
         await state.set_state(PageNavigation.page_navigation)
         await state.set_data({'destination': callback_data.redirect, 'page': 1})
 
-        title = await sync_to_async(Text.objects.get)(slug='inbox_review')
-
-        rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-        review_text = await sync_to_async(Text.objects.get)(slug='review')
-        created_text = await sync_to_async(Text.objects.get)(slug='created_at')
+        texts = await Text.objects.aresolve(*INBOX_REVIEW_TEXTS, lang='heb')
 
         created_date = review.created_at.strftime('%d.%m.%Y')
 
         comment = review.review_heb
         if not comment:
-            comment = await sync_to_async(Text.objects.get)(slug='empty')
+            comment = await catalog.text('empty')
             comment = comment.heb
 
-        reply_text = f'''\u202B*{title.heb}*\
+        reply_text = f'''\u202B*{texts.inbox_review}*\
                 \n\
-                \n*{created_text.heb}* {created_date}\
-                \n*{rate_text.heb}* {review.rate} ⭐️\
-                \n*{review_text.heb}* {comment}'''
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.rate}* {review.rate} ⭐️\
+                \n*{texts.review}* {comment}'''
 
         try:
             await callback.message.edit_text(
@@ -632,27 +566,22 @@ async def view_detailed_outbox_review(callback: CallbackQuery, callback_data: Em
     review_id = callback_data.object_id
     review = await sync_to_async(EmployerReview.objects.filter(id=review_id).first)()
     if review:
-        title = await sync_to_async(Text.objects.get)(slug='outbox_review')
-
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-        review_text = await sync_to_async(Text.objects.get)(slug='review')
-        created_text = await sync_to_async(Text.objects.get)(slug='created_at')
+        texts = await Text.objects.aresolve(*OUTBOX_REVIEW_TEXTS, lang='heb')
 
         created_date = review.created_at.strftime('%d.%m.%Y')
         status = await sync_to_async(lambda: review.readable_approved_status)()
 
         comment = review.review
         if not comment:
-            comment = await sync_to_async(Text.objects.get)(slug='empty')
+            comment = await catalog.text('empty')
             comment = comment.heb
 
-        reply_text = f'''\u202B*{title.heb}*\
+        reply_text = f'''\u202B*{texts.outbox_review}*\
                 \n\
-                \n*{status_text.heb}* {status}\
-                \n*{created_text.heb}* {created_date}\
-                \n*{rate_text.heb}* {review.rate} ⭐️\
-                \n*{review_text.heb}* {comment}'''
+                \n*{texts.status}* {status}\
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.rate}* {review.rate} ⭐️\
+                \n*{texts.review}* {comment}'''
 
         try:
             await callback.message.edit_text(
@@ -673,27 +602,22 @@ async def view_detailed_outbox_review_redirect(callback: CallbackQuery, callback
         await state.set_state(PageNavigation.page_navigation)
         await state.set_data({'destination': callback_data.redirect, 'page': 1})
 
-        title = await sync_to_async(Text.objects.get)(slug='outbox_review')
-
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-        review_text = await sync_to_async(Text.objects.get)(slug='review')
-        created_text = await sync_to_async(Text.objects.get)(slug='created_at')
+        texts = await Text.objects.aresolve(*OUTBOX_REVIEW_TEXTS, lang='heb')
 
         created_date = review.created_at.strftime('%d.%m.%Y')
         status = await sync_to_async(lambda: review.readable_approved_status)()
 
         comment = review.review
         if not comment:
-            comment = await sync_to_async(Text.objects.get)(slug='empty')
+            comment = await catalog.text('empty')
             comment = comment.heb
 
-        reply_text = f'''\u202B*{title.heb}*\
+        reply_text = f'''\u202B*{texts.outbox_review}*\
                 \n\
-                \n*{status_text.heb}* {status}\
-                \n*{created_text.heb}* {created_date}\
-                \n*{rate_text.heb}* {review.rate} ⭐️\
-                \n*{review_text.heb}* {comment}'''
+                \n*{texts.status}* {status}\
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.rate}* {review.rate} ⭐️\
+                \n*{texts.review}* {comment}'''
 
         try:
             await callback.message.edit_text(
@@ -713,22 +637,20 @@ async def view_detailed_employer_jobs(callback: CallbackQuery, callback_data: Em
     if worker:
         reviews = await sync_to_async(lambda: list(worker.received_reviews.filter(is_approved=True).all()))()
         if reviews:
-            rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-            review_text = await sync_to_async(Text.objects.get)(slug='review')
-            created_text = await sync_to_async(Text.objects.get)(slug='created_at')
+            texts = await Text.objects.aresolve(*REVIEWS_TEXTS, lang='heb')
 
             reply_texts = []
             reply_text = ''
             for review in reviews:
                 comment = review.review
                 if not comment:
-                    comment = await sync_to_async(Text.objects.get)(slug='empty')
+                    comment = await catalog.text('empty')
                     comment = comment.heb
                 created_date = review.created_at.strftime('%d.%m.%Y')
 
-                added_text = f'\n\n\u202B*{created_text.heb}* {created_date}\
-                            \n*{rate_text.heb}* {review.rate} ⭐️\
-                            \n*{review_text.heb}* {comment}'''
+                added_text = f'\n\n\u202B*{texts.created_at}* {created_date}\
+                            \n*{texts.rate}* {review.rate} ⭐️\
+                            \n*{texts.review}* {comment}'''
                 
                 if len(reply_text) + len(added_text) > MAX_SYMBOLS:
                     reply_texts.append(reply_text)
@@ -781,22 +703,20 @@ async def view_detailed_employer_jobs(callback: CallbackQuery, callback_data: Em
     if worker:
         reviews = await sync_to_async(lambda: list(worker.received_reviews.filter(is_approved=True).all()))()
         if reviews:
-            rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-            review_text = await sync_to_async(Text.objects.get)(slug='review')
-            created_text = await sync_to_async(Text.objects.get)(slug='created_at')
+            texts = await Text.objects.aresolve(*REVIEWS_TEXTS, lang='heb')
 
             reply_texts = []
             reply_text = ''
             for review in reviews:
                 comment = review.review
                 if not comment:
-                    comment = await sync_to_async(Text.objects.get)(slug='empty')
+                    comment = await catalog.text('empty')
                     comment = comment.heb
                 created_date = review.created_at.strftime('%d.%m.%Y')
 
-                added_text = f'\n\n\u202B*{created_text.heb}* {created_date}\
-                            \n*{rate_text.heb}* {review.rate} ⭐️\
-                            \n*{review_text.heb}* {comment}'''
+                added_text = f'\n\n\u202B*{texts.created_at}* {created_date}\
+                            \n*{texts.rate}* {review.rate} ⭐️\
+                            \n*{texts.review}* {comment}'''
                 
                 if len(reply_text) + len(added_text) > MAX_SYMBOLS:
                     reply_texts.append(reply_text)
@@ -13,7 +13,8 @@ django.setup()
 
 from config import ADMIN_CHAT_ID, MAX_LEN
 from middlewares.change_username import UpdateUsernameMiddleware
-from core.models import Employer, Text, Occupation, Job
+from core.models import Job
+from core import catalog
 from states.create_job import CreateJob
 from states.pages_navigation import PageNavigation
 from keyboards import keyboards
@@ -33,7 +34,7 @@ async def employer_add_job(callback: CallbackQuery, callback_data: EmployerContr
     await state.clear()
     await state.set_state(CreateJob.input_occupations)
 
-    reply_text = await sync_to_async(Text.objects.get)(slug='employer_occupations')
+    reply_text = await catalog.text('employer_occupations')
     try:
         await callback.message.edit_text(
             text=f'\u202B{reply_text.heb}',
@@ -71,7 +72,7 @@ async def employer_confirm_occupations(callback: CallbackQuery, callback_data: O
 
     if occupations:
         await state.set_state(CreateJob.input_min_salary)
-        reply_text = await sync_to_async(Text.objects.get)(slug='employer_min_salary')
+        reply_text = await catalog.text('employer_min_salary')
         try:
             await callback.message.edit_text(
                 text=f'\u202B{reply_text.heb}',
@@ -81,7 +82,7 @@ async def employer_confirm_occupations(callback: CallbackQuery, callback_data: O
             pass
 
     else:
-        reply_text = await sync_to_async(Text.objects.get)(slug='need_occupations')
+        reply_text = await catalog.text('need_occupations')
         try:
             await callback.bot.answer_callback_query(
                 callback_query_id=callback.id,
@@ -100,7 +101,7 @@ async def employer_input_min_salary(message: Message, state: FSMContext):
         await state.update_data(salary=min_salary)
         await state.set_state(CreateJob.input_description)
 
-        reply_text = await sync_to_async(Text.objects.get)(slug='job_description')
+        reply_text = await catalog.text('job_description')
         try:
             await message.answer(
                 text=f'\u202B{reply_text.heb}',
@@ -110,7 +111,7 @@ async def employer_input_min_salary(message: Message, state: FSMContext):
 
     else:
         try:
-            reply_text = await sync_to_async(Text.objects.get)(slug='wrong_min_salary')
+            reply_text = await catalog.text('wrong_min_salary')
             await message.reply(text=f'\u202B{reply_text.heb}')
         except:
             pass
@@ -124,7 +125,7 @@ async def employer_job_description(message: Message, state: FSMContext):
     await state.update_data(description=description)
     await state.set_state(CreateJob.input_notifications)
 
-    reply_text = await sync_to_async(Text.objects.get)(slug='employer_notifications')
+    reply_text = await catalog.text('employer_notifications')
     try:
         await message.answer(
             text=f'\u202B{reply_text.heb}',
@@ -146,14 +147,14 @@ async def employer_job_notifications(callback: CallbackQuery, callback_data: Emp
     await state.set_state(CreateJob.input_confirmation)
     state_data = await state.get_data()
 
-    recheck_text = await sync_to_async(Text.objects.get)(slug='employer_confirmation')
+    recheck_text = await catalog.text('employer_confirmation')
 
-    occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-    min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-    salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
+    occupations_text = await catalog.text('occupations')
+    min_salary_text = await catalog.text('min_salary')
+    salary_hourly = await catalog.text('salary_hourly')
     
-    description_text = await sync_to_async(Text.objects.get)(slug='description')
-    notification_text = await sync_to_async(Text.objects.get)(slug='notifications')
+    description_text = await catalog.text('description')
+    notification_text = await catalog.text('notifications')
 
     curr_occupations = state_data.get('occupations', False)
     if not curr_occupations:
@@ -161,7 +162,7 @@ async def employer_job_notifications(callback: CallbackQuery, callback_data: Emp
 
     occupations_readable = []
     for curr_occupation in curr_occupations:
-        occupation = await sync_to_async(Occupation.objects.filter(slug=curr_occupation).first)()
+        occupation = await catalog.occupation(curr_occupation)
         if occupation:
             occupations_readable.append(occupation.heb)
     
@@ -190,7 +191,7 @@ async def employer_job_retype(callback: CallbackQuery, callback_data: EmployerCo
     await state.clear()
     await state.set_state(CreateJob.input_occupations)
 
-    reply_text = await sync_to_async(Text.objects.get)(slug='employer_occupations')
+    reply_text = await catalog.text('employer_occupations')
     try:
         await callback.message.edit_text(
             text=f'\u202B{reply_text.heb}',
@@ -200,9 +201,8 @@ async def employer_job_retype(callback: CallbackQuery, callback_data: EmployerCo
         pass
 
 
-@router.callback_query(EmployerControlsCallBackFactory.filter((F.control == "job") & (F.action == 'confirm')), CreateJob.input_confirmation)
-async def employer_job_confirm(callback: CallbackQuery, callback_data: EmployerControlsCallBackFactory, state: FSMContext):
-    employer = await sync_to_async(Employer.objects.filter(tg_id=callback.from_user.id).first)()
+@router.callback_query(EmployerControlsCallBackFactory.filter((F.control == "job") & (F.action == 'confirm')), CreateJob.input_confirmation, flags={'profile': True})
+async def employer_job_confirm(callback: CallbackQuery, callback_data: EmployerControlsCallBackFactory, state: FSMContext, employer=None):
 
     if employer:
         state_data = await state.get_data()
@@ -217,7 +217,7 @@ async def employer_job_confirm(callback: CallbackQuery, callback_data: EmployerC
         
         occupations_objects = []
         for occupation in curr_occupations:
-            occupation = await sync_to_async(Occupation.objects.filter(slug=occupation).first)()
+            occupation = await catalog.occupation(occupation)
             if occupation:
                 occupations_objects.append(occupation)
         
@@ -229,9 +229,9 @@ async def employer_job_confirm(callback: CallbackQuery, callback_data: EmployerC
         )
         
         for occupation in occupations_objects:
-            await sync_to_async(job.occupations.add)(occupation)
+            await sync_to_async(job.occupations.add)(occupation.id)
         
-        reply_text = await sync_to_async(Text.objects.get)(slug='job_wait_check')
+        reply_text = await catalog.text('job_wait_check')
         try:
             await callback.message.edit_text(
                 text=f'\u202B{reply_text.heb}',
@@ -240,10 +240,10 @@ async def employer_job_confirm(callback: CallbackQuery, callback_data: EmployerC
         except:
             pass
 
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        description_text = await sync_to_async(Text.objects.get)(slug='description')
-        name_text = await sync_to_async(Text.objects.get)(slug='employer_company_name')
+        occupations_text = await catalog.text('occupations')
+        min_salary_text = await catalog.text('min_salary')
+        description_text = await catalog.text('description')
+        name_text = await catalog.text('employer_company_name')
 
         readable_occupations = await sync_to_async(lambda: job.readable_rus_occupations)()
         description_rus = await translate_to_rus(description)
@@ -291,14 +291,14 @@ async def employer_job_detail_notifications(callback: CallbackQuery, callback_da
         readable_notifications_status = await sync_to_async(lambda: job.readable_notifications_heb_status)()
         readable_occupations = await sync_to_async(lambda: job.readable_heb_occupations)()
 
-        job_approved_text = await sync_to_async(Text.objects.get)(slug='job_approved_text')
-        job_active_text = await sync_to_async(Text.objects.get)(slug='is_job_active')
-        notifications_text = await sync_to_async(Text.objects.get)(slug='notifications')
+        job_approved_text = await catalog.text('job_approved_text')
+        job_active_text = await catalog.text('is_job_active')
+        notifications_text = await catalog.text('notifications')
         
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        salary_hourly_text = await sync_to_async(Text.objects.get)(slug='salary_hourly')
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        description_text = await sync_to_async(Text.objects.get)(slug='description')
+        min_salary_text = await catalog.text('min_salary')
+        salary_hourly_text = await catalog.text('salary_hourly')
+        occupations_text = await catalog.text('occupations')
+        description_text = await catalog.text('description')
 
         reply_text = f'''\u202B*{job_approved_text.heb}* {readable_approve_status}\
                       \n*{job_active_text.heb}* {readable_active_status}\
@@ -346,14 +346,14 @@ async def employer_job_detail_active(callback: CallbackQuery, callback_data: Emp
         readable_notifications_status = await sync_to_async(lambda: job.readable_notifications_heb_status)()
         readable_occupations = await sync_to_async(lambda: job.readable_heb_occupations)()
 
-        job_approved_text = await sync_to_async(Text.objects.get)(slug='job_approved_text')
-        job_active_text = await sync_to_async(Text.objects.get)(slug='is_job_active')
-        notifications_text = await sync_to_async(Text.objects.get)(slug='notifications')
+        job_approved_text = await catalog.text('job_approved_text')
+        job_active_text = await catalog.text('is_job_active')
+        notifications_text = await catalog.text('notifications')
         
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        salary_hourly_text = await sync_to_async(Text.objects.get)(slug='salary_hourly')
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        description_text = await sync_to_async(Text.objects.get)(slug='description')
+        min_salary_text = await catalog.text('min_salary')
+        salary_hourly_text = await catalog.text('salary_hourly')
+        occupations_text = await catalog.text('occupations')
+        description_text = await catalog.text('description')
 
         reply_text = f'''\u202B*{job_approved_text.heb}* {readable_approve_status}\
                       \n*{job_active_text.heb}* {readable_active_status}\
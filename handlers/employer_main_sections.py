@@ -10,7 +10,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'work_exchange.settings')
 django.setup()
 
 from middlewares.change_username import UpdateUsernameMiddleware
-from core.models import Employer, Text
+from core import catalog
 from keyboards import keyboards
 from utils import validate_phone
 from keyboards.callbacks import EmployerMainSectionsCallBackFactory
@@ -20,17 +20,16 @@ router = Router()
 router.callback_query.middleware(UpdateUsernameMiddleware())
 
 
-@router.callback_query(EmployerMainSectionsCallBackFactory.filter(F.destination == 'profile'))
-async def handle_profile_menu(callback: CallbackQuery, callback_data: EmployerMainSectionsCallBackFactory, state: FSMContext):
+@router.callback_query(EmployerMainSectionsCallBackFactory.filter(F.destination == 'profile'), flags={'profile': True})
+async def handle_profile_menu(callback: CallbackQuery, callback_data: EmployerMainSectionsCallBackFactory, state: FSMContext, employer=None):
     await state.clear()
 
-    employer = await sync_to_async(Employer.objects.filter(tg_id=callback.from_user.id).first)()
     if employer:
 
-        your_profile = await sync_to_async(Text.objects.get)(slug='your_profile')
-        phone_text = await sync_to_async(Text.objects.get)(slug='phone')
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating')
-        name_text = await sync_to_async(Text.objects.get)(slug='employer_company_name')
+        your_profile = await catalog.text('your_profile')
+        phone_text = await catalog.text('phone')
+        rating_text = await catalog.text('rating')
+        name_text = await catalog.text('employer_company_name')
 
         rating = await sync_to_async(lambda: employer.rating_heb)()
 
@@ -54,7 +53,7 @@ async def handle_profile_menu(callback: CallbackQuery, callback_data: EmployerMa
 async def handle_jobs_menu(callback: CallbackQuery, callback_data: EmployerMainSectionsCallBackFactory, state: FSMContext):
     await state.clear()
 
-    choose_jobs_type = await sync_to_async(Text.objects.get)(slug='choose_jobs_type')
+    choose_jobs_type = await catalog.text('choose_jobs_type')
 
     try:
         await callback.message.edit_text(
@@ -69,7 +68,7 @@ async def handle_jobs_menu(callback: CallbackQuery, callback_data: EmployerMainS
 async def handle_workers_menu(callback: CallbackQuery, callback_data: EmployerMainSectionsCallBackFactory, state: FSMContext):
     await state.clear()
 
-    choose_workers_type = await sync_to_async(Text.objects.get)(slug='choose_workers_type')
+    choose_workers_type = await catalog.text('choose_workers_type')
 
     try:
         await callback.message.edit_text(
@@ -84,7 +83,7 @@ async def handle_workers_menu(callback: CallbackQuery, callback_data: EmployerMa
 async def handle_proposals_menu(callback: CallbackQuery, callback_data: EmployerMainSectionsCallBackFactory, state: FSMContext):
     await state.clear()
 
-    choose_proposals_type = await sync_to_async(Text.objects.get)(slug='choose_proposals_type')
+    choose_proposals_type = await catalog.text('choose_proposals_type')
 
     try:
         await callback.message.edit_text(
@@ -99,7 +98,7 @@ async def handle_proposals_menu(callback: CallbackQuery, callback_data: Employer
 async def handle_notifications_controls(callback: CallbackQuery, callback_data: EmployerMainSectionsCallBackFactory, state: FSMContext):
     await state.clear()
 
-    choose_reviews_type = await sync_to_async(Text.objects.get)(slug='choose_reviews_type')
+    choose_reviews_type = await catalog.text('choose_reviews_type')
 
     try:
         await callback.message.edit_text(
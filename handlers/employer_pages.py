@@ -3,7 +3,6 @@ import os
 import django
 from aiogram import Router, F
 from aiogram.types import CallbackQuery
-from asgiref.sync import sync_to_async
 from aiogram.fsm.context import FSMContext
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'work_exchange.settings')
@@ -11,7 +10,8 @@ django.setup()
 
 from middlewares.change_username import UpdateUsernameMiddleware
 from states.pages_navigation import PageNavigation
-from core.models import Text, Employer
+from core.models import Employer
+from core import catalog
 from keyboards.callbacks import EmployerPagesSectionsCallBackFactory
 from keyboards import keyboards
 
@@ -20,18 +20,18 @@ router = Router()
 router.callback_query.middleware(UpdateUsernameMiddleware())
 
 
-@router.callback_query(EmployerPagesSectionsCallBackFactory.filter(F.destination.contains('jobs')))
-async def handle_jobs_section(callback: CallbackQuery, callback_data: EmployerPagesSectionsCallBackFactory, state=FSMContext):
+@router.callback_query(EmployerPagesSectionsCallBackFactory.filter(F.destination.contains('jobs')), flags={'profile': True})
+async def handle_jobs_section(callback: CallbackQuery, callback_data: EmployerPagesSectionsCallBackFactory, state=FSMContext, employer=None):
     await state.clear()
     await state.set_state(PageNavigation.page_navigation)
     await state.set_data({'destination': callback_data.destination, 'page': callback_data.page})
 
     if callback_data.destination == 'jobs-active':
-        reply_text = await sync_to_async(Text.objects.get)(slug='jobs_active')
+        reply_text = await catalog.text('jobs_active')
     elif callback_data.destination == 'jobs-archive':
-        reply_text = await sync_to_async(Text.objects.get)(slug='jobs_archive')
+        reply_text = await catalog.text('jobs_archive')
     elif callback_data.destination == 'jobs-declined':
-        reply_text = await sync_to_async(Text.objects.get)(slug='jobs_declined')
+        reply_text = await catalog.text('jobs_declined')
 
     try:
         await callback.message.edit_text(
@@ -39,22 +39,22 @@ async def handle_jobs_section(callback: CallbackQuery, callback_data: EmployerPa
             reply_markup=await keyboards.employer_jobs_list_keyboard(
                 callback_data.page, 
                 callback_data.destination, 
-                callback.from_user.id),
+                employer),
         )
     except:
         pass
 
 
-@router.callback_query(EmployerPagesSectionsCallBackFactory.filter(F.destination.contains('workers')))
-async def handle_workers_section(callback: CallbackQuery, callback_data: EmployerPagesSectionsCallBackFactory, state=FSMContext):
+@router.callback_query(EmployerPagesSectionsCallBackFactory.filter(F.destination.contains('workers')), flags={'profile': True})
+async def handle_workers_section(callback: CallbackQuery, callback_data: EmployerPagesSectionsCallBackFactory, state=FSMContext, employer=None):
     await state.clear()
     await state.set_state(PageNavigation.page_navigation)
-    await state.set_data({'destination': callback_data.destination, 'page': callback_data.page})
+    await state.set_data({'destination': callback_data.destination, 'page': callback_data.page, 'cursor': callback_data.cursor})
 
     if callback_data.destination == 'workers-all':
-        reply_text = await sync_to_async(Text.objects.get)(slug='workers_all')
+        reply_text = await catalog.text('workers_all')
     elif callback_data.destination == 'workers-suitable':
-        reply_text = await sync_to_async(Text.objects.get)(slug='workers_suitable')
+        reply_text = await catalog.text('workers_suitable')
 
     try:
         await callback.message.edit_text(
@@ -62,22 +62,23 @@ async def handle_workers_section(callback: CallbackQuery, callback_data: Employe
             reply_markup=await keyboards.employer_workers_list_keyboard(
                 callback_data.page, 
                 callback_data.destination, 
-                callback.from_user.id),
+                employer,
+                callback_data.cursor),
         )   
     except:
         pass
 
 
-@router.callback_query(EmployerPagesSectionsCallBackFactory.filter(F.destination.contains('proposals')))
-async def handle_workers_section(callback: CallbackQuery, callback_data: EmployerPagesSectionsCallBackFactory, state=FSMContext):
+@router.callback_query(EmployerPagesSectionsCallBackFactory.filter(F.destination.contains('proposals')), flags={'profile': True})
+async def handle_workers_section(callback: CallbackQuery, callback_data: EmployerPagesSectionsCallBackFactory, state=FSMContext, employer=None):
     await state.clear()
     await state.set_state(PageNavigation.page_navigation)
     await state.set_data({'destination': callback_data.destination, 'page': callback_data.page})
 
     if callback_data.destination == 'inbox-proposals':
-        reply_text = await sync_to_async(Text.objects.get)(slug='inbox_proposals')
+        reply_text = await catalog.text('inbox_proposals')
     elif callback_data.destination == 'outbox-proposals':
-        reply_text = await sync_to_async(Text.objects.get)(slug='outbox_proposals')
+        reply_text = await catalog.text('outbox_proposals')
 
     try:
         await callback.message.edit_text(
@@ -85,22 +86,22 @@ async def handle_workers_section(callback: CallbackQuery, callback_data: Employe
             reply_markup=await keyboards.employer_proposals_list_keyboard(
                 callback_data.page, 
                 callback_data.destination, 
-                callback.from_user.id),
+                employer),
         )   
     except:
         pass
 
 
-@router.callback_query(EmployerPagesSectionsCallBackFactory.filter(F.destination.contains('reviews')))
-async def handle_workers_section(callback: CallbackQuery, callback_data: EmployerPagesSectionsCallBackFactory, state=FSMContext):
+@router.callback_query(EmployerPagesSectionsCallBackFactory.filter(F.destination.contains('reviews')), flags={'profile': True})
+async def handle_workers_section(callback: CallbackQuery, callback_data: EmployerPagesSectionsCallBackFactory, state=FSMContext, employer=None):
     await state.clear()
     await state.set_state(PageNavigation.page_navigation)
     await state.set_data({'destination': callback_data.destination, 'page': callback_data.page})
 
     if callback_data.destination == 'inbox-reviews':
-        reply_text = await sync_to_async(Text.objects.get)(slug='inbox_reviews')
+        reply_text = await catalog.text('inbox_reviews')
     elif callback_data.destination == 'outbox-reviews':
-        reply_text = await sync_to_async(Text.objects.get)(slug='outbox_reviews')
+        reply_text = await catalog.text('outbox_reviews')
 
     try:
         await callback.message.edit_text(
@@ -108,7 +109,7 @@ async def handle_workers_section(callback: CallbackQuery, callback_data: Employe
             reply_markup=await keyboards.employer_reviews_list_keyboard(
                 callback_data.page, 
                 callback_data.destination, 
-                callback.from_user.id),
+                employer),
         ) 
     except:
         pass 
\ No newline at end of file
@@ -11,7 +11,8 @@ django.setup()
 
 from config import ADMIN_CHAT_ID
 from middlewares.change_username import UpdateUsernameMiddleware
-from core.models import Employer, Text
+from core.models import Employer
+from core import catalog
 from states.create_employer import CreateEmployer
 from keyboards import keyboards
 from utils import validate_phone, escape_markdown
@@ -29,7 +30,7 @@ async def employer_contact(message: Message, state: FSMContext):
         await state.update_data(phone=phone)
         await state.set_state(CreateEmployer.input_name)
 
-        name_text = await sync_to_async(Text.objects.get)(slug='input_employer_name')
+        name_text = await catalog.text('input_employer_name')
         
         try:
             await message.answer(
@@ -40,7 +41,7 @@ async def employer_contact(message: Message, state: FSMContext):
             pass
 
     else:
-        reply_text = await sync_to_async(Text.objects.get)(slug='wrong_phone')
+        reply_text = await catalog.text('wrong_phone')
         try:
             await message.reply(text=f'\u202B{reply_text.heb}')
         except:
@@ -55,7 +56,7 @@ async def employer_phone(message: Message, state: FSMContext):
         await state.update_data(phone=phone)
         await state.set_state(CreateEmployer.input_name)
 
-        name_text = await sync_to_async(Text.objects.get)(slug='input_employer_name')
+        name_text = await catalog.text('input_employer_name')
         
         try:
             await message.answer(
@@ -66,7 +67,7 @@ async def employer_phone(message: Message, state: FSMContext):
             pass
 
     else:
-        reply_text = await sync_to_async(Text.objects.get)(slug='wrong_phone')
+        reply_text = await catalog.text('wrong_phone')
         try:
             await message.reply(text=f'\u202B{reply_text.heb}')
         except:
@@ -94,10 +95,10 @@ async def employer_company_name(message: Message, state: FSMContext):
             name=name,
         )
 
-    your_profile = await sync_to_async(Text.objects.get)(slug='your_profile')
-    phone_text = await sync_to_async(Text.objects.get)(slug='phone')
-    rating_text = await sync_to_async(Text.objects.get)(slug='rating')
-    name_text = await sync_to_async(Text.objects.get)(slug='employer_company_name')
+    your_profile = await catalog.text('your_profile')
+    phone_text = await catalog.text('phone')
+    rating_text = await catalog.text('rating')
+    name_text = await catalog.text('employer_company_name')
 
     rating = await sync_to_async(lambda: employer.rating_heb)()
 
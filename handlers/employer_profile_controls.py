@@ -14,7 +14,8 @@ django.setup()
 
 from config import MAX_LEN
 from middlewares.change_username import UpdateUsernameMiddleware
-from core.models import Text, Employer, Worker, EmployerCooperationProposal, WorkerCooperationProposal, EmployerReview
+from core.models import Worker, EmployerCooperationProposal, WorkerCooperationProposal, EmployerReview
+from core import catalog
 from keyboards.callbacks import EmployerControlsCallBackFactory
 from states.create_employer import CreateEmployer
 from states.create_employer_review import CreateReview
@@ -28,14 +29,13 @@ router.callback_query.middleware(UpdateUsernameMiddleware())
 router.message.middleware(UpdateUsernameMiddleware())
 
 
-@router.callback_query(EmployerControlsCallBackFactory.filter((F.control == 'data') & (F.action == 'change')))
-async def handle_change_phone(callback: CallbackQuery, callback_data: EmployerControlsCallBackFactory, state=FSMContext):
-    employer= await sync_to_async(Employer.objects.filter(tg_id=callback.from_user.id).first)()
+@router.callback_query(EmployerControlsCallBackFactory.filter((F.control == 'data') & (F.action == 'change')), flags={'profile': True})
+async def handle_change_phone(callback: CallbackQuery, callback_data: EmployerControlsCallBackFactory, state=FSMContext, employer=None):
     if employer:
         await state.clear()
         await state.set_state(CreateEmployer.input_phone)
 
-        reply_text = await sync_to_async(Text.objects.get)(slug='input_phone')
+        reply_text = await catalog.text('input_phone')
 
         try:
             await callback.message.answer(
@@ -48,10 +48,9 @@ async def handle_change_phone(callback: CallbackQuery, callback_data: EmployerCo
             pass
 
 
-@router.callback_query(EmployerControlsCallBackFactory.filter((F.control == 'proposal') & (F.action == 'make')))
-async def handle_make_proposal(callback: CallbackQuery, callback_data: EmployerControlsCallBackFactory, state=FSMContext):
+@router.callback_query(EmployerControlsCallBackFactory.filter((F.control == 'proposal') & (F.action == 'make')), flags={'profile': True})
+async def handle_make_proposal(callback: CallbackQuery, callback_data: EmployerControlsCallBackFactory, state=FSMContext, employer=None):
     worker = await sync_to_async(Worker.objects.filter(id=callback_data.object_id).first)()
-    employer = await sync_to_async(Employer.objects.filter(tg_id=callback.from_user.id).first)()
     if worker and employer:
         proposal = await sync_to_async(EmployerCooperationProposal.objects.filter(Q(worker=worker) & Q(employer=employer)).first)()
         if not proposal:
@@ -62,7 +61,7 @@ async def handle_make_proposal(callback: CallbackQuery, callback_data: EmployerC
 
             if worker.is_approved and worker.is_searching:
                 try:
-                    new_proposal_text = await sync_to_async(Text.objects.get)(slug='new_proposal')
+                    new_proposal_text = await catalog.text('new_proposal')
                     await callback.bot.send_message(
                         chat_id=worker.tg_id,
                         text=new_proposal_text.rus,
@@ -75,14 +74,13 @@ async def handle_make_proposal(callback: CallbackQuery, callback_data: EmployerC
                 await sync_to_async(proposal.save)()
         
         await callback.message.edit_reply_markup(
-            reply_markup=await keyboards.employer_worker_details_keyboard(worker.id, employer.tg_id)
+            reply_markup=await keyboards.employer_worker_details_keyboard(worker.id, employer)
         )
 
 
-@router.callback_query(EmployerControlsCallBackFactory.filter((F.control == 'proposal') & (F.action == 'resend')))
-async def handle_resend_proposal(callback: CallbackQuery, callback_data: EmployerControlsCallBackFactory, state=FSMContext):
+@router.callback_query(EmployerControlsCallBackFactory.filter((F.control == 'proposal') & (F.action == 'resend')), flags={'profile': True})
+async def handle_resend_proposal(callback: CallbackQuery, callback_data: EmployerControlsCallBackFactory, state=FSMContext, employer=None):
     worker = await sync_to_async(Worker.objects.filter(id=callback_data.object_id).first)()
-    employer = await sync_to_async(Employer.objects.filter(tg_id=callback.from_user.id).first)()
     if worker and employer:
         proposal = await sync_to_async(EmployerCooperationProposal.objects.filter(Q(worker=worker) & Q(employer=employer)).first)()
         if proposal:
@@ -92,7 +90,7 @@ async def handle_resend_proposal(callback: CallbackQuery, callback_data: Employe
 
             if worker.is_approved and worker.is_searching:
                 try:
-                    new_proposal_text = await sync_to_async(Text.objects.get)(slug='new_proposal')
+                    new_proposal_text = await catalog.text('new_proposal')
                     await callback.bot.send_message(
                         chat_id=worker.tg_id,
                         text=new_proposal_text.rus,
@@ -106,9 +104,9 @@ async def handle_resend_proposal(callback: CallbackQuery, callback_data: Employe
         
             status = await sync_to_async(lambda: proposal.readable_heb_accepted_status)()
 
-            status_text = await sync_to_async(Text.objects.get)(slug='status')
-            created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-            updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
+            status_text = await catalog.text('status')
+            created_at = await catalog.text('created_at')
+            updated_at = await catalog.text('updated_at')
 
             created_date = proposal.created_at.strftime('%d.%m.%Y')
             updated_date = proposal.updated_at.strftime('%d.%m.%Y')
@@ -127,10 +125,9 @@ async def handle_resend_proposal(callback: CallbackQuery, callback_data: Employe
                 pass
 
 
-@router.callback_query(EmployerControlsCallBackFactory.filter((F.control == 'outbox-proposal') & (F.action == 'resend')))
-async def handle_resend_outbox_proposal(callback: CallbackQuery, callback_data: EmployerControlsCallBackFactory, state=FSMContext):
+@router.callback_query(EmployerControlsCallBackFactory.filter((F.control == 'outbox-proposal') & (F.action == 'resend')), flags={'profile': True})
+async def handle_resend_outbox_proposal(callback: CallbackQuery, callback_data: EmployerControlsCallBackFactory, state=FSMContext, employer=None):
     worker = await sync_to_async(Worker.objects.filter(id=callback_data.object_id).first)()
-    employer = await sync_to_async(Employer.objects.filter(tg_id=callback.from_user.id).first)()
     if worker and employer:
         proposal = await sync_to_async(EmployerCooperationProposal.objects.filter(Q(worker=worker) & Q(employer=employer)).first)()
         if proposal:
@@ -140,7 +137,7 @@ async def handle_resend_outbox_proposal(callback: CallbackQuery, callback_data:
 
             if worker.is_approved and worker.is_searching:
                 try:
-                    new_proposal_text = await sync_to_async(Text.objects.get)(slug='new_proposal')
+                    new_proposal_text = await catalog.text('new_proposal')
                     await callback.bot.send_message(
                         chat_id=worker.tg_id,
                         text=new_proposal_text.rus,
@@ -152,21 +149,21 @@ async def handle_resend_outbox_proposal(callback: CallbackQuery, callback_data:
                 proposal.is_accepted = False
                 await sync_to_async(proposal.save)()
 
-            worker_text = await sync_to_async(Text.objects.get)(slug='worker')
-            outbox_proposal_text = await sync_to_async(Text.objects.get)(slug='outbox_proposal')
+            worker_text = await catalog.text('worker')
+            outbox_proposal_text = await catalog.text('outbox_proposal')
 
             readable_occupations = await sync_to_async(lambda: worker.readable_heb_occupations)()
 
-            occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-            min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-            about_text = await sync_to_async(Text.objects.get)(slug='about')
-            salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
+            occupations_text = await catalog.text('occupations')
+            min_salary_text = await catalog.text('min_salary')
+            about_text = await catalog.text('about')
+            salary_hourly = await catalog.text('salary_hourly')
 
             status = await sync_to_async(lambda: proposal.readable_heb_accepted_status)()
 
-            status_text = await sync_to_async(Text.objects.get)(slug='status')
-            created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-            updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
+            status_text = await catalog.text('status')
+            created_at = await catalog.text('created_at')
+            updated_at = await catalog.text('updated_at')
 
             created_date = proposal.created_at.strftime('%d.%m.%Y')
             updated_date = proposal.updated_at.strftime('%d.%m.%Y')
@@ -202,11 +199,11 @@ async def handle_inbox_proposal(callback: CallbackQuery, callback_data: Employer
         action = callback_data.action
         if action == 'accept':
             proposal.is_accepted = True
-            proposal_result = await sync_to_async(Text.objects.get)(slug='proposal_accepted')
+            proposal_result = await catalog.text('proposal_accepted')
             asyncio.create_task(worker_proposal_accepted(callback.bot, proposal.id))
         elif action == 'decline':
             proposal.is_accepted = False
-            proposal_result = await sync_to_async(Text.objects.get)(slug='proposal_declined')
+            proposal_result = await catalog.text('proposal_declined')
 
         await sync_to_async(proposal.save)()
 
@@ -219,33 +216,33 @@ async def handle_inbox_proposal(callback: CallbackQuery, callback_data: Employer
         except:
             pass
 
-        worker_text = await sync_to_async(Text.objects.get)(slug='worker')
-        job_text = await sync_to_async(Text.objects.get)(slug='job')
-        inbox_proposal_text = await sync_to_async(Text.objects.get)(slug='inbox_proposal')
+        worker_text = await catalog.text('worker')
+        job_text = await catalog.text('job')
+        inbox_proposal_text = await catalog.text('inbox_proposal')
 
         readable_occupations = await sync_to_async(lambda: worker.readable_heb_occupations)()
 
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        about_text = await sync_to_async(Text.objects.get)(slug='about')
-        salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
+        occupations_text = await catalog.text('occupations')
+        min_salary_text = await catalog.text('min_salary')
+        about_text = await catalog.text('about')
+        salary_hourly = await catalog.text('salary_hourly')
         
         readable_approve_status = await sync_to_async(lambda: job.readable_approved_status)()
         readable_active_status = await sync_to_async(lambda: job.readable_active_status)()
         readable_notifications_status = await sync_to_async(lambda: job.readable_notifications_heb_status)()
         readable_job_occupations = await sync_to_async(lambda: job.readable_heb_occupations)()
 
-        job_approved_text = await sync_to_async(Text.objects.get)(slug='job_approved_text')
-        job_active_text = await sync_to_async(Text.objects.get)(slug='is_job_active')
-        notifications_text = await sync_to_async(Text.objects.get)(slug='notifications')
+        job_approved_text = await catalog.text('job_approved_text')
+        job_active_text = await catalog.text('is_job_active')
+        notifications_text = await catalog.text('notifications')
 
-        description_text = await sync_to_async(Text.objects.get)(slug='description')
+        description_text = await catalog.text('description')
 
         status = await sync_to_async(lambda: proposal.readable_heb_accepted_status)()
 
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-        updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
+        status_text = await catalog.text('status')
+        created_at = await catalog.text('created_at')
+        updated_at = await catalog.text('updated_at')
 
         created_date = proposal.created_at.strftime('%d.%m.%Y')
         updated_date = proposal.updated_at.strftime('%d.%m.%Y')
@@ -284,7 +281,7 @@ async def handle_add_review(callback: CallbackQuery, callback_data: EmployerCont
     await state.set_state(CreateReview.rate)
     await state.update_data(worker=callback_data.object_id)
 
-    add_rate = await sync_to_async(Text.objects.get)(slug='add_rate')
+    add_rate = await catalog.text('add_rate')
 
     try:
         await callback.message.edit_text(
@@ -300,7 +297,7 @@ async def handle_rate_review(callback: CallbackQuery, callback_data: EmployerCon
     await state.set_state(CreateReview.review)
     await state.update_data(rate=callback_data.object_id)
 
-    add_review = await sync_to_async(Text.objects.get)(slug='add_review')
+    add_review = await catalog.text('add_review')
     try:
         await callback.message.edit_text(
             text=f'\u202B{add_review.heb}',
@@ -312,7 +309,7 @@ async def handle_rate_review(callback: CallbackQuery, callback_data: EmployerCon
 
 @router.callback_query(EmployerControlsCallBackFactory.filter((F.control == 'review') & (F.action == 'text')), CreateReview.review)
 async def handle_text_review(callback: CallbackQuery, callback_data: EmployerControlsCallBackFactory, state=FSMContext):
-    add_text_review = await sync_to_async(Text.objects.get)(slug='add_text_review')
+    add_text_review = await catalog.text('add_text_review')
     await callback.message.edit_text(
         text=f'\u202B{add_text_review.heb}',
         reply_markup=InlineKeyboardBuilder().as_markup(),
@@ -323,10 +320,10 @@ async def handle_text_review(callback: CallbackQuery, callback_data: EmployerCon
 async def handle_skip_text_review(callback: CallbackQuery, callback_data: EmployerControlsCallBackFactory, state=FSMContext):
     await state.set_state(CreateReview.confirmation)
 
-    confirmation_text = await sync_to_async(Text.objects.get)(slug='worker_confirmation')
-    rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-    review_text = await sync_to_async(Text.objects.get)(slug='review')
-    empty_text = await sync_to_async(Text.objects.get)(slug='empty')
+    confirmation_text = await catalog.text('worker_confirmation')
+    rate_text = await catalog.text('rate')
+    review_text = await catalog.text('review')
+    empty_text = await catalog.text('empty')
 
     state_data = await state.get_data()
     rate = state_data.get('rate')
@@ -353,9 +350,9 @@ async def handle_add_text_review(message: Message, state: FSMContext):
     await state.update_data(review=review)
     await state.set_state(CreateReview.confirmation)
     
-    confirmation_text = await sync_to_async(Text.objects.get)(slug='worker_confirmation')
-    rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-    review_text = await sync_to_async(Text.objects.get)(slug='review')
+    confirmation_text = await catalog.text('worker_confirmation')
+    rate_text = await catalog.text('rate')
+    review_text = await catalog.text('review')
 
     state_data = await state.get_data()
     rate = state_data.get('rate')
@@ -383,7 +380,7 @@ async def handle_retype_review(callback: CallbackQuery, callback_data: EmployerC
     await state.set_state(CreateReview.rate)
     await state.update_data(worker=worker_id)
 
-    add_rate = await sync_to_async(Text.objects.get)(slug='add_rate')
+    add_rate = await catalog.text('add_rate')
 
     try:
         await callback.message.edit_text(
@@ -394,8 +391,8 @@ async def handle_retype_review(callback: CallbackQuery, callback_data: EmployerC
         pass
 
 
-@router.callback_query(EmployerControlsCallBackFactory.filter((F.control == 'review') & (F.action == 'confirm')), CreateReview.confirmation)
-async def handle_confirm_review(callback: CallbackQuery, callback_data: EmployerControlsCallBackFactory, state=FSMContext):
+@router.callback_query(EmployerControlsCallBackFactory.filter((F.control == 'review') & (F.action == 'confirm')), CreateReview.confirmation, flags={'profile': True})
+async def handle_confirm_review(callback: CallbackQuery, callback_data: EmployerControlsCallBackFactory, state=FSMContext, employer=None):
     state_data = await state.get_data()
 
     worker_id = state_data.get('worker')
@@ -408,7 +405,6 @@ async def handle_confirm_review(callback: CallbackQuery, callback_data: Employer
     prev_review = await sync_to_async(EmployerReview.objects.filter(Q(worker__id=worker_id) & Q(employer__tg_id=callback.from_user.id)).first)()
     if not prev_review:
         worker = await sync_to_async(Worker.objects.filter(id=worker_id).first)()
-        employer = await sync_to_async(Employer.objects.filter(tg_id=callback.from_user.id).first)()
         new_review = await sync_to_async(EmployerReview.objects.create)(
             employer=employer,
             worker=worker,
@@ -417,7 +413,7 @@ async def handle_confirm_review(callback: CallbackQuery, callback_data: Employer
             review_rus=review_rus,
         )
 
-        review_wait_check = await sync_to_async(Text.objects.get)(slug='review_wait_check')
+        review_wait_check = await catalog.text('review_wait_check')
 
         try:
             await callback.message.edit_text(
@@ -2,14 +2,14 @@ import os
 
 import django
 from aiogram import Router, F
-from aiogram.types import Message, CallbackQuery
-from asgiref.sync import sync_to_async
+from aiogram.filters import ExceptionTypeFilter
+from aiogram.types import Message, CallbackQuery, ErrorEvent
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'work_exchange.settings')
 django.setup()
 
-from core.models import TGUser, Text
+from core import catalog, executor
 from filters import ChatTypeFilter
 
 
@@ -17,19 +17,16 @@ router = Router()
 
 
 @router.message(F.text, ChatTypeFilter(chat_type='private'))
-async def worker_contact(message: Message):
-    user_id = message.from_user.id
+async def worker_contact(message: Message, profile_status=None):
+    error_text = await catalog.text('error_input')
 
-    user = await sync_to_async(TGUser.objects.filter(tg_id=user_id).first)()
-    error_text = await sync_to_async(Text.objects.get)(slug='error_input')
-
-    if user:
-        if user.target == '1':
+    if profile_status and profile_status.target:
+        if profile_status.target == '1':
             try:
                 await message.reply(text=error_text.rus,)
             except:
                 pass
-        elif user.target == '2':
+        elif profile_status.target == '2':
             try:
                 await message.reply(text=f'\u202B{error_text.heb}',)
             except:
@@ -42,17 +39,14 @@ async def worker_contact(message: Message):
 
 
 @router.callback_query()
-async def employer_job_detail_active(callback: CallbackQuery):
+async def employer_job_detail_active(callback: CallbackQuery, profile_status=None):
     if callback.data != 'nothing':
-        user_id = callback.from_user.id
-
-        user = await sync_to_async(TGUser.objects.filter(tg_id=user_id).first)()
-        keyboard_outdated = await sync_to_async(Text.objects.get)(slug='keyboard_outdated')
+        keyboard_outdated = await catalog.text('keyboard_outdated')
 
-        if user:
-            if user.target == '1':
+        if profile_status and profile_status.target:
+            if profile_status.target == '1':
                 reply_text = keyboard_outdated.rus
-            elif user.target == '2':
+            elif profile_status.target == '2':
                 reply_text = f'\u202B{keyboard_outdated.heb}'
         else:
             reply_text = f'{keyboard_outdated.rus}\n\u202B{keyboard_outdated.heb}'
@@ -64,4 +58,16 @@ async def employer_job_detail_active(callback: CallbackQuery):
             )
         except:
             pass
-        
\ No newline at end of file
+        
+
+
+@router.errors(ExceptionTypeFilter(executor.ExecutorBusy))
+async def executor_busy(event: ErrorEvent):
+    # пул запросов к базе перегружен (core/executor.py): апдейт пропускается сразу, а не ждет в очереди,
+    # у кнопки снимаем индикатор загрузки, пользователь может нажать еще раз
+    callback = event.update.callback_query
+    if callback:
+        try:
+            await callback.answer()
+        except:
+            pass
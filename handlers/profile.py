@@ -12,7 +12,8 @@ django.setup()
 
 from keyboards import keyboards
 from middlewares.change_username import UpdateUsernameMiddleware
-from core.models import TGUser, Worker, Employer, Text
+from core.models import TGUser
+from core import catalog
 from keyboards.callbacks import TargetCallbackFactory
 from states.create_worker import CreateWorker
 from states.create_employer import CreateEmployer
@@ -23,17 +24,15 @@ router.callback_query.middleware(UpdateUsernameMiddleware())
 router.message.middleware(UpdateUsernameMiddleware())
 
 
-@router.callback_query(TargetCallbackFactory.filter())
-async def proceed_target(callback: CallbackQuery, callback_data: TargetCallbackFactory, state: FSMContext):
+@router.callback_query(TargetCallbackFactory.filter(), flags={'tg_user': True})
+async def proceed_target(callback: CallbackQuery, callback_data: TargetCallbackFactory, state: FSMContext, profile_status=None, tg_user=None):
     await state.clear()
 
     user_id = callback.from_user.id
-    user = await sync_to_async(TGUser.objects.filter(tg_id=user_id).first)()
-    if user:
-        data_outdated_text = await sync_to_async(Text.objects.get)(slug='data_outdated')
-        if user.target == '1':
-            worker = await sync_to_async(Worker.objects.filter(tg_id=user_id).first)()
-            if worker:
+    if tg_user:
+        data_outdated_text = await catalog.text('data_outdated')
+        if tg_user.target == '1':
+            if profile_status.has_profile:
                 reply_text = data_outdated_text.rus
                 try:
                     await callback.message.edit_text(
@@ -44,12 +43,11 @@ async def proceed_target(callback: CallbackQuery, callback_data: TargetCallbackF
                     pass
                 return True
             else:
-                user.target = str(callback_data.target)
-                await sync_to_async(user.save)()
+                tg_user.target = str(callback_data.target)
+                await sync_to_async(tg_user.save)()
                 
         else:
-            employer = await sync_to_async(Employer.objects.filter(tg_id=user_id).first)()
-            if employer:
+            if profile_status.has_profile:
                 reply_text = data_outdated_text.heb
                 try:
                     await callback.message.edit_text(
@@ -60,8 +58,8 @@ async def proceed_target(callback: CallbackQuery, callback_data: TargetCallbackF
                     pass
                 return True
             else:
-                user.target = str(callback_data.target)
-                await sync_to_async(user.save)()
+                tg_user.target = str(callback_data.target)
+                await sync_to_async(tg_user.save)()
 
     else:
         await sync_to_async(TGUser.objects.create)(
@@ -72,7 +70,7 @@ async def proceed_target(callback: CallbackQuery, callback_data: TargetCallbackF
     if callback_data.target == 1:
         await state.set_state(CreateWorker.input_name)
 
-        reply_text = await sync_to_async(Text.objects.get)(slug='worker_name')
+        reply_text = await catalog.text('worker_name')
 
         try:
             await callback.message.edit_text(
@@ -85,7 +83,7 @@ async def proceed_target(callback: CallbackQuery, callback_data: TargetCallbackF
     elif callback_data.target == 2:
         await state.set_state(CreateEmployer.input_phone)
 
-        reply_text = await sync_to_async(Text.objects.get)(slug='input_phone')
+        reply_text = await catalog.text('input_phone')
 
         try:
             await callback.message.answer(
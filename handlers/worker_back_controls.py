@@ -3,7 +3,6 @@ import os
 import django
 from aiogram import Router, F
 from aiogram.types import CallbackQuery
-from asgiref.sync import sync_to_async
 from aiogram.fsm.context import FSMContext
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'work_exchange.settings')
@@ -12,7 +11,7 @@ django.setup()
 from states.pages_navigation import PageNavigation
 from middlewares.change_username import UpdateUsernameMiddleware
 from middlewares.worker_active_profile import IsActiveProfileMiddleware
-from core.models import Text
+from core import catalog
 from keyboards.callbacks import WorkerBackCallBackFactory
 from keyboards import keyboards
 
@@ -26,7 +25,7 @@ router.callback_query.middleware(IsActiveProfileMiddleware())
 async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerBackCallBackFactory, state=FSMContext):
     await state.clear()
 
-    choose_menu_section = await sync_to_async(Text.objects.get)(slug='choose_menu_section')
+    choose_menu_section = await catalog.text('choose_menu_section')
 
     try:
         await callback.message.edit_text(
@@ -37,17 +36,18 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerB
         pass
     
 
-@router.callback_query(WorkerBackCallBackFactory.filter(F.destination == 'jobs-list'), PageNavigation.page_navigation)
-async def back_jobs_list(callback: CallbackQuery, callback_data: WorkerBackCallBackFactory, state=FSMContext):
+@router.callback_query(WorkerBackCallBackFactory.filter(F.destination == 'jobs-list'), PageNavigation.page_navigation, flags={'profile': True})
+async def back_jobs_list(callback: CallbackQuery, callback_data: WorkerBackCallBackFactory, state=FSMContext, worker=None):
     state_data = await state.get_data()
     page = state_data.get('page')
     destination = state_data.get('destination')
+    cursor = state_data.get('cursor', '')
 
     if page and destination:
         if destination == 'all-jobs':
-            reply_text = await sync_to_async(Text.objects.get)(slug='all_jobs')
+            reply_text = await catalog.text('all_jobs')
         elif destination == 'suitable-jobs':
-            reply_text = await sync_to_async(Text.objects.get)(slug='jobs_suitable')
+            reply_text = await catalog.text('jobs_suitable')
 
         try:
             await callback.message.edit_text(
@@ -55,7 +55,8 @@ async def back_jobs_list(callback: CallbackQuery, callback_data: WorkerBackCallB
                 reply_markup=await keyboards.worker_jobs_list_keyboard(
                     page, 
                     destination, 
-                    callback.from_user.id),
+                    worker,
+                    cursor),
             )
         except:
             pass
@@ -63,7 +64,7 @@ async def back_jobs_list(callback: CallbackQuery, callback_data: WorkerBackCallB
     else:
         await state.clear()
 
-        choose_jobs_type = await sync_to_async(Text.objects.get)(slug='choose_jobs_type')
+        choose_jobs_type = await catalog.text('choose_jobs_type')
 
         try:
             await callback.message.edit_text(
@@ -78,7 +79,7 @@ async def back_jobs_list(callback: CallbackQuery, callback_data: WorkerBackCallB
 async def back_jobs_section(callback: CallbackQuery, callback_data: WorkerBackCallBackFactory, state=FSMContext):
     await state.clear()
 
-    choose_jobs_type = await sync_to_async(Text.objects.get)(slug='choose_jobs_type')
+    choose_jobs_type = await catalog.text('choose_jobs_type')
 
     try:
         await callback.message.edit_text(
@@ -89,17 +90,17 @@ async def back_jobs_section(callback: CallbackQuery, callback_data: WorkerBackCa
         pass
 
 
-@router.callback_query(WorkerBackCallBackFactory.filter(F.destination == 'proposals-list'), PageNavigation.page_navigation)
-async def back_proposals_list(callback: CallbackQuery, callback_data: WorkerBackCallBackFactory, state=FSMContext):
+@router.callback_query(WorkerBackCallBackFactory.filter(F.destination == 'proposals-list'), PageNavigation.page_navigation, flags={'profile': True})
+async def back_proposals_list(callback: CallbackQuery, callback_data: WorkerBackCallBackFactory, state=FSMContext, worker=None):
     state_data = await state.get_data()
     page = state_data.get('page')
     destination = state_data.get('destination')
 
     if page and destination:
         if destination == 'inbox-proposals':
-            reply_text = await sync_to_async(Text.objects.get)(slug='inbox_proposals')
+            reply_text = await catalog.text('inbox_proposals')
         elif destination == 'outbox-proposals':
-            reply_text = await sync_to_async(Text.objects.get)(slug='outbox_proposals')
+            reply_text = await catalog.text('outbox_proposals')
 
         try:
             await callback.message.edit_text(
@@ -107,7 +108,7 @@ async def back_proposals_list(callback: CallbackQuery, callback_data: WorkerBack
                 reply_markup=await keyboards.worker_proposals_list_keyboard(
                     page, 
                     destination, 
-                    callback.from_user.id),
+                    worker),
             )
         except:
             pass
@@ -115,7 +116,7 @@ async def back_proposals_list(callback: CallbackQuery, callback_data: WorkerBack
     else:
         await state.clear()
 
-        choose_proposals_type = await sync_to_async(Text.objects.get)(slug='choose_proposals_type')
+        choose_proposals_type = await catalog.text('choose_proposals_type')
 
         try:
             await callback.message.edit_text(
@@ -130,7 +131,7 @@ async def back_proposals_list(callback: CallbackQuery, callback_data: WorkerBack
 async def back_proposals_section(callback: CallbackQuery, callback_data: WorkerBackCallBackFactory, state=FSMContext):
     await state.clear()
 
-    choose_proposals_type = await sync_to_async(Text.objects.get)(slug='choose_proposals_type')
+    choose_proposals_type = await catalog.text('choose_proposals_type')
 
     try:
         await callback.message.edit_text(
@@ -141,17 +142,17 @@ async def back_proposals_section(callback: CallbackQuery, callback_data: WorkerB
         pass
 
 
-@router.callback_query(WorkerBackCallBackFactory.filter(F.destination == 'reviews-list'), PageNavigation.page_navigation)
-async def back_reviews_list(callback: CallbackQuery, callback_data: WorkerBackCallBackFactory, state=FSMContext):
+@router.callback_query(WorkerBackCallBackFactory.filter(F.destination == 'reviews-list'), PageNavigation.page_navigation, flags={'profile': True})
+async def back_reviews_list(callback: CallbackQuery, callback_data: WorkerBackCallBackFactory, state=FSMContext, worker=None):
     state_data = await state.get_data()
     page = state_data.get('page')
     destination = state_data.get('destination')
 
     if page and destination:
         if destination == 'outbox-reviews':
-            reply_text = await sync_to_async(Text.objects.get)(slug='outbox_reviews')
+            reply_text = await catalog.text('outbox_reviews')
         elif destination == 'inbox-reviews':
-            reply_text = await sync_to_async(Text.objects.get)(slug='inbox_reviews')
+            reply_text = await catalog.text('inbox_reviews')
 
         try:
             await callback.message.edit_text(
@@ -159,7 +160,7 @@ async def back_reviews_list(callback: CallbackQuery, callback_data: WorkerBackCa
                 reply_markup=await keyboards.worker_reviews_list_keyboard(
                     page, 
                     destination, 
-                    callback.from_user.id),
+                    worker),
             )
         except:
             pass
@@ -167,7 +168,7 @@ async def back_reviews_list(callback: CallbackQuery, callback_data: WorkerBackCa
     else:
         await state.clear()
 
-        choose_reviews_type = await sync_to_async(Text.objects.get)(slug='choose_reviews_type')
+        choose_reviews_type = await catalog.text('choose_reviews_type')
 
         try:
             await callback.message.edit_text(
@@ -182,7 +183,7 @@ async def back_reviews_list(callback: CallbackQuery, callback_data: WorkerBackCa
 async def back_reviews_section(callback: CallbackQuery, callback_data: WorkerBackCallBackFactory, state=FSMContext):
     await state.clear()
 
-    choose_reviews_type = await sync_to_async(Text.objects.get)(slug='choose_reviews_type')
+    choose_reviews_type = await catalog.text('choose_reviews_type')
 
     try:
         await callback.message.edit_text(
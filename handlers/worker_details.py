@@ -1,7 +1,6 @@
 import os
 
 import django
-from django.db.models import Q
 from aiogram import Router, F
 from aiogram.types import CallbackQuery
 from asgiref.sync import sync_to_async
@@ -14,85 +13,85 @@ from config import MAX_SYMBOLS
 from middlewares.change_username import UpdateUsernameMiddleware
 from middlewares.worker_active_profile import IsActiveProfileMiddleware
 from states.pages_navigation import PageNavigation
-from core.models import (Text, Job, Employer, WorkerCooperationProposal, 
+from core.models import (Text, Job, Employer,
                          EmployerCooperationProposal, EmployerReview, WorkerReview)
+from core import catalog, repo
 from keyboards.callbacks import WorkerDetailsCallBackFactory, WorkerRedirectDetailsCallBackFactory
 from keyboards import keyboards
 
 
+JOB_TEXTS = Text.objects.require(
+    'min_salary', 'salary_hourly', 'occupations', 'description', 'rating_employer',
+    'employer_company_name',
+)
+PROPOSAL_TEXTS = Text.objects.require('status', 'created_at', 'updated_at')
+OUTBOX_PROPOSAL_TEXTS = Text.objects.require(
+    'job', 'outbox_proposal', 'occupations', 'min_salary', 'description', 'salary_hourly',
+    'status', 'created_at', 'updated_at', 'rating_employer', 'employer_company_name',
+)
+INBOX_PROPOSAL_TEXTS = Text.objects.require(
+    'employer', 'inbox_proposal', 'jobs', 'status', 'created_at', 'updated_at', 'rating_employer',
+    'employer_company_name',
+)
+EMPLOYER_JOBS_TEXTS = Text.objects.require(
+    'min_salary', 'salary_hourly', 'occupations', 'description', 'employer_company_name',
+)
+INBOX_REVIEW_TEXTS = Text.objects.require('inbox_review', 'rate', 'review', 'created_at')
+OUTBOX_REVIEW_TEXTS = Text.objects.require('outbox_review', 'status', 'rate', 'review', 'created_at')
+REVIEWS_TEXTS = Text.objects.require('rate', 'review', 'created_at')
+
+
 router = Router()
 router.callback_query.middleware(UpdateUsernameMiddleware())
 router.callback_query.middleware(IsActiveProfileMiddleware())
 
 
-@router.callback_query(WorkerDetailsCallBackFactory.filter(F.object_name == 'job'))
-async def view_detailed_job(callback: CallbackQuery, callback_data: WorkerDetailsCallBackFactory, state=FSMContext):
-    job_id = callback_data.object_id
-    job = await sync_to_async(Job.objects.filter(id=job_id).first)()
+@router.callback_query(WorkerDetailsCallBackFactory.filter(F.object_name == 'job'), flags={'profile': True})
+async def view_detailed_job(callback: CallbackQuery, callback_data: WorkerDetailsCallBackFactory, state=FSMContext, worker=None):
+    job = await repo.job_card(callback_data.object_id, 'rus')
     if job:
-        readable_occupations = await sync_to_async(lambda: job.readable_rus_occupations)()
-        
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        salary_hourly_text = await sync_to_async(Text.objects.get)(slug='salary_hourly')
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        description_text = await sync_to_async(Text.objects.get)(slug='description')
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating_employer')
-
-        employer = await sync_to_async(lambda: job.employer)()
-        rating = await sync_to_async(lambda: employer.rating_rus)()
-        employer_name_text = await sync_to_async(Text.objects.get)(slug='employer_company_name')
+        texts = await Text.objects.aresolve(*JOB_TEXTS, lang='rus')
         
         reply_text = f'''
-                      *{occupations_text.rus}* {readable_occupations}\
-                      \n*{employer_name_text.rus}* {employer.name}\
-                      \n*{rating_text.rus}* {rating}\
-                      \n*{min_salary_text.rus}* {job.min_salary} {salary_hourly_text.rus}\
-                      \n*{description_text.rus}* {job.description_rus}\
+                      *{texts.occupations}* {job.occupations}\
+                      \n*{texts.employer_company_name}* {job.employer_name}\
+                      \n*{texts.rating_employer}* {job.employer_rating}\
+                      \n*{texts.min_salary}* {job.min_salary} {texts.salary_hourly}\
+                      \n*{texts.description}* {job.description}\
                       '''
 
         try:
             await callback.message.edit_text(
                 text=reply_text,
-                reply_markup=await keyboards.worker_job_details_keyboard(job.id, callback.from_user.id),
+                reply_markup=await keyboards.worker_job_details_keyboard(job.id, worker),
                 parse_mode='Markdown',
             )
         except:
             pass
 
 
-@router.callback_query(WorkerRedirectDetailsCallBackFactory.filter(F.object_name == 'job'))
-async def view_detailed_job(callback: CallbackQuery, callback_data: WorkerRedirectDetailsCallBackFactory, state=FSMContext):
-    job_id = callback_data.object_id
-    job = await sync_to_async(Job.objects.filter(id=job_id).first)()
+@router.callback_query(WorkerRedirectDetailsCallBackFactory.filter(F.object_name == 'job'), flags={'profile': True})
+async def view_detailed_job(callback: CallbackQuery, callback_data: WorkerRedirectDetailsCallBackFactory, state=FSMContext, worker=None):
+    job = await repo.job_card(callback_data.object_id, 'rus')
     if job:
         await state.clear()
         await state.set_state(PageNavigation.page_navigation)
         await state.set_data({'destination': callback_data.redirect, 'page': 1})
         
-        readable_occupations = await sync_to_async(lambda: job.readable_rus_occupations)()
+        texts = await Text.objects.aresolve(*JOB_TEXTS, lang='rus')
         
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        salary_hourly_text = await sync_to_async(Text.objects.get)(slug='salary_hourly')
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        description_text = await sync_to_async(Text.objects.get)(slug='description')
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating_employer')
-        employer_name_text = await sync_to_async(Text.objects.get)(slug='employer_company_name')
-
-        employer = await sync_to_async(lambda: job.employer)()
-        rating = await sync_to_async(lambda: employer.rating_rus)()
-
         reply_text = f'''
-                      *{occupations_text.rus}* {readable_occupations}\
-                      \n*{employer_name_text.rus}* {employer.name}\
-                      \n*{rating_text.rus}* {rating}\
-                      \n*{min_salary_text.rus}* {job.min_salary} {salary_hourly_text.rus}\
-                      \n*{description_text.rus}* {job.description_rus}\
+                      *{texts.occupations}* {job.occupations}\
+                      \n*{texts.employer_company_name}* {job.employer_name}\
+                      \n*{texts.rating_employer}* {job.employer_rating}\
+                      \n*{texts.min_salary}* {job.min_salary} {texts.salary_hourly}\
+                      \n*{texts.description}* {job.description}\
                       '''
 
         try:
             await callback.message.edit_text(
                 text=reply_text,
-                reply_markup=await keyboards.worker_job_details_keyboard(job.id, callback.from_user.id),
+                reply_markup=await keyboards.worker_job_details_keyboard(job.id, worker),
                 parse_mode='Markdown',
             ) 
         except:
@@ -102,25 +101,21 @@ async def view_detailed_job(callback: CallbackQuery, callback_data: WorkerRedire
 @router.callback_query(WorkerDetailsCallBackFactory.filter(F.object_name == 'proposal'))
 async def view_detailed_proposal(callback: CallbackQuery, callback_data: WorkerDetailsCallBackFactory, state=FSMContext):
     proposal_id = callback_data.object_id
-    proposal = await sync_to_async(WorkerCooperationProposal.objects.filter(id=proposal_id).first)()
+    proposal = await repo.worker_proposal_card(proposal_id, 'rus')
 
     if proposal:
-        status = await sync_to_async(lambda: proposal.readable_rus_accepted_status)()
-
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-        updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
+        texts = await Text.objects.aresolve(*PROPOSAL_TEXTS, lang='rus')
 
         created_date = proposal.created_at.strftime('%d.%m.%Y')
         updated_date = proposal.updated_at.strftime('%d.%m.%Y')
 
         reply_text = f'''
-                    *{status_text.rus}* {status}\
-                    \n*{created_at.rus}* {created_date}\
-                    \n*{updated_at.rus}* {updated_date}\
+                    *{texts.status}* {proposal.status}\
+                    \n*{texts.created_at}* {created_date}\
+                    \n*{texts.updated_at}* {updated_date}\
                     '''
         
-        job = await sync_to_async(lambda: proposal.job)()
+        job = proposal.job
 
         try:
             await callback.message.edit_text(
@@ -134,47 +129,26 @@ async def view_detailed_proposal(callback: CallbackQuery, callback_data: WorkerD
 
 @router.callback_query(WorkerDetailsCallBackFactory.filter(F.object_name == 'outbox-proposal'))
 async def view_detailed_outbox_proposal(callback: CallbackQuery, callback_data: WorkerDetailsCallBackFactory, state=FSMContext):
-    proposal_id = callback_data.object_id
-    proposal = await sync_to_async(WorkerCooperationProposal.objects.filter(id=proposal_id).first)()
-    job = await sync_to_async(lambda: proposal.job)()
-    if job and proposal:
-        job_text = await sync_to_async(Text.objects.get)(slug='job')
-        outbox_proposal_text = await sync_to_async(Text.objects.get)(slug='outbox_proposal')
-
-        readable_occupations = await sync_to_async(lambda: job.readable_rus_occupations)()
-
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        description_text = await sync_to_async(Text.objects.get)(slug='description')
-        salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
-
-        status = await sync_to_async(lambda: proposal.readable_rus_accepted_status)()
-
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-        updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
+    proposal = await repo.worker_proposal_card(callback_data.object_id, 'rus')
+    if proposal:
+        job = proposal.job
+        texts = await Text.objects.aresolve(*OUTBOX_PROPOSAL_TEXTS, lang='rus')
 
         created_date = proposal.created_at.strftime('%d.%m.%Y')
         updated_date = proposal.updated_at.strftime('%d.%m.%Y')
 
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating_employer')
-        employer_name_text = await sync_to_async(Text.objects.get)(slug='employer_company_name')
-
-        employer = await sync_to_async(lambda: job.employer)()
-        rating = await sync_to_async(lambda: employer.rating_rus)()
-
         reply_text = f'''
-                *{job_text.rus}*\
-                \n*{employer_name_text.rus}* {employer.name}\
-                \n*{occupations_text.rus}* {readable_occupations}\
-                \n*{rating_text.rus}* {rating}\
-                \n*{min_salary_text.rus}* {job.min_salary} {salary_hourly.rus}\
-                \n*{description_text.rus}* {job.description_rus}\
+                *{texts.job}*\
+                \n*{texts.employer_company_name}* {job.employer_name}\
+                \n*{texts.occupations}* {job.occupations}\
+                \n*{texts.rating_employer}* {job.employer_rating}\
+                \n*{texts.min_salary}* {job.min_salary} {texts.salary_hourly}\
+                \n*{texts.description}* {job.description}\
                 \n\
-                \n*{outbox_proposal_text.rus}*\
-                \n*{status_text.rus}* {status}\
-                \n*{created_at.rus}* {created_date}\
-                \n*{updated_at.rus}* {updated_date}\
+                \n*{texts.outbox_proposal}*\
+                \n*{texts.status}* {proposal.status}\
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.updated_at}* {updated_date}\
                 '''
 
         try:
@@ -189,51 +163,30 @@ async def view_detailed_outbox_proposal(callback: CallbackQuery, callback_data:
 
 @router.callback_query(WorkerRedirectDetailsCallBackFactory.filter(F.object_name == 'outbox-proposal'))
 async def view_detailed_outbox_proposal_redirect(callback: CallbackQuery, callback_data: WorkerRedirectDetailsCallBackFactory, state=FSMContext):
-    proposal_id = callback_data.object_id
-    proposal = await sync_to_async(WorkerCooperationProposal.objects.filter(id=proposal_id).first)()
-    job = await sync_to_async(lambda: proposal.job)()
-    if job and proposal:
+    proposal = await repo.worker_proposal_card(callback_data.object_id, 'rus')
+    if proposal:
+        job = proposal.job
         await state.clear()
         await state.set_state(PageNavigation.page_navigation)
         await state.set_data({'destination': callback_data.redirect, 'page': 1})
 
-        job_text = await sync_to_async(Text.objects.get)(slug='job')
-        outbox_proposal_text = await sync_to_async(Text.objects.get)(slug='outbox_proposal')
-
-        readable_occupations = await sync_to_async(lambda: job.readable_rus_occupations)()
-
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        description_text = await sync_to_async(Text.objects.get)(slug='description')
-        salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
-
-        status = await sync_to_async(lambda: proposal.readable_rus_accepted_status)()
-
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-        updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
+        texts = await Text.objects.aresolve(*OUTBOX_PROPOSAL_TEXTS, lang='rus')
 
         created_date = proposal.created_at.strftime('%d.%m.%Y')
         updated_date = proposal.updated_at.strftime('%d.%m.%Y')
 
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating_employer')
-        employer_name_text = await sync_to_async(Text.objects.get)(slug='employer_company_name')
-
-        employer = await sync_to_async(lambda: job.employer)()
-        rating = await sync_to_async(lambda: employer.rating_rus)()
-
         reply_text = f'''
-                *{job_text.rus}*\
-                \n*{employer_name_text.rus}* {employer.name}\
-                \n*{occupations_text.rus}* {readable_occupations}\
-                \n*{rating_text.rus}* {rating}\
-                \n*{min_salary_text.rus}* {job.min_salary} {salary_hourly.rus}\
-                \n*{description_text.rus}* {job.description_rus}\
+                *{texts.job}*\
+                \n*{texts.employer_company_name}* {job.employer_name}\
+                \n*{texts.occupations}* {job.occupations}\
+                \n*{texts.rating_employer}* {job.employer_rating}\
+                \n*{texts.min_salary}* {job.min_salary} {texts.salary_hourly}\
+                \n*{texts.description}* {job.description}\
                 \n\
-                \n*{outbox_proposal_text.rus}*\
-                \n*{status_text.rus}* {status}\
-                \n*{created_at.rus}* {created_date}\
-                \n*{updated_at.rus}* {updated_date}\
+                \n*{texts.outbox_proposal}*\
+                \n*{texts.status}* {proposal.status}\
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.updated_at}* {updated_date}\
                 '''
 
         try:
@@ -248,51 +201,33 @@ async def view_detailed_outbox_proposal_redirect(callback: CallbackQuery, callba
 
 @router.callback_query(WorkerDetailsCallBackFactory.filter(F.object_name == 'inbox-proposal'))
 async def view_detailed_inbox_proposal(callback: CallbackQuery, callback_data: WorkerDetailsCallBackFactory, state=FSMContext):
-    proposal_id = callback_data.object_id
-    proposal = await sync_to_async(EmployerCooperationProposal.objects.filter(id=proposal_id).first)()
-    employer = await sync_to_async(lambda: proposal.employer)()
-    if employer and proposal:
-        employer_text = await sync_to_async(Text.objects.get)(slug='employer')
-        inbox_proposal_text = await sync_to_async(Text.objects.get)(slug='inbox_proposal')
-
-        jobs = await sync_to_async(Text.objects.get)(slug='jobs')
-        occupations = await sync_to_async(lambda: employer.readable_occupations)()
-
-        min_min_salary = await sync_to_async(lambda: employer.min_min_salary)()
-        max_min_salary = await sync_to_async(lambda: employer.max_min_salary)()
-        if min_min_salary == max_min_salary:
-            min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-            salary_info = f'*{min_salary_text.rus}* {min_min_salary}'
-        else:
-            min_salary_text = await sync_to_async(Text.objects.get)(slug='min_min_salary')
-            max_salary_text = await sync_to_async(Text.objects.get)(slug='max_min_salary')
-            salary_info = f'*{min_salary_text.rus}* {min_min_salary}\n*{max_salary_text.rus}* {max_min_salary}'
-
-        status = await sync_to_async(lambda: proposal.readable_rus_accepted_status)()
+    proposal = await repo.employer_proposal_card(callback_data.object_id, 'rus')
+    if proposal:
+        employer = proposal.employer
+        texts = await Text.objects.aresolve(*INBOX_PROPOSAL_TEXTS, lang='rus')
 
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-        updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
+        if employer.min_salary == employer.max_salary:
+            min_salary_text = await catalog.text('min_salary')
+            salary_info = f'*{min_salary_text.rus}* {employer.min_salary}'
+        else:
+            min_salary_text = await catalog.text('min_min_salary')
+            max_salary_text = await catalog.text('max_min_salary')
+            salary_info = f'*{min_salary_text.rus}* {employer.min_salary}\n*{max_salary_text.rus}* {employer.max_salary}'
 
         created_date = proposal.created_at.strftime('%d.%m.%Y')
         updated_date = proposal.updated_at.strftime('%d.%m.%Y')
 
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating_employer')
-        employer_name_text = await sync_to_async(Text.objects.get)(slug='employer_company_name')
-
-        rating = await sync_to_async(lambda: employer.rating_rus)()
-
         reply_text = f'''
-                *{employer_text.rus}*\
-                \n*{employer_name_text.rus}* {employer.name}\
-                \n*{jobs.rus}* {occupations}\
-                \n*{rating_text.rus}* {rating}\
+                *{texts.employer}*\
+                \n*{texts.employer_company_name}* {employer.name}\
+                \n*{texts.jobs}* {employer.occupations}\
+                \n*{texts.rating_employer}* {employer.rating}\
                 \n{salary_info}\
                 \n\
-                \n*{inbox_proposal_text.rus}*\
-                \n*{status_text.rus}* {status}\
-                \n*{created_at.rus}* {created_date}\
-                \n*{updated_at.rus}* {updated_date}\
+                \n*{texts.inbox_proposal}*\
+                \n*{texts.status}* {proposal.status}\
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.updated_at}* {updated_date}\
                 '''
 
         try:
@@ -307,55 +242,37 @@ async def view_detailed_inbox_proposal(callback: CallbackQuery, callback_data: W
 
 @router.callback_query(WorkerRedirectDetailsCallBackFactory.filter(F.object_name == 'inbox-proposal'))
 async def view_detailed_inbox_proposal_redirect(callback: CallbackQuery, callback_data: WorkerRedirectDetailsCallBackFactory, state=FSMContext):
-    proposal_id = callback_data.object_id
-    proposal = await sync_to_async(EmployerCooperationProposal.objects.filter(id=proposal_id).first)()
-    employer = await sync_to_async(lambda: proposal.employer)()
-    if employer and proposal:
+    proposal = await repo.employer_proposal_card(callback_data.object_id, 'rus')
+    if proposal:
+        employer = proposal.employer
         await state.clear()
         await state.set_state(PageNavigation.page_navigation)
         await state.set_data({'destination': callback_data.redirect, 'page': 1})
 
-        employer_text = await sync_to_async(Text.objects.get)(slug='employer')
-        inbox_proposal_text = await sync_to_async(Text.objects.get)(slug='inbox_proposal')
-
-        jobs = await sync_to_async(Text.objects.get)(slug='jobs')
-        occupations = await sync_to_async(lambda: employer.readable_occupations)()
+        texts = await Text.objects.aresolve(*INBOX_PROPOSAL_TEXTS, lang='rus')
 
-        min_min_salary = await sync_to_async(lambda: employer.min_min_salary)()
-        max_min_salary = await sync_to_async(lambda: employer.max_min_salary)()
-        if min_min_salary == max_min_salary:
-            min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-            salary_info = f'*{min_salary_text.rus}* {min_min_salary}'
+        if employer.min_salary == employer.max_salary:
+            min_salary_text = await catalog.text('min_salary')
+            salary_info = f'*{min_salary_text.rus}* {employer.min_salary}'
         else:
-            min_salary_text = await sync_to_async(Text.objects.get)(slug='min_min_salary')
-            max_salary_text = await sync_to_async(Text.objects.get)(slug='max_min_salary')
-            salary_info = f'*{min_salary_text.rus}* {min_min_salary}\n*{max_salary_text.rus}* {max_min_salary}'
-
-        status = await sync_to_async(lambda: proposal.readable_rus_accepted_status)()
-
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-        updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
+            min_salary_text = await catalog.text('min_min_salary')
+            max_salary_text = await catalog.text('max_min_salary')
+            salary_info = f'*{min_salary_text.rus}* {employer.min_salary}\n*{max_salary_text.rus}* {employer.max_salary}'
 
         created_date = proposal.created_at.strftime('%d.%m.%Y')
         updated_date = proposal.updated_at.strftime('%d.%m.%Y')
 
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating_employer')
-        employer_name_text = await sync_to_async(Text.objects.get)(slug='employer_company_name')
-        
-        rating = await sync_to_async(lambda: employer.rating_rus)()
-
         reply_text = f'''
-                *{employer_text.rus}*\
-                \n*{employer_name_text.rus}* {employer.name}\
-                \n*{jobs.rus}* {occupations}\
-                \n*{rating_text.rus}* {rating}\
+                *{texts.employer}*\
+                \n*{texts.employer_company_name}* {employer.name}\
+                \n*{texts.jobs}* {employer.occupations}\
+                \n*{texts.rating_employer}* {employer.rating}\
                 \n{salary_info}\
                 \n\
-                \n*{inbox_proposal_text.rus}*\
-                \n*{status_text.rus}* {status}\
-                \n*{created_at.rus}* {created_date}\
-                \n*{updated_at.rus}* {updated_date}\
+                \n*{texts.inbox_proposal}*\
+                \n*{texts.status}* {proposal.status}\
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.updated_at}* {updated_date}\
                 '''
 
         try:
@@ -371,25 +288,18 @@ async def view_detailed_inbox_proposal_redirect(callback: CallbackQuery, callbac
 @router.callback_query(WorkerDetailsCallBackFactory.filter(F.object_name == 'jobs'))
 async def view_detailed_employer_jobs(callback: CallbackQuery, callback_data: WorkerDetailsCallBackFactory, state=FSMContext):
     proposal_id = callback_data.object_id
-    proposal = await sync_to_async(EmployerCooperationProposal.objects.filter(id=proposal_id).first)()
-    if proposal:
-        employer = await sync_to_async(lambda: proposal.employer)()
-        jobs = await sync_to_async(lambda: list(employer.jobs.filter(Q(is_approved=True) & Q(is_active=True)).order_by('-min_salary').all()))()
+    employer_jobs = await repo.employer_proposal_jobs(proposal_id, 'rus')
+    if employer_jobs:
+        employer_name, jobs = employer_jobs
         if jobs:
-            min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-            salary_hourly_text = await sync_to_async(Text.objects.get)(slug='salary_hourly')
-            occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-            description_text = await sync_to_async(Text.objects.get)(slug='description')
-            employer_name_text = await sync_to_async(Text.objects.get)(slug='employer_company_name')
+            texts = await Text.objects.aresolve(*EMPLOYER_JOBS_TEXTS, lang='rus')
 
             reply_texts = []
-            reply_text = f'*{employer_name_text.rus}* {employer.name}'
+            reply_text = f'*{texts.employer_company_name}* {employer_name}'
             for job in jobs:
-                readable_occupations = await sync_to_async(lambda: job.readable_rus_occupations)()
-
-                added_text = f'''\n\n*{occupations_text.rus}* {readable_occupations}\
-                                \n*{min_salary_text.rus}* {job.min_salary} {salary_hourly_text.rus}\
-                                \n*{description_text.rus}* {job.description_rus}\
+                added_text = f'''\n\n*{texts.occupations}* {job.occupations}\
+                                \n*{texts.min_salary}* {job.min_salary} {texts.salary_hourly}\
+                                \n*{texts.description}* {job.description}\
                                 '''
 
                 if len(reply_text) + len(added_text) > MAX_SYMBOLS:
@@ -405,7 +315,7 @@ async def view_detailed_employer_jobs(callback: CallbackQuery, callback_data: Wo
                 try:    
                     await callback.message.edit_text(
                         text=reply_texts[0],
-                        reply_markup=await keyboards.worker_proposal_detail_back_only(proposal.id),
+                        reply_markup=await keyboards.worker_proposal_detail_back_only(proposal_id),
                         parse_mode='Markdown',
                     )
                 except:
@@ -416,7 +326,7 @@ async def view_detailed_employer_jobs(callback: CallbackQuery, callback_data: Wo
                         try:
                             await callback.message.answer(
                                 text=reply_texts[0],
-                                reply_markup=await keyboards.worker_proposal_detail_back_only(proposal.id),
+                                reply_markup=await keyboards.worker_proposal_detail_back_only(proposal_id),
                                 parse_mode='Markdown',
                             )
                         except:
@@ -440,24 +350,20 @@ async def view_detailed_inbox_review(callback: CallbackQuery, callback_data: Wor
     review_id = callback_data.object_id
     review = await sync_to_async(EmployerReview.objects.filter(id=review_id).first)()
     if review:
-        title = await sync_to_async(Text.objects.get)(slug='inbox_review')
-
-        rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-        review_text = await sync_to_async(Text.objects.get)(slug='review')
-        created_text = await sync_to_async(Text.objects.get)(slug='created_at')
+        texts = await Text.objects.aresolve(*INBOX_REVIEW_TEXTS, lang='rus')
 
         created_date = review.created_at.strftime('%d.%m.%Y')
 
         comment = review.review_rus
         if not comment:
-            comment = await sync_to_async(Text.objects.get)(slug='empty')
+            comment = await catalog.text('empty')
             comment = comment.rus
 
-        reply_text = f'''*{title.rus}*\
+        reply_text = f'''*{texts.inbox_review}*\
                 \n\
-                \n*{created_text.rus}* {created_date}\
-                \n*{rate_text.rus}* {review.rate} ⭐️\
-                \n*{review_text.rus}* {comment}'''
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.rate}* {review.rate} ⭐️\
+                \n*{texts.review}* {comment}'''
 
         try:
             await callback.message.edit_text(
@@ -478,24 +384,20 @@ async def view_detailed_inbox_review_redirect(callback: CallbackQuery, callback_
         await state.set_state(PageNavigation.page_navigation)
         await state.set_data({'destination': callback_data.redirect, 'page': 1})
 
-        title = await sync_to_async(Text.objects.get)(slug='inbox_review')
-
-        rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-        review_text = await sync_to_async(Text.objects.get)(slug='review')
-        created_text = await sync_to_async(Text.objects.get)(slug='created_at')
+        texts = await Text.objects.aresolve(*INBOX_REVIEW_TEXTS, lang='rus')
 
         created_date = review.created_at.strftime('%d.%m.%Y')
 
         comment = review.review_rus
         if not comment:
-            comment = await sync_to_async(Text.objects.get)(slug='empty')
+            comment = await catalog.text('empty')
             comment = comment.rus
 
-        reply_text = f'''*{title.rus}*\
+        reply_text = f'''*{texts.inbox_review}*\
                 \n\
-                \n*{created_text.rus}* {created_date}\
-                \n*{rate_text.rus}* {review.rate} ⭐️\
-                \n*{review_text.rus}* {comment}'''
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.rate}* {review.rate} ⭐️\
+                \n*{texts.review}* {comment}'''
 
         try:
             await callback.message.edit_text(
@@ -512,27 +414,22 @@ async def view_detailed_outbox_review(callback: CallbackQuery, callback_data: Wo
     review_id = callback_data.object_id
     review = await sync_to_async(WorkerReview.objects.filter(id=review_id).first)()
     if review:
-        title = await sync_to_async(Text.objects.get)(slug='outbox_review')
-
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-        review_text = await sync_to_async(Text.objects.get)(slug='review')
-        created_text = await sync_to_async(Text.objects.get)(slug='created_at')
+        texts = await Text.objects.aresolve(*OUTBOX_REVIEW_TEXTS, lang='rus')
 
         created_date = review.created_at.strftime('%d.%m.%Y')
         status = await sync_to_async(lambda: review.readable_approved_status)()
 
         comment = review.review
         if not comment:
-            comment = await sync_to_async(Text.objects.get)(slug='empty')
+            comment = await catalog.text('empty')
             comment = comment.rus
 
-        reply_text = f'''*{title.rus}*\
+        reply_text = f'''*{texts.outbox_review}*\
                 \n\
-                \n*{status_text.rus}* {status}\
-                \n*{created_text.rus}* {created_date}\
-                \n*{rate_text.rus}* {review.rate} ⭐️\
-                \n*{review_text.rus}* {comment}'''
+                \n*{texts.status}* {status}\
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.rate}* {review.rate} ⭐️\
+                \n*{texts.review}* {comment}'''
 
         try:
             await callback.message.edit_text(
@@ -553,27 +450,22 @@ async def view_detailed_outbox_review_redirect(callback: CallbackQuery, callback
         await state.set_state(PageNavigation.page_navigation)
         await state.set_data({'destination': callback_data.redirect, 'page': 1})
 
-        title = await sync_to_async(Text.objects.get)(slug='outbox_review')
-
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-        review_text = await sync_to_async(Text.objects.get)(slug='review')
-        created_text = await sync_to_async(Text.objects.get)(slug='created_at')
+        texts = await Text.objects.aresolve(*OUTBOX_REVIEW_TEXTS, lang='rus')
 
         created_date = review.created_at.strftime('%d.%m.%Y')
         status = await sync_to_async(lambda: review.readable_approved_status)()
 
         comment = review.review
         if not comment:
-            comment = await sync_to_async(Text.objects.get)(slug='empty')
+            comment = await catalog.text('empty')
             comment = comment.rus
 
-        reply_text = f'''*{title.rus}*\
+        reply_text = f'''*{texts.outbox_review}*\
                 \n\
-                \n*{status_text.rus}* {status}\
-                \n*{created_text.rus}* {created_date}\
-                \n*{rate_text.rus}* {review.rate} ⭐️\
-                \n*{review_text.rus}* {comment}'''
+                \n*{texts.status}* {status}\
+                \n*{texts.created_at}* {created_date}\
+                \n*{texts.rate}* {review.rate} ⭐️\
+                \n*{texts.review}* {comment}'''
 
         try:
             await callback.message.edit_text(
@@ -593,22 +485,20 @@ async def view_detailed_employer_jobs(callback: CallbackQuery, callback_data: Wo
     if employer:
         reviews = await sync_to_async(lambda: list(employer.received_reviews.filter(is_approved=True).all()))()
         if reviews:
-            rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-            review_text = await sync_to_async(Text.objects.get)(slug='review')
-            created_text = await sync_to_async(Text.objects.get)(slug='created_at')
+            texts = await Text.objects.aresolve(*REVIEWS_TEXTS, lang='rus')
 
             reply_texts = []
             reply_text = ''
             for review in reviews:
                 comment = review.review
                 if not comment:
-                    comment = await sync_to_async(Text.objects.get)(slug='empty')
+                    comment = await catalog.text('empty')
                     comment = comment.rus
                 created_date = review.created_at.strftime('%d.%m.%Y')
 
-                added_text = f'\n\n*{created_text.rus}* {created_date}\
-                            \n*{rate_text.rus}* {review.rate} ⭐️\
-                            \n*{review_text.rus}* {comment}'''
+                added_text = f'\n\n*{texts.created_at}* {created_date}\
+                            \n*{texts.rate}* {review.rate} ⭐️\
+                            \n*{texts.review}* {comment}'''
                 
                 if len(reply_text) + len(added_text) > MAX_SYMBOLS:
                     reply_texts.append(reply_text)
@@ -662,22 +552,20 @@ async def view_detailed_employer_jobs(callback: CallbackQuery, callback_data: Wo
     if employer:
         reviews = await sync_to_async(lambda: list(employer.received_reviews.filter(is_approved=True).all()))()
         if reviews:
-            rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-            review_text = await sync_to_async(Text.objects.get)(slug='review')
-            created_text = await sync_to_async(Text.objects.get)(slug='created_at')
+            texts = await Text.objects.aresolve(*REVIEWS_TEXTS, lang='rus')
 
             reply_texts = []
             reply_text = ''
             for review in reviews:
                 comment = review.review
                 if not comment:
-                    comment = await sync_to_async(Text.objects.get)(slug='empty')
+                    comment = await catalog.text('empty')
                     comment = comment.rus
                 created_date = review.created_at.strftime('%d.%m.%Y')
 
-                added_text = f'\n\n*{created_text.rus}* {created_date}\
-                            \n*{rate_text.rus}* {review.rate} ⭐️\
-                            \n*{review_text.rus}* {comment}'''
+                added_text = f'\n\n*{texts.created_at}* {created_date}\
+                            \n*{texts.rate}* {review.rate} ⭐️\
+                            \n*{texts.review}* {comment}'''
                 
                 if len(reply_text) + len(added_text) > MAX_SYMBOLS:
                     reply_texts.append(reply_text)
@@ -11,7 +11,7 @@ django.setup()
 
 from middlewares.change_username import UpdateUsernameMiddleware
 from middlewares.worker_active_profile import IsActiveProfileMiddleware
-from core.models import Worker, Text
+from core import catalog
 from keyboards import keyboards
 from keyboards.callbacks import WorkerMainSectionsCallBackFactory
 
@@ -24,10 +24,9 @@ profile_router = Router()
 profile_router.callback_query.middleware(UpdateUsernameMiddleware())
 
 
-@profile_router.callback_query(WorkerMainSectionsCallBackFactory.filter(F.destination == 'profile'))
-async def handle_profile_menu(callback: CallbackQuery, callback_data: WorkerMainSectionsCallBackFactory, state: FSMContext):
+@profile_router.callback_query(WorkerMainSectionsCallBackFactory.filter(F.destination == 'profile'), flags={'profile': True})
+async def handle_profile_menu(callback: CallbackQuery, callback_data: WorkerMainSectionsCallBackFactory, state: FSMContext, worker=None):
     await state.clear()
-    worker = await sync_to_async(Worker.objects.filter(tg_id=callback.from_user.id).first)()
     if worker:
         readable_approved_status = await sync_to_async(lambda: worker.readable_approved_status)()
         readable_search_status = await sync_to_async(lambda: worker.readable_search_status)()
@@ -35,16 +34,16 @@ async def handle_profile_menu(callback: CallbackQuery, callback_data: WorkerMain
         readable_occupations = await sync_to_async(lambda: worker.readable_rus_occupations)()
         rating = await sync_to_async(lambda: worker.rating_rus)()
 
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating')
-        name_text = await sync_to_async(Text.objects.get)(slug='name')
-        phone_text = await sync_to_async(Text.objects.get)(slug='phone')
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        about_text = await sync_to_async(Text.objects.get)(slug='about')
-        notification_text = await sync_to_async(Text.objects.get)(slug='notifications')
-        worker_approved = await sync_to_async(Text.objects.get)(slug='worker_approved')
-        search_status = await sync_to_async(Text.objects.get)(slug='search_status')
-        your_profile = await sync_to_async(Text.objects.get)(slug='your_profile')
+        rating_text = await catalog.text('rating')
+        name_text = await catalog.text('name')
+        phone_text = await catalog.text('phone')
+        occupations_text = await catalog.text('occupations')
+        min_salary_text = await catalog.text('min_salary')
+        about_text = await catalog.text('about')
+        notification_text = await catalog.text('notifications')
+        worker_approved = await catalog.text('worker_approved')
+        search_status = await catalog.text('search_status')
+        your_profile = await catalog.text('your_profile')
         
 
         reply_text = f'''
@@ -94,7 +93,7 @@ async def handle_profile_menu(callback: CallbackQuery, callback_data: WorkerMain
 async def handle_jobs_menu(callback: CallbackQuery, callback_data: WorkerMainSectionsCallBackFactory, state: FSMContext):
     await state.clear()
 
-    choose_jobs_type = await sync_to_async(Text.objects.get)(slug='choose_jobs_type')
+    choose_jobs_type = await catalog.text('choose_jobs_type')
 
     try:
         await callback.message.edit_text(
@@ -109,7 +108,7 @@ async def handle_jobs_menu(callback: CallbackQuery, callback_data: WorkerMainSec
 async def handle_proposals_menu(callback: CallbackQuery, callback_data: WorkerMainSectionsCallBackFactory, state: FSMContext):
     await state.clear()
 
-    choose_proposals_type = await sync_to_async(Text.objects.get)(slug='choose_proposals_type')
+    choose_proposals_type = await catalog.text('choose_proposals_type')
 
     try:
         await callback.message.edit_text(
@@ -124,7 +123,7 @@ async def handle_proposals_menu(callback: CallbackQuery, callback_data: WorkerMa
 async def handle_notifications_controls(callback: CallbackQuery, callback_data: WorkerMainSectionsCallBackFactory, state: FSMContext):
     await state.clear()
 
-    choose_reviews_type = await sync_to_async(Text.objects.get)(slug='choose_reviews_type')
+    choose_reviews_type = await catalog.text('choose_reviews_type')
 
     try:
         await callback.message.edit_text(
@@ -14,7 +14,8 @@ django.setup()
 
 from config import ADMIN_CHAT_ID, MAX_LEN
 from middlewares.change_username import UpdateUsernameMiddleware
-from core.models import Worker, Text, Occupation, ObjectPhoto
+from core.models import Worker, ObjectPhoto
+from core import catalog
 from states.create_worker import CreateWorker
 from keyboards import keyboards
 from utils import validate_phone, validate_salary, escape_markdown
@@ -36,7 +37,7 @@ async def worker_name(message: Message, state: FSMContext):
     await state.update_data(name=name)
     await state.set_state(CreateWorker.input_phone)
 
-    reply_text = await sync_to_async(Text.objects.get)(slug='input_phone')
+    reply_text = await catalog.text('input_phone')
     try:
         await message.answer(
             text=reply_text.rus,
@@ -54,7 +55,7 @@ async def worker_contact(message: Message, state: FSMContext):
         await state.update_data(phone=phone)
         await state.set_state(CreateWorker.input_passport_photo)
 
-        reply_text = await sync_to_async(Text.objects.get)(slug='worker_passport_photo')
+        reply_text = await catalog.text('worker_passport_photo')
         try:
             await message.answer(
                 text=reply_text.rus,
@@ -64,7 +65,7 @@ async def worker_contact(message: Message, state: FSMContext):
             pass
 
     else:
-        reply_text = await sync_to_async(Text.objects.get)(slug='wrong_phone')
+        reply_text = await catalog.text('wrong_phone')
         try:
             await message.reply(text=reply_text.rus)
         except:
@@ -79,7 +80,7 @@ async def worker_phone(message: Message, state: FSMContext):
         await state.update_data(phone=phone)
         await state.set_state(CreateWorker.input_passport_photo)
 
-        reply_text = await sync_to_async(Text.objects.get)(slug='worker_passport_photo')
+        reply_text = await catalog.text('worker_passport_photo')
         try:
             await message.answer(
                 text=reply_text.rus,
@@ -89,7 +90,7 @@ async def worker_phone(message: Message, state: FSMContext):
             pass
 
     else:
-        reply_text = await sync_to_async(Text.objects.get)(slug='wrong_phone')
+        reply_text = await catalog.text('wrong_phone')
         try:
             await message.reply(text=reply_text.rus)
         except:
@@ -109,7 +110,7 @@ async def worker_passport_photo(message: Message, state: FSMContext):
         await state.update_data(passport_photo_path=file_info.file_path)
         await state.set_state(CreateWorker.input_occupations)
 
-    reply_text = await sync_to_async(Text.objects.get)(slug='worker_occupations')
+    reply_text = await catalog.text('worker_occupations')
     try:
         await message.answer(
             text=reply_text.rus,
@@ -147,7 +148,7 @@ async def worker_confirm_occupations(callback: CallbackQuery, callback_data: Occ
 
     if occupations:
         await state.set_state(CreateWorker.input_about)
-        reply_text = await sync_to_async(Text.objects.get)(slug='worker_about')
+        reply_text = await catalog.text('worker_about')
         try:
             await callback.message.edit_text(
                 text=reply_text.rus,
@@ -157,7 +158,7 @@ async def worker_confirm_occupations(callback: CallbackQuery, callback_data: Occ
             pass
 
     else:
-        reply_text = await sync_to_async(Text.objects.get)(slug='need_occupations')
+        reply_text = await catalog.text('need_occupations')
         try:
             await callback.bot.answer_callback_query(
                 callback_query_id=callback.id,
@@ -176,7 +177,7 @@ async def worker_about(message: Message, state: FSMContext):
     await state.update_data(about=about)
     await state.set_state(CreateWorker.input_min_salary)
 
-    reply_text = await sync_to_async(Text.objects.get)(slug='worker_min_salary')
+    reply_text = await catalog.text('worker_min_salary')
     try:
         await message.answer(
             text=reply_text.rus,
@@ -193,7 +194,7 @@ async def worker_min_salary(message: Message, state: FSMContext):
         await state.update_data(salary=min_salary)
         await state.set_state(CreateWorker.input_objects_photo_confirmation)
 
-        reply_text = await sync_to_async(Text.objects.get)(slug='need_objects_photo')
+        reply_text = await catalog.text('need_objects_photo')
         try:
             await message.answer(
                 text=reply_text.rus,
@@ -203,7 +204,7 @@ async def worker_min_salary(message: Message, state: FSMContext):
             pass
 
     else:
-        reply_text = await sync_to_async(Text.objects.get)(slug='wrong_min_salary')
+        reply_text = await catalog.text('wrong_min_salary')
         try:
             await message.reply(text=reply_text.rus)
         except:
@@ -219,7 +220,7 @@ async def worker_add_object_photo(callback: CallbackQuery, callback_data: PhotoC
         objects_photos = []
 
     if objects_photos:
-        reply_text = await sync_to_async(Text.objects.get)(slug='worker_more_objects_photo')
+        reply_text = await catalog.text('worker_more_objects_photo')
         try:
             await callback.message.edit_text(
                 text=f'{reply_text.rus} {len(objects_photos)}',
@@ -228,7 +229,7 @@ async def worker_add_object_photo(callback: CallbackQuery, callback_data: PhotoC
         except:
             pass
     else:
-        reply_text = await sync_to_async(Text.objects.get)(slug='worker_objects_photo')
+        reply_text = await catalog.text('worker_objects_photo')
         try:
             await callback.message.edit_text(
                 text=reply_text.rus,
@@ -253,7 +254,7 @@ async def worker_send_object_photo(message: Message, state: FSMContext):
     if len(objects_photos) < 9:
         await state.set_state(CreateWorker.input_objects_photo_confirmation)
 
-        reply_text = await sync_to_async(Text.objects.get)(slug='need_more_objects_photo')
+        reply_text = await catalog.text('need_more_objects_photo')
         try:
             await message.answer(
                 text=reply_text.rus,
@@ -264,7 +265,7 @@ async def worker_send_object_photo(message: Message, state: FSMContext):
     else:
         await state.set_state(CreateWorker.input_notifications)
 
-        reply_text = await sync_to_async(Text.objects.get)(slug='worker_notifications')
+        reply_text = await catalog.text('worker_notifications')
         try:
             await message.answer(
                 text=reply_text.rus,
@@ -278,7 +279,7 @@ async def worker_send_object_photo(message: Message, state: FSMContext):
 async def worker_next_step(callback: CallbackQuery, callback_data: PhotoCallbackFactory, state: FSMContext):
     await state.set_state(CreateWorker.input_notifications)
 
-    reply_text = await sync_to_async(Text.objects.get)(slug='worker_notifications')
+    reply_text = await catalog.text('worker_notifications')
     try:
         await callback.message.edit_text(
             text=reply_text.rus,
@@ -300,13 +301,13 @@ async def worker_notifications(callback: CallbackQuery, callback_data: WorkerNot
     await state.set_state(CreateWorker.confirmation)
     state_data = await state.get_data()
 
-    recheck_text = await sync_to_async(Text.objects.get)(slug='worker_confirmation')
-    name_text = await sync_to_async(Text.objects.get)(slug='name')
-    phone_text = await sync_to_async(Text.objects.get)(slug='phone')
-    occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-    min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-    about_text = await sync_to_async(Text.objects.get)(slug='about')
-    notification_text = await sync_to_async(Text.objects.get)(slug='notifications')
+    recheck_text = await catalog.text('worker_confirmation')
+    name_text = await catalog.text('name')
+    phone_text = await catalog.text('phone')
+    occupations_text = await catalog.text('occupations')
+    min_salary_text = await catalog.text('min_salary')
+    about_text = await catalog.text('about')
+    notification_text = await catalog.text('notifications')
 
     curr_occupations = state_data.get('occupations', False)
     if not curr_occupations:
@@ -314,7 +315,7 @@ async def worker_notifications(callback: CallbackQuery, callback_data: WorkerNot
 
     occupations_readable = []
     for curr_occupation in curr_occupations:
-        occupation = await sync_to_async(Occupation.objects.filter(slug=curr_occupation).first)()
+        occupation = await catalog.occupation(curr_occupation)
         if occupation:
             occupations_readable.append(occupation.rus)
     
@@ -364,7 +365,7 @@ async def worker_confirmation(callback: CallbackQuery, callback_data: WorkerProf
         await state.clear()
         await state.set_state(CreateWorker.input_name)
 
-        reply_text = await sync_to_async(Text.objects.get)(slug='worker_name')
+        reply_text = await catalog.text('worker_name')
         try:
             await callback.message.edit_text(
                                     text=reply_text.rus,
@@ -403,7 +404,7 @@ async def worker_confirmation(callback: CallbackQuery, callback_data: WorkerProf
         
         occupations_objects = []
         for occupation in curr_occupations:
-            occupation = await sync_to_async(Occupation.objects.filter(slug=occupation).first)()
+            occupation = await catalog.occupation(occupation)
             if occupation:
                 occupations_objects.append(occupation)
 
@@ -442,7 +443,7 @@ async def worker_confirmation(callback: CallbackQuery, callback_data: WorkerProf
             )
 
         for occupation in occupations_objects:
-            await sync_to_async(worker.occupations.add)(occupation)
+            await sync_to_async(worker.occupations.add)(occupation.id)
 
         for object_photo in real_objects_photos:
             await sync_to_async(worker.objects_photos.add)(object_photo)
@@ -454,15 +455,15 @@ async def worker_confirmation(callback: CallbackQuery, callback_data: WorkerProf
         readable_notifications_status = await sync_to_async(lambda: worker.readable_notifications_status)()
         readable_occupations = await sync_to_async(lambda: worker.readable_rus_occupations)()
 
-        name_text = await sync_to_async(Text.objects.get)(slug='name')
-        phone_text = await sync_to_async(Text.objects.get)(slug='phone')
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        about_text = await sync_to_async(Text.objects.get)(slug='about')
-        notification_text = await sync_to_async(Text.objects.get)(slug='notifications')
-        worker_approved = await sync_to_async(Text.objects.get)(slug='worker_approved')
-        search_status = await sync_to_async(Text.objects.get)(slug='search_status')
-        your_profile = await sync_to_async(Text.objects.get)(slug='your_profile')
+        name_text = await catalog.text('name')
+        phone_text = await catalog.text('phone')
+        occupations_text = await catalog.text('occupations')
+        min_salary_text = await catalog.text('min_salary')
+        about_text = await catalog.text('about')
+        notification_text = await catalog.text('notifications')
+        worker_approved = await catalog.text('worker_approved')
+        search_status = await catalog.text('search_status')
+        your_profile = await catalog.text('your_profile')
 
         input_media_photos = []
         for object_photo in real_objects_photos:
@@ -15,7 +15,8 @@ django.setup()
 from config import MAX_LEN
 from middlewares.change_username import UpdateUsernameMiddleware
 from middlewares.worker_active_profile import IsActiveProfileMiddleware, IsReviewedByAdminsMiddleware
-from core.models import Worker, Text, Job, WorkerCooperationProposal, EmployerCooperationProposal, WorkerReview, Employer
+from core.models import Job, WorkerCooperationProposal, EmployerCooperationProposal, WorkerReview, Employer
+from core import catalog
 from keyboards import keyboards
 from keyboards.callbacks import WorkerControlsCallBackFactory
 from states.create_worker import CreateWorker
@@ -34,9 +35,8 @@ cv_router.callback_query.middleware(UpdateUsernameMiddleware())
 cv_router.callback_query.middleware(IsReviewedByAdminsMiddleware())
 
 
-@router.callback_query(WorkerControlsCallBackFactory.filter(F.control == 'notification'))
-async def handle_notifications_controls(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory):
-    worker = await sync_to_async(Worker.objects.filter(tg_id=callback.from_user.id).first)()
+@router.callback_query(WorkerControlsCallBackFactory.filter(F.control == 'notification'), flags={'profile': True})
+async def handle_notifications_controls(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory, worker=None):
     if worker:
         if callback_data.action == 'disable':
             worker.notifications = False
@@ -51,16 +51,16 @@ async def handle_notifications_controls(callback: CallbackQuery, callback_data:
         readable_occupations = await sync_to_async(lambda: worker.readable_rus_occupations)()
         rating = await sync_to_async(lambda: worker.rating_rus)()
 
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating')
-        name_text = await sync_to_async(Text.objects.get)(slug='name')
-        phone_text = await sync_to_async(Text.objects.get)(slug='phone')
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        about_text = await sync_to_async(Text.objects.get)(slug='about')
-        notification_text = await sync_to_async(Text.objects.get)(slug='notifications')
-        worker_approved = await sync_to_async(Text.objects.get)(slug='worker_approved')
-        search_status = await sync_to_async(Text.objects.get)(slug='search_status')
-        your_profile = await sync_to_async(Text.objects.get)(slug='your_profile')
+        rating_text = await catalog.text('rating')
+        name_text = await catalog.text('name')
+        phone_text = await catalog.text('phone')
+        occupations_text = await catalog.text('occupations')
+        min_salary_text = await catalog.text('min_salary')
+        about_text = await catalog.text('about')
+        notification_text = await catalog.text('notifications')
+        worker_approved = await catalog.text('worker_approved')
+        search_status = await catalog.text('search_status')
+        your_profile = await catalog.text('your_profile')
         
         reply_text = f'''
                 *{your_profile.rus}*\
@@ -87,9 +87,8 @@ async def handle_notifications_controls(callback: CallbackQuery, callback_data:
             pass
 
 
-@router.callback_query(WorkerControlsCallBackFactory.filter(F.control == 'searching'))
-async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory):
-    worker = await sync_to_async(Worker.objects.filter(tg_id=callback.from_user.id).first)()
+@router.callback_query(WorkerControlsCallBackFactory.filter(F.control == 'searching'), flags={'profile': True})
+async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory, worker=None):
     if worker:
         if callback_data.action == 'yes':
             worker.is_searching = True
@@ -104,16 +103,16 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerC
         readable_occupations = await sync_to_async(lambda: worker.readable_rus_occupations)()
         rating = await sync_to_async(lambda: worker.rating_rus)()
 
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating')
-        name_text = await sync_to_async(Text.objects.get)(slug='name')
-        phone_text = await sync_to_async(Text.objects.get)(slug='phone')
-        occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-        min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-        about_text = await sync_to_async(Text.objects.get)(slug='about')
-        notification_text = await sync_to_async(Text.objects.get)(slug='notifications')
-        worker_approved = await sync_to_async(Text.objects.get)(slug='worker_approved')
-        search_status = await sync_to_async(Text.objects.get)(slug='search_status')
-        your_profile = await sync_to_async(Text.objects.get)(slug='your_profile')
+        rating_text = await catalog.text('rating')
+        name_text = await catalog.text('name')
+        phone_text = await catalog.text('phone')
+        occupations_text = await catalog.text('occupations')
+        min_salary_text = await catalog.text('min_salary')
+        about_text = await catalog.text('about')
+        notification_text = await catalog.text('notifications')
+        worker_approved = await catalog.text('worker_approved')
+        search_status = await catalog.text('search_status')
+        your_profile = await catalog.text('your_profile')
         
         reply_text = f'''
                 *{your_profile.rus}*\
@@ -140,9 +139,8 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerC
             pass
 
 
-@cv_router.callback_query(WorkerControlsCallBackFactory.filter((F.control == 'cv') & (F.action == 'change')))
-async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory, state=FSMContext):
-    worker = await sync_to_async(Worker.objects.filter(tg_id=callback.from_user.id).first)()
+@cv_router.callback_query(WorkerControlsCallBackFactory.filter((F.control == 'cv') & (F.action == 'change')), flags={'profile': True})
+async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory, state=FSMContext, worker=None):
     if worker:
         worker.is_approved = None
         worker.about_heb = None
@@ -153,7 +151,7 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerC
         await state.clear()
         await state.set_state(CreateWorker.input_name)
 
-        reply_text = await sync_to_async(Text.objects.get)(slug='worker_name')
+        reply_text = await catalog.text('worker_name')
 
         try:
             await callback.message.edit_text(
@@ -164,10 +162,9 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerC
             pass
 
 
-@router.callback_query(WorkerControlsCallBackFactory.filter((F.control == 'proposal') & (F.action == 'make')))
-async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory, state=FSMContext):
+@router.callback_query(WorkerControlsCallBackFactory.filter((F.control == 'proposal') & (F.action == 'make')), flags={'profile': True})
+async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory, state=FSMContext, worker=None):
     job = await sync_to_async(Job.objects.filter(id=callback_data.object_id).first)()
-    worker = await sync_to_async(Worker.objects.filter(tg_id=callback.from_user.id).first)()
     if worker and job:
         proposal = await sync_to_async(WorkerCooperationProposal.objects.filter(Q(worker=worker) & Q(job=job)).first)()
         if not proposal:
@@ -180,7 +177,7 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerC
 
             if job.is_active and job.is_approved:
                 try:
-                    new_proposal_text = await sync_to_async(Text.objects.get)(slug='new_proposal')
+                    new_proposal_text = await catalog.text('new_proposal')
                     await callback.bot.send_message(
                         chat_id=employer.tg_id,
                         text=f'\u202B{new_proposal_text.heb}',
@@ -193,14 +190,13 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerC
                 await sync_to_async(proposal.save)()
         
         await callback.message.edit_reply_markup(
-            reply_markup=await keyboards.worker_job_details_keyboard(job.id, worker.tg_id)
+            reply_markup=await keyboards.worker_job_details_keyboard(job.id, worker)
         )
 
 
-@router.callback_query(WorkerControlsCallBackFactory.filter((F.control == 'proposal') & (F.action == 'resend')))
-async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory, state=FSMContext):
+@router.callback_query(WorkerControlsCallBackFactory.filter((F.control == 'proposal') & (F.action == 'resend')), flags={'profile': True})
+async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory, state=FSMContext, worker=None):
     job = await sync_to_async(Job.objects.filter(id=callback_data.object_id).first)()
-    worker = await sync_to_async(Worker.objects.filter(tg_id=callback.from_user.id).first)()
     if worker and job:
         proposal = await sync_to_async(WorkerCooperationProposal.objects.filter(Q(worker=worker) & Q(job=job)).first)()
         if proposal:
@@ -210,7 +206,7 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerC
 
             if job.is_active and job.is_approved:
                 employer = await sync_to_async(lambda: job.employer)()
-                new_proposal_text = await sync_to_async(Text.objects.get)(slug='new_proposal')
+                new_proposal_text = await catalog.text('new_proposal')
                 try:
                     await callback.bot.send_message(
                         chat_id=employer.tg_id,
@@ -225,9 +221,9 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerC
         
             status = await sync_to_async(lambda: proposal.readable_rus_accepted_status)()
 
-            status_text = await sync_to_async(Text.objects.get)(slug='status')
-            created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-            updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
+            status_text = await catalog.text('status')
+            created_at = await catalog.text('created_at')
+            updated_at = await catalog.text('updated_at')
 
             created_date = proposal.created_at.strftime('%d.%m.%Y')
             updated_date = proposal.updated_at.strftime('%d.%m.%Y')
@@ -248,10 +244,9 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerC
                 pass
 
 
-@router.callback_query(WorkerControlsCallBackFactory.filter((F.control == 'outbox-proposal') & (F.action == 'resend')))
-async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory, state=FSMContext):
+@router.callback_query(WorkerControlsCallBackFactory.filter((F.control == 'outbox-proposal') & (F.action == 'resend')), flags={'profile': True})
+async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory, state=FSMContext, worker=None):
     job = await sync_to_async(Job.objects.filter(id=callback_data.object_id).first)()
-    worker = await sync_to_async(Worker.objects.filter(tg_id=callback.from_user.id).first)()
     if worker and job:
         proposal = await sync_to_async(WorkerCooperationProposal.objects.filter(Q(worker=worker) & Q(job=job)).first)()
         if proposal:
@@ -262,7 +257,7 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerC
                 try:
                     employer = await sync_to_async(lambda: job.employer)()
                     employer_name = employer.name
-                    new_proposal_text = await sync_to_async(Text.objects.get)(slug='new_proposal')
+                    new_proposal_text = await catalog.text('new_proposal')
 
                     await callback.bot.send_message(
                         chat_id=employer.tg_id,
@@ -276,22 +271,22 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerC
 
             await sync_to_async(proposal.save)()
 
-            job_text = await sync_to_async(Text.objects.get)(slug='job')
-            outbox_proposal_text = await sync_to_async(Text.objects.get)(slug='outbox_proposal')
+            job_text = await catalog.text('job')
+            outbox_proposal_text = await catalog.text('outbox_proposal')
 
             readable_occupations = await sync_to_async(lambda: job.readable_rus_occupations)()
 
-            occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-            min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-            description_text = await sync_to_async(Text.objects.get)(slug='description')
-            salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
-            employer_name_text = await sync_to_async(Text.objects.get)(slug='employer_company_name')
+            occupations_text = await catalog.text('occupations')
+            min_salary_text = await catalog.text('min_salary')
+            description_text = await catalog.text('description')
+            salary_hourly = await catalog.text('salary_hourly')
+            employer_name_text = await catalog.text('employer_company_name')
             
             status = await sync_to_async(lambda: proposal.readable_rus_accepted_status)()
 
-            status_text = await sync_to_async(Text.objects.get)(slug='status')
-            created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-            updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
+            status_text = await catalog.text('status')
+            created_at = await catalog.text('created_at')
+            updated_at = await catalog.text('updated_at')
 
             created_date = proposal.created_at.strftime('%d.%m.%Y')
             updated_date = proposal.updated_at.strftime('%d.%m.%Y')
@@ -329,12 +324,12 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerC
         action = callback_data.action
         if action == 'accept':
             proposal.is_accepted = True
-            proposal_result = await sync_to_async(Text.objects.get)(slug='proposal_accepted')
+            proposal_result = await catalog.text('proposal_accepted')
             asyncio.create_task(employer_proposal_accepted(callback.bot, proposal.id))
 
         elif action == 'decline':
             proposal.is_accepted = False
-            proposal_result = await sync_to_async(Text.objects.get)(slug='proposal_declined')
+            proposal_result = await catalog.text('proposal_declined')
 
         await sync_to_async(proposal.save)()
 
@@ -349,33 +344,33 @@ async def handle_search_controls(callback: CallbackQuery, callback_data: WorkerC
         except:
             pass
 
-        employer_text = await sync_to_async(Text.objects.get)(slug='employer')
-        inbox_proposal_text = await sync_to_async(Text.objects.get)(slug='inbox_proposal')
-        employer_name_text = await sync_to_async(Text.objects.get)(slug='employer_company_name')
+        employer_text = await catalog.text('employer')
+        inbox_proposal_text = await catalog.text('inbox_proposal')
+        employer_name_text = await catalog.text('employer_company_name')
 
-        jobs = await sync_to_async(Text.objects.get)(slug='jobs')
+        jobs = await catalog.text('jobs')
         occupations = await sync_to_async(lambda: employer.readable_occupations)()
 
         min_min_salary = await sync_to_async(lambda: employer.min_min_salary)()
         max_min_salary = await sync_to_async(lambda: employer.max_min_salary)()
         if min_min_salary == max_min_salary:
-            min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
+            min_salary_text = await catalog.text('min_salary')
             salary_info = f'*{min_salary_text.rus}* {min_min_salary}'
         else:
-            min_salary_text = await sync_to_async(Text.objects.get)(slug='min_min_salary')
-            max_salary_text = await sync_to_async(Text.objects.get)(slug='max_min_salary')
+            min_salary_text = await catalog.text('min_min_salary')
+            max_salary_text = await catalog.text('max_min_salary')
             salary_info = f'*{min_salary_text.rus}* {min_min_salary}\n*{max_salary_text.rus}* {max_min_salary}'
 
         status = await sync_to_async(lambda: proposal.readable_rus_accepted_status)()
 
-        status_text = await sync_to_async(Text.objects.get)(slug='status')
-        created_at = await sync_to_async(Text.objects.get)(slug='created_at')
-        updated_at = await sync_to_async(Text.objects.get)(slug='updated_at')
+        status_text = await catalog.text('status')
+        created_at = await catalog.text('created_at')
+        updated_at = await catalog.text('updated_at')
 
         created_date = proposal.created_at.strftime('%d.%m.%Y')
         updated_date = proposal.updated_at.strftime('%d.%m.%Y')
 
-        rating_text = await sync_to_async(Text.objects.get)(slug='rating_employer')
+        rating_text = await catalog.text('rating_employer')
         rating = await sync_to_async(lambda: employer.rating_rus)()
 
         reply_text = f'''
@@ -407,7 +402,7 @@ async def handle_add_review(callback: CallbackQuery, callback_data: WorkerContro
     await state.set_state(CreateReview.rate)
     await state.update_data(employer=callback_data.object_id)
 
-    add_rate = await sync_to_async(Text.objects.get)(slug='add_rate')
+    add_rate = await catalog.text('add_rate')
 
     try:
         await callback.message.edit_text(
@@ -423,7 +418,7 @@ async def handle_rate_review(callback: CallbackQuery, callback_data: WorkerContr
     await state.set_state(CreateReview.review)
     await state.update_data(rate=callback_data.object_id)
 
-    add_review = await sync_to_async(Text.objects.get)(slug='add_review')
+    add_review = await catalog.text('add_review')
 
     try:
         await callback.message.edit_text(
@@ -436,7 +431,7 @@ async def handle_rate_review(callback: CallbackQuery, callback_data: WorkerContr
 
 @router.callback_query(WorkerControlsCallBackFactory.filter((F.control == 'review') & (F.action == 'text')), CreateReview.review)
 async def handle_text_review(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory, state=FSMContext):
-    add_text_review = await sync_to_async(Text.objects.get)(slug='add_text_review')
+    add_text_review = await catalog.text('add_text_review')
     await callback.message.edit_text(
         text=add_text_review.rus,
         reply_markup=InlineKeyboardBuilder().as_markup(),
@@ -447,10 +442,10 @@ async def handle_text_review(callback: CallbackQuery, callback_data: WorkerContr
 async def handle_skip_text_review(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory, state=FSMContext):
     await state.set_state(CreateReview.confirmation)
 
-    confirmation_text = await sync_to_async(Text.objects.get)(slug='worker_confirmation')
-    rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-    review_text = await sync_to_async(Text.objects.get)(slug='review')
-    empty_text = await sync_to_async(Text.objects.get)(slug='empty')
+    confirmation_text = await catalog.text('worker_confirmation')
+    rate_text = await catalog.text('rate')
+    review_text = await catalog.text('review')
+    empty_text = await catalog.text('empty')
 
     state_data = await state.get_data()
     rate = state_data.get('rate')
@@ -477,9 +472,9 @@ async def handle_add_text_review(message: Message, state: FSMContext):
     await state.update_data(review=review)
     await state.set_state(CreateReview.confirmation)
     
-    confirmation_text = await sync_to_async(Text.objects.get)(slug='worker_confirmation')
-    rate_text = await sync_to_async(Text.objects.get)(slug='rate')
-    review_text = await sync_to_async(Text.objects.get)(slug='review')
+    confirmation_text = await catalog.text('worker_confirmation')
+    rate_text = await catalog.text('rate')
+    review_text = await catalog.text('review')
 
     state_data = await state.get_data()
     rate = state_data.get('rate')
@@ -507,7 +502,7 @@ async def handle_retype_review(callback: CallbackQuery, callback_data: WorkerCon
     await state.set_state(CreateReview.rate)
     await state.update_data(employer=employer_id)
 
-    add_rate = await sync_to_async(Text.objects.get)(slug='add_rate')
+    add_rate = await catalog.text('add_rate')
 
     try:
         await callback.message.edit_text(
@@ -518,8 +513,8 @@ async def handle_retype_review(callback: CallbackQuery, callback_data: WorkerCon
         pass
 
 
-@router.callback_query(WorkerControlsCallBackFactory.filter((F.control == 'review') & (F.action == 'confirm')), CreateReview.confirmation)
-async def handle_confirm_review(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory, state=FSMContext):
+@router.callback_query(WorkerControlsCallBackFactory.filter((F.control == 'review') & (F.action == 'confirm')), CreateReview.confirmation, flags={'profile': True})
+async def handle_confirm_review(callback: CallbackQuery, callback_data: WorkerControlsCallBackFactory, state=FSMContext, worker=None):
     state_data = await state.get_data()
 
     employer_id = state_data.get('employer')
@@ -529,7 +524,6 @@ async def handle_confirm_review(callback: CallbackQuery, callback_data: WorkerCo
     prev_review = await sync_to_async(WorkerReview.objects.filter(Q(employer__id=employer_id) & Q(worker__tg_id=callback.from_user.id)).first)()
     if not prev_review:
         employer = await sync_to_async(Employer.objects.filter(id=employer_id).first)()
-        worker = await sync_to_async(Worker.objects.filter(tg_id=callback.from_user.id).first)()
         new_review = await sync_to_async(WorkerReview.objects.create)(
             employer=employer,
             worker=worker,
@@ -537,7 +531,7 @@ async def handle_confirm_review(callback: CallbackQuery, callback_data: WorkerCo
             review=review,
         )
 
-        review_wait_check = await sync_to_async(Text.objects.get)(slug='review_wait_check')
+        review_wait_check = await catalog.text('review_wait_check')
         try:
             await callback.message.edit_text(
                 text=review_wait_check.rus,
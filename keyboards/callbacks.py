@@ -38,6 +38,7 @@ class WorkerMainSectionsCallBackFactory(CallbackData, prefix="w_menu"):
 class WorkerPagesSectionsCallBackFactory(CallbackData, prefix="w_pages"):
     destination: str
     page: int = 1
+    cursor: str = ''
 
 
 class WorkerDetailsCallBackFactory(CallbackData, prefix="w_details"):
@@ -74,6 +75,7 @@ class EmployerMainSectionsCallBackFactory(CallbackData, prefix="e_menu"):
 class EmployerPagesSectionsCallBackFactory(CallbackData, prefix="e_pages"):
     destination: str
     page: int = 1
+    cursor: str = ''
 
 
 class EmployerDetailsCallBackFactory(CallbackData, prefix="e_details"):
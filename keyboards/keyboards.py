@@ -1,5 +1,4 @@
 import os
-import math
 
 import django
 from django.db.models import Q
@@ -11,10 +10,13 @@ from aiogram.fsm.context import FSMContext
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'work_exchange.settings')
 django.setup()
 
-from config import BOT_NAME, PER_PAGE
-from core.models import (Button, Occupation, Worker, Job, Employer, Text,
+from config import BOT_NAME, PER_PAGE, MATCHING_INDEX
+from core.models import (Worker, Job,
                          WorkerCooperationProposal, EmployerCooperationProposal,
                          WorkerReview, EmployerReview)
+from core import catalog, matching, executor
+from keyboards.registry import static_keyboard
+from keyboards.pagination import paginate, paginate_ids, paginate_keyset, navigation_row
 from keyboards.callbacks import (
     AdminControlsCallBackFactory,
 
@@ -57,19 +59,21 @@ async def admin_worker_keyboard(target, object_id):
 #* <------------------------------------------------->
 #! Клавиатуры для каналов
 #* <------------------------------------------------->
+@static_keyboard
 async def more_workers_channel_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    more_button = await sync_to_async(Button.objects.get)(slug='more_workers')
+    more_button = await catalog.button('more_workers')
     keyboard.row(InlineKeyboardButton(text=f'\u202B{more_button.heb}', url=f'https://t.me/{BOT_NAME}'))
 
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def more_jobs_channel_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    more_button = await sync_to_async(Button.objects.get)(slug='more_jobs')
+    more_button = await catalog.button('more_jobs')
     keyboard.row(InlineKeyboardButton(text=more_button.rus, url=f'https://t.me/{BOT_NAME}'))
 
     return keyboard.as_markup()
@@ -78,11 +82,12 @@ async def more_jobs_channel_keyboard():
 #* <------------------------------------------------->
 #! Общие клавиатуры
 #* <------------------------------------------------->
+@static_keyboard
 async def choose_target_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    worker_button = await sync_to_async(Button.objects.get)(slug='search_job')
-    employer_button = await sync_to_async(Button.objects.get)(slug='search_workers')
+    worker_button = await catalog.button('search_job')
+    employer_button = await catalog.button('search_workers')
 
     worker_kb = InlineKeyboardButton(text=worker_button.rus, callback_data=TargetCallbackFactory(target=1).pack())
     employer_kb = InlineKeyboardButton(text=f'\u202B{employer_button.heb}', callback_data=TargetCallbackFactory(target=2).pack())
@@ -92,9 +97,10 @@ async def choose_target_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def request_phone_keyboard(language):
     keyboard = ReplyKeyboardBuilder()
-    button = await sync_to_async(Button.objects.get)(slug='request_phone')
+    button = await catalog.button('request_phone')
     if language == 'rus':
         keyboard.row(KeyboardButton(text=button.rus, request_contact=True,))
     elif language == 'heb':
@@ -106,8 +112,8 @@ async def request_phone_keyboard(language):
 async def occupations_keyboard(language, state: FSMContext):
     keyboard = InlineKeyboardBuilder()
 
-    occupations = await sync_to_async(lambda: list(Occupation.objects.all()))()
-    confirm_button = await sync_to_async(Button.objects.get)(slug='confirm')
+    occupations = await catalog.occupations()
+    confirm_button = await catalog.button('confirm')
 
     if language == 'rus':
         buttons = []
@@ -149,11 +155,12 @@ async def occupations_keyboard(language, state: FSMContext):
 #* <------------------------------------------------->
 #! Клавиатуры для работников
 #* <------------------------------------------------->
+@static_keyboard
 async def object_photo_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    add_button = await sync_to_async(Button.objects.get)(slug='add_photo')
-    next_button = await sync_to_async(Button.objects.get)(slug='next_step')
+    add_button = await catalog.button('add_photo')
+    next_button = await catalog.button('next_step')
 
     keyboard.add(InlineKeyboardButton(text=add_button.rus, callback_data=PhotoCallbackFactory(action='add').pack()))
     keyboard.add(InlineKeyboardButton(text=next_button.rus, callback_data=PhotoCallbackFactory(action='next').pack()))
@@ -161,11 +168,12 @@ async def object_photo_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def worker_notification_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    yes_button = await sync_to_async(Button.objects.get)(slug='yes')
-    no_button = await sync_to_async(Button.objects.get)(slug='no')
+    yes_button = await catalog.button('yes')
+    no_button = await catalog.button('no')
 
     yes_kb = InlineKeyboardButton(text=yes_button.rus, callback_data=WorkerNotificationCallbackFactory(action='yes').pack())
     no_kb = InlineKeyboardButton(text=no_button.rus, callback_data=WorkerNotificationCallbackFactory(action='no').pack())
@@ -175,11 +183,12 @@ async def worker_notification_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def worker_profile_confirmation_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    confirm_button = await sync_to_async(Button.objects.get)(slug='confirm')
-    retype_button = await sync_to_async(Button.objects.get)(slug='retype')
+    confirm_button = await catalog.button('confirm')
+    retype_button = await catalog.button('retype')
 
     keyboard.add(InlineKeyboardButton(text=confirm_button.rus, callback_data=WorkerProfileConfirmationCallbackFactory(action='confirm').pack()))
     keyboard.add(InlineKeyboardButton(text=retype_button.rus, callback_data=WorkerProfileConfirmationCallbackFactory(action='retype').pack()))
@@ -193,21 +202,21 @@ async def worker_profile_keyboard(worker_id):
 
     if worker:
         if worker.is_searching:
-            searching_no = await sync_to_async(Button.objects.get)(slug='searching_no')
+            searching_no = await catalog.button('searching_no')
             keyboard.row(InlineKeyboardButton(text=searching_no.rus, callback_data=WorkerControlsCallBackFactory(control='searching', action='no').pack()))
         else:
-            searching_yes = await sync_to_async(Button.objects.get)(slug='searching_yes')
+            searching_yes = await catalog.button('searching_yes')
             keyboard.row(InlineKeyboardButton(text=searching_yes.rus, callback_data=WorkerControlsCallBackFactory(control='searching', action='yes').pack()))
 
         if worker.notifications:
-            disable_notifications = await sync_to_async(Button.objects.get)(slug='disable_notifications')
+            disable_notifications = await catalog.button('disable_notifications')
             keyboard.row(InlineKeyboardButton(text=disable_notifications.rus, callback_data=WorkerControlsCallBackFactory(control='notification', action='disable').pack()))
         else:
-            enable_notifications = await sync_to_async(Button.objects.get)(slug='enable_notifications')
+            enable_notifications = await catalog.button('enable_notifications')
             keyboard.row(InlineKeyboardButton(text=enable_notifications.rus, callback_data=WorkerControlsCallBackFactory(control='notification', action='enable').pack()))
 
-        change_cv = await sync_to_async(Button.objects.get)(slug='change_cv')
-        main_menu = await sync_to_async(Button.objects.get)(slug='main_menu')
+        change_cv = await catalog.button('change_cv')
+        main_menu = await catalog.button('main_menu')
 
         keyboard.row(InlineKeyboardButton(text=change_cv.rus, callback_data=WorkerControlsCallBackFactory(control='cv', action='change').pack()))
         keyboard.row(InlineKeyboardButton(text=main_menu.rus, callback_data=WorkerBackCallBackFactory(destination='main').pack()))
@@ -215,31 +224,34 @@ async def worker_profile_keyboard(worker_id):
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def worker_change_cv_keyboard():
     keyboard = InlineKeyboardBuilder()
         
-    change_cv = await sync_to_async(Button.objects.get)(slug='change_cv')
+    change_cv = await catalog.button('change_cv')
     keyboard.row(InlineKeyboardButton(text=change_cv.rus, callback_data=WorkerControlsCallBackFactory(control='cv', action='change').pack()))
     
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def worker_to_main_menu_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    main_menu = await sync_to_async(Button.objects.get)(slug='main_menu')
+    main_menu = await catalog.button('main_menu')
     keyboard.row(InlineKeyboardButton(text=main_menu.rus, callback_data=WorkerBackCallBackFactory(destination='main').pack()))
     
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def worker_main_menu():
     keyboard = InlineKeyboardBuilder()
 
-    profile = await sync_to_async(Button.objects.get)(slug='profile')
-    jobs = await sync_to_async(Button.objects.get)(slug='jobs')
-    proposals = await sync_to_async(Button.objects.get)(slug='cooperation_proposals')
-    reviews = await sync_to_async(Button.objects.get)(slug='reviews')
+    profile = await catalog.button('profile')
+    jobs = await catalog.button('jobs')
+    proposals = await catalog.button('cooperation_proposals')
+    reviews = await catalog.button('reviews')
 
     keyboard.row(InlineKeyboardButton(text=profile.rus, callback_data=WorkerMainSectionsCallBackFactory(destination='profile').pack()))
     keyboard.row(InlineKeyboardButton(text=jobs.rus, callback_data=WorkerMainSectionsCallBackFactory(destination='jobs').pack()))
@@ -249,12 +261,13 @@ async def worker_main_menu():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def worker_jobs_menu_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    all_jobs = await sync_to_async(Button.objects.get)(slug='all_jobs')
-    suitable_jobs = await sync_to_async(Button.objects.get)(slug='jobs_suitable')
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    all_jobs = await catalog.button('all_jobs')
+    suitable_jobs = await catalog.button('jobs_suitable')
+    back = await catalog.button('back')
 
     keyboard.row(InlineKeyboardButton(text=all_jobs.rus, callback_data=WorkerPagesSectionsCallBackFactory(destination='all-jobs').pack()))
     keyboard.row(InlineKeyboardButton(text=suitable_jobs.rus, callback_data=WorkerPagesSectionsCallBackFactory(destination='suitable-jobs').pack()))
@@ -263,12 +276,13 @@ async def worker_jobs_menu_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def worker_proposals_menu_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    inbox = await sync_to_async(Button.objects.get)(slug='inbox')
-    outbox = await sync_to_async(Button.objects.get)(slug='outbox')
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    inbox = await catalog.button('inbox')
+    outbox = await catalog.button('outbox')
+    back = await catalog.button('back')
 
     keyboard.row(InlineKeyboardButton(text=inbox.rus, callback_data=WorkerPagesSectionsCallBackFactory(destination='inbox-proposals').pack()))
     keyboard.row(InlineKeyboardButton(text=outbox.rus, callback_data=WorkerPagesSectionsCallBackFactory(destination='outbox-proposals').pack()))
@@ -277,12 +291,13 @@ async def worker_proposals_menu_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def worker_reviews_menu_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    inbox = await sync_to_async(Button.objects.get)(slug='inbox')
-    outbox = await sync_to_async(Button.objects.get)(slug='outbox')
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    inbox = await catalog.button('inbox')
+    outbox = await catalog.button('outbox')
+    back = await catalog.button('back')
 
     keyboard.row(InlineKeyboardButton(text=inbox.rus, callback_data=WorkerPagesSectionsCallBackFactory(destination='inbox-reviews').pack()))
     keyboard.row(InlineKeyboardButton(text=outbox.rus, callback_data=WorkerPagesSectionsCallBackFactory(destination='outbox-reviews').pack()))
@@ -291,82 +306,72 @@ async def worker_reviews_menu_keyboard():
     return keyboard.as_markup()
 
 
-async def worker_jobs_list_keyboard(page, destination, user_id):
+async def worker_jobs_list_keyboard(page, destination, worker, cursor=''):
     keyboard = InlineKeyboardBuilder()
 
     jobs = []
-
+    prev_cursor = next_cursor = ''
 
     if destination == 'all-jobs':
-        jobs = await sync_to_async(lambda: list(Job.objects.filter(
+        jobs = Job.objects.filter(
             Q(is_active=True) & 
             Q(is_approved=True)
-            ).distinct()))()
+            ).distinct().with_occupations()
     elif destination == 'suitable-jobs':
-        worker = await sync_to_async(Worker.objects.filter(tg_id=user_id).first)()
         occupations = await sync_to_async(lambda: list(worker.occupations.all()))()
-        jobs = await sync_to_async(lambda: list(Job.objects.filter(
-            Q(occupations__in=occupations) &
-            Q(is_active=True) & 
-            Q(is_approved=True) &
-            Q(min_salary__gte=worker.min_salary)
-            ).distinct()))()
-
-    if jobs:
-        jobs_count = len(jobs)
-        pages_count = math.ceil(jobs_count / PER_PAGE)
+        if MATCHING_INDEX:
+            jobs = await executor.run(matching.suitable_job_ids, [occupation.id for occupation in occupations], worker.min_salary)
+        else:
+            jobs = Job.objects.filter(
+                Q(occupations__in=occupations) &
+                Q(is_active=True) & 
+                Q(is_approved=True) &
+                Q(min_salary__gte=worker.min_salary)
+                ).distinct().with_occupations()
 
-        if page > pages_count:
-            page = pages_count
+    if destination == 'all-jobs':
+        jobs, page, pages_count, prev_cursor, next_cursor = await executor.run(paginate_keyset, jobs, page, cursor)
+    elif MATCHING_INDEX:
+        jobs, page, pages_count = await executor.run(paginate_ids, Job.objects.with_occupations(), jobs, page)
+    else:
+        jobs, page, pages_count = await executor.run(paginate, jobs, page)
 
-        jobs = jobs[(page - 1) * PER_PAGE:page * PER_PAGE]
-        salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
+    if jobs:
+        salary_hourly = await catalog.text('salary_hourly')
 
         for num, job in enumerate(jobs):
-            readable_occupations = await sync_to_async(lambda: job.readable_rus_occupations)()
+            readable_occupations = job.readable_rus_occupations
             order_num = num + 1 + (PER_PAGE * (page -1))
             keyboard.row(InlineKeyboardButton(text=f'{order_num}. {job.min_salary} {salary_hourly.rus}: {readable_occupations}', callback_data=WorkerDetailsCallBackFactory(object_name='job', object_id=job.id).pack()))
 
-        nav = []
-        if pages_count >= 2:
-            if page == 1:
-                nav.append(InlineKeyboardButton(text=f'<<', callback_data='nothing'))
-            else:
-                nav.append(InlineKeyboardButton(text=f'<<', callback_data=WorkerPagesSectionsCallBackFactory(destination=destination, page=page-1).pack()))
-            nav.append(InlineKeyboardButton(text=f'\u202B{page}/{pages_count}', callback_data=f'nothing'))
-            if page == pages_count:
-                nav.append(InlineKeyboardButton(text=f'>>', callback_data='nothing'))
-            else:
-                nav.append(InlineKeyboardButton(text=f'>>', callback_data=WorkerPagesSectionsCallBackFactory(destination=destination, page=page+1).pack()))
-        keyboard.row(*nav)
+        keyboard.row(*navigation_row(WorkerPagesSectionsCallBackFactory, destination, page, pages_count, rtl=True, prev_cursor=prev_cursor, next_cursor=next_cursor))
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=back.rus, callback_data=WorkerMainSectionsCallBackFactory(destination='jobs').pack()))
 
     return keyboard.as_markup()
 
 
-async def worker_job_details_keyboard(job_id, worker_tg_id):
+async def worker_job_details_keyboard(job_id, worker):
     keyboard = InlineKeyboardBuilder()
 
     job = await sync_to_async(Job.objects.filter(id=job_id).first)()
-    worker = await sync_to_async(Worker.objects.filter(tg_id=worker_tg_id).first)()
     if job and worker:
         proposal = await sync_to_async(WorkerCooperationProposal.objects.filter(Q(job=job) & Q(worker=worker)).first)()
         if proposal:
-            view_proposal = await sync_to_async(Button.objects.get)(slug='view_proposal')
+            view_proposal = await catalog.button('view_proposal')
             keyboard.row(InlineKeyboardButton(text=view_proposal.rus, callback_data=WorkerDetailsCallBackFactory(object_name='proposal', object_id=proposal.id).pack()))
         else:
-            make_proposal = await sync_to_async(Button.objects.get)(slug='make_proposal')
+            make_proposal = await catalog.button('make_proposal')
             keyboard.row(InlineKeyboardButton(text=make_proposal.rus, callback_data=WorkerControlsCallBackFactory(control='proposal', action='make', object_id=job.id).pack()))
         
         employer = await sync_to_async(lambda: job.employer)()
         reviews = await sync_to_async(lambda: list(employer.received_reviews.filter(is_approved=True).all()))()
         if reviews:
-            view_reviews = await sync_to_async(Button.objects.get)(slug='view_reviews')
+            view_reviews = await catalog.button('view_reviews')
             keyboard.row(InlineKeyboardButton(text=view_reviews.rus, callback_data=WorkerDetailsCallBackFactory(object_name='reviews(job)', object_id=job.id).pack()))
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=back.rus, callback_data=WorkerBackCallBackFactory(destination='jobs-list').pack()))
 
     return keyboard.as_markup()
@@ -377,7 +382,7 @@ async def worker_job_detail_redirect(redirect, job_id):
 
     job = await sync_to_async(Job.objects.filter(id=job_id).first)()
     if job:
-        view = await sync_to_async(Button.objects.get)(slug='view')
+        view = await catalog.button('view')
 
         keyboard.row(InlineKeyboardButton(text=view.rus, callback_data=WorkerRedirectDetailsCallBackFactory(redirect=redirect, object_name='job', object_id=job.id).pack()))
     
@@ -391,10 +396,10 @@ async def worker_job_detail_back(job_id, proposal_id):
     proposal = await sync_to_async(WorkerCooperationProposal.objects.filter(id=proposal_id).first)()
     if job and proposal:
         if proposal.is_accepted is False:
-            resend_proposal = await sync_to_async(Button.objects.get)(slug='resend_proposal')
+            resend_proposal = await catalog.button('resend_proposal')
             keyboard.row(InlineKeyboardButton(text=resend_proposal.rus, callback_data=WorkerControlsCallBackFactory(control='proposal', action='resend', object_id=job.id).pack()))
 
-        back = await sync_to_async(Button.objects.get)(slug='back')
+        back = await catalog.button('back')
         keyboard.row(InlineKeyboardButton(text=back.rus, callback_data=WorkerDetailsCallBackFactory(object_name='job', object_id=job.id).pack()))
     
     return keyboard.as_markup()
@@ -403,7 +408,7 @@ async def worker_job_detail_back(job_id, proposal_id):
 async def worker_proposal_detail_back_only(proposal_id):
     keyboard = InlineKeyboardBuilder()
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=back.rus, callback_data=WorkerDetailsCallBackFactory(object_name='inbox-proposal', object_id=proposal_id).pack()))
     
     return keyboard.as_markup()
@@ -412,39 +417,31 @@ async def worker_proposal_detail_back_only(proposal_id):
 async def worker_job_detail_back_only(job_id):
     keyboard = InlineKeyboardBuilder()
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=back.rus, callback_data=WorkerDetailsCallBackFactory(object_name='job', object_id=job_id).pack()))
     
     return keyboard.as_markup()
 
 
-async def worker_proposals_list_keyboard(page, destination, user_id):
+async def worker_proposals_list_keyboard(page, destination, worker):
     keyboard = InlineKeyboardBuilder()
 
     proposals = []
 
-    worker = await sync_to_async(Worker.objects.filter(tg_id=user_id).first)()
     if worker:
         if destination == 'outbox-proposals':
             proposal_type = 'outbox-proposal'
-            proposals = await sync_to_async(lambda: list(WorkerCooperationProposal.objects.filter(
+            proposals = WorkerCooperationProposal.objects.filter(
                 worker=worker,
-                ).distinct()))()
+                ).distinct()
         elif destination == 'inbox-proposals':
             proposal_type = 'inbox-proposal'
-            proposals = await sync_to_async(lambda: list(EmployerCooperationProposal.objects.filter(
+            proposals = EmployerCooperationProposal.objects.filter(
                 worker=worker,
-                ).distinct()))()
+                ).distinct()
 
+    proposals, page, pages_count = await executor.run(paginate, proposals, page)
     if proposals:
-        proposals_count = len(proposals)
-        pages_count = math.ceil(proposals_count / PER_PAGE)
-
-        if page > pages_count:
-            page = pages_count
-
-        proposals = proposals[(page - 1) * PER_PAGE:page * PER_PAGE]
-
         for num, proposal in enumerate(proposals):
             order_num = num + 1 + (PER_PAGE * (page -1))
             updated_date = proposal.updated_at.strftime('%d.%m.%Y')
@@ -458,20 +455,9 @@ async def worker_proposals_list_keyboard(page, destination, user_id):
 
             keyboard.row(InlineKeyboardButton(text=f'{order_num}. {symbol} {updated_date}', callback_data=WorkerDetailsCallBackFactory(object_name=proposal_type, object_id=proposal.id).pack()))
 
-        nav = []
-        if pages_count >= 2:
-            if page == 1:
-                nav.append(InlineKeyboardButton(text=f'<<', callback_data='nothing'))
-            else:
-                nav.append(InlineKeyboardButton(text=f'<<', callback_data=WorkerPagesSectionsCallBackFactory(destination=destination, page=page-1).pack()))
-            nav.append(InlineKeyboardButton(text=f'{page}/{pages_count}', callback_data=f'nothing'))
-            if page == pages_count:
-                nav.append(InlineKeyboardButton(text=f'>>', callback_data='nothing'))
-            else:
-                nav.append(InlineKeyboardButton(text=f'>>', callback_data=WorkerPagesSectionsCallBackFactory(destination=destination, page=page+1).pack()))
-        keyboard.row(*nav)
+        keyboard.row(*navigation_row(WorkerPagesSectionsCallBackFactory, destination, page, pages_count))
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=back.rus, callback_data=WorkerMainSectionsCallBackFactory(destination='proposals').pack()))
 
     return keyboard.as_markup()
@@ -484,17 +470,17 @@ async def worker_outbox_proposal_details_keyboard(job_id, proposal_id):
     proposal = await sync_to_async(WorkerCooperationProposal.objects.filter(id=proposal_id).first)()
     if job and proposal:
         if proposal.is_accepted is False:
-            resend_proposal = await sync_to_async(Button.objects.get)(slug='resend_proposal')
+            resend_proposal = await catalog.button('resend_proposal')
             keyboard.row(InlineKeyboardButton(text=resend_proposal.rus, callback_data=WorkerControlsCallBackFactory(control='outbox-proposal', action='resend', object_id=job.id).pack()))
         elif proposal.is_accepted is True:
             employer = await sync_to_async(lambda: proposal.employer)()
             worker = await sync_to_async(lambda: proposal.worker)()
             prev_review = await sync_to_async(WorkerReview.objects.filter(Q(worker=worker) & Q(employer=employer)).first)()
             if not prev_review:
-                add_review = await sync_to_async(Button.objects.get)(slug='add_review')
+                add_review = await catalog.button('add_review')
                 keyboard.row(InlineKeyboardButton(text=add_review.rus, callback_data=WorkerControlsCallBackFactory(control='review', action='add', object_id=employer.id).pack()))
                 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=back.rus, callback_data=WorkerBackCallBackFactory(destination='proposals-list').pack()))
 
     return keyboard.as_markup()
@@ -506,8 +492,8 @@ async def worker_inbox_proposal_details_keyboard(proposal_id):
     proposal = await sync_to_async(EmployerCooperationProposal.objects.filter(id=proposal_id).first)()
     if proposal:
         if proposal.is_accepted is None:
-            accept = await sync_to_async(Button.objects.get)(slug='accept')
-            decline = await sync_to_async(Button.objects.get)(slug='decline')
+            accept = await catalog.button('accept')
+            decline = await catalog.button('decline')
             keyboard.row(InlineKeyboardButton(text=accept.rus, callback_data=WorkerControlsCallBackFactory(control='inbox-proposal', action='accept', object_id=proposal.id).pack()))
             keyboard.row(InlineKeyboardButton(text=decline.rus, callback_data=WorkerControlsCallBackFactory(control='inbox-proposal', action='decline', object_id=proposal.id).pack()))
         elif proposal.is_accepted is True:
@@ -515,22 +501,22 @@ async def worker_inbox_proposal_details_keyboard(proposal_id):
             worker = await sync_to_async(lambda: proposal.worker)()
             prev_review = await sync_to_async(WorkerReview.objects.filter(Q(worker=worker) & Q(employer=employer)).first)()
             if not prev_review:
-                add_review = await sync_to_async(Button.objects.get)(slug='add_review')
+                add_review = await catalog.button('add_review')
                 keyboard.row(InlineKeyboardButton(text=add_review.rus, callback_data=WorkerControlsCallBackFactory(control='review', action='add', object_id=employer.id).pack()))
 
     employer = await sync_to_async(lambda: proposal.employer)()
     if employer:
         jobs = await sync_to_async(lambda: list(employer.jobs.filter(Q(is_approved=True) & Q(is_active=True)).all()))()
         if jobs:
-            view_jobs = await sync_to_async(Button.objects.get)(slug='view_employer_jobs')
+            view_jobs = await catalog.button('view_employer_jobs')
             keyboard.row(InlineKeyboardButton(text=view_jobs.rus, callback_data=WorkerDetailsCallBackFactory(object_name='jobs', object_id=proposal.id).pack()))
 
         reviews = await sync_to_async(lambda: list(employer.received_reviews.filter(is_approved=True).all()))()
         if reviews:
-            view_reviews = await sync_to_async(Button.objects.get)(slug='view_reviews')
+            view_reviews = await catalog.button('view_reviews')
             keyboard.row(InlineKeyboardButton(text=view_reviews.rus, callback_data=WorkerDetailsCallBackFactory(object_name='reviews(proposal)', object_id=proposal.id).pack()))
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=back.rus, callback_data=WorkerBackCallBackFactory(destination='proposals-list').pack()))
 
     return keyboard.as_markup()
@@ -541,7 +527,7 @@ async def worker_outbox_response_detail_redirect(proposal_id):
 
     proposal = await sync_to_async(WorkerCooperationProposal.objects.filter(id=proposal_id).first)()
     if proposal:
-        view = await sync_to_async(Button.objects.get)(slug='view')
+        view = await catalog.button('view')
 
         keyboard.row(InlineKeyboardButton(text=view.rus, callback_data=WorkerRedirectDetailsCallBackFactory(redirect='outbox-proposals', object_name='outbox-proposal', object_id=proposal.id).pack()))
     
@@ -553,13 +539,14 @@ async def worker_inbox_response_detail_redirect(proposal_id):
 
     proposal = await sync_to_async(EmployerCooperationProposal.objects.filter(id=proposal_id).first)()
     if proposal:
-        view = await sync_to_async(Button.objects.get)(slug='view')
+        view = await catalog.button('view')
 
         keyboard.row(InlineKeyboardButton(text=view.rus, callback_data=WorkerRedirectDetailsCallBackFactory(redirect='inbox-proposals', object_name='inbox-proposal', object_id=proposal.id).pack()))
     
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def worker_review_rate_keyboard():
     keyboard = InlineKeyboardBuilder()
 
@@ -574,11 +561,12 @@ async def worker_review_rate_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def worker_review_text_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    add_review = await sync_to_async(Button.objects.get)(slug='add_review')
-    next_step = await sync_to_async(Button.objects.get)(slug='next_step')
+    add_review = await catalog.button('add_review')
+    next_step = await catalog.button('next_step')
 
     keyboard.row(InlineKeyboardButton(text=add_review.rus, callback_data=WorkerControlsCallBackFactory(control='review', action='text').pack()))
     keyboard.row(InlineKeyboardButton(text=next_step.rus, callback_data=WorkerControlsCallBackFactory(control='review', action='skip').pack()))
@@ -586,11 +574,12 @@ async def worker_review_text_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def worker_review_confirmation_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    confirm = await sync_to_async(Button.objects.get)(slug='confirm')
-    retype = await sync_to_async(Button.objects.get)(slug='retype')
+    confirm = await catalog.button('confirm')
+    retype = await catalog.button('retype')
 
     keyboard.row(InlineKeyboardButton(text=confirm.rus, callback_data=WorkerControlsCallBackFactory(control='review', action='confirm').pack()))
     keyboard.row(InlineKeyboardButton(text=retype.rus, callback_data=WorkerControlsCallBackFactory(control='review', action='retype').pack()))
@@ -598,34 +587,26 @@ async def worker_review_confirmation_keyboard():
     return keyboard.as_markup()
 
 
-async def worker_reviews_list_keyboard(page, destination, user_id):
+async def worker_reviews_list_keyboard(page, destination, worker):
     keyboard = InlineKeyboardBuilder()
 
     reviews = []
 
-    worker = await sync_to_async(Worker.objects.filter(tg_id=user_id).first)()
     if worker:
         if destination == 'outbox-reviews':
             review_type = 'outbox-review'
-            reviews = await sync_to_async(lambda: list(WorkerReview.objects.filter(
+            reviews = WorkerReview.objects.filter(
                 worker=worker,
-                ).distinct()))()
+                ).distinct()
         elif destination == 'inbox-reviews':
             review_type = 'inbox-review'
-            reviews = await sync_to_async(lambda: list(EmployerReview.objects.filter(
+            reviews = EmployerReview.objects.filter(
                 Q(worker=worker) &
                 Q(is_approved=True)
-                ).distinct()))()
+                ).distinct()
 
+    reviews, page, pages_count = await executor.run(paginate, reviews, page)
     if reviews:
-        reviews_count = len(reviews)
-        pages_count = math.ceil(reviews_count / PER_PAGE)
-
-        if page > pages_count:
-            page = pages_count
-
-        reviews = reviews[(page - 1) * PER_PAGE:page * PER_PAGE]
-
         for num, review in enumerate(reviews):
             order_num = num + 1 + (PER_PAGE * (page -1))
             created_date = review.created_at.strftime('%d.%m.%Y')
@@ -644,29 +625,19 @@ async def worker_reviews_list_keyboard(page, destination, user_id):
 
             keyboard.row(InlineKeyboardButton(text=text_button, callback_data=WorkerDetailsCallBackFactory(object_name=review_type, object_id=review.id).pack()))
 
-        nav = []
-        if pages_count >= 2:
-            if page == 1:
-                nav.append(InlineKeyboardButton(text=f'<<', callback_data='nothing'))
-            else:
-                nav.append(InlineKeyboardButton(text=f'<<', callback_data=WorkerPagesSectionsCallBackFactory(destination=destination, page=page-1).pack()))
-            nav.append(InlineKeyboardButton(text=f'{page}/{pages_count}', callback_data=f'nothing'))
-            if page == pages_count:
-                nav.append(InlineKeyboardButton(text=f'>>', callback_data='nothing'))
-            else:
-                nav.append(InlineKeyboardButton(text=f'>>', callback_data=WorkerPagesSectionsCallBackFactory(destination=destination, page=page+1).pack()))
-        keyboard.row(*nav)
+        keyboard.row(*navigation_row(WorkerPagesSectionsCallBackFactory, destination, page, pages_count))
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=back.rus, callback_data=WorkerMainSectionsCallBackFactory(destination='reviews').pack()))
 
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def worker_reviews_back_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=back.rus, callback_data=WorkerBackCallBackFactory(destination='reviews-list').pack()))
 
     return keyboard.as_markup()
@@ -677,7 +648,7 @@ async def worker_outbox_review_detail_redirect(review_id):
 
     review = await sync_to_async(WorkerReview.objects.filter(id=review_id).first)()
     if review:
-        view = await sync_to_async(Button.objects.get)(slug='view')
+        view = await catalog.button('view')
         keyboard.row(InlineKeyboardButton(text=view.rus, callback_data=WorkerRedirectDetailsCallBackFactory(redirect='outbox-reviews', object_name='outbox-review', object_id=review.id).pack()))
     
     return keyboard.as_markup()
@@ -688,7 +659,7 @@ async def worker_inbox_review_detail_redirect(review_id):
 
     review = await sync_to_async(EmployerReview.objects.filter(id=review_id).first)()
     if review:
-        view = await sync_to_async(Button.objects.get)(slug='view')
+        view = await catalog.button('view')
         keyboard.row(InlineKeyboardButton(text=view.rus, callback_data=WorkerRedirectDetailsCallBackFactory(redirect='inbox-reviews', object_name='inbox-review', object_id=review.id).pack()))
     
     return keyboard.as_markup()
@@ -697,11 +668,12 @@ async def worker_inbox_review_detail_redirect(review_id):
 #* <------------------------------------------------->
 #! Клавиатуры для работодателей
 #* <------------------------------------------------->
+@static_keyboard
 async def employer_profile_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    change_data = await sync_to_async(Button.objects.get)(slug='change_data')
-    main_menu = await sync_to_async(Button.objects.get)(slug='main_menu')
+    change_data = await catalog.button('change_data')
+    main_menu = await catalog.button('main_menu')
 
     keyboard.row(InlineKeyboardButton(text=f'\u202B{change_data.heb}', callback_data=EmployerControlsCallBackFactory(control='data', action='change').pack()))
     keyboard.row(InlineKeyboardButton(text=f'\u202B{main_menu.heb}', callback_data=EmployerBackCallBackFactory(destination='main').pack()))
@@ -709,14 +681,15 @@ async def employer_profile_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def employer_main_menu():
     keyboard = InlineKeyboardBuilder()
 
-    profile = await sync_to_async(Button.objects.get)(slug='profile')
-    jobs = await sync_to_async(Button.objects.get)(slug='my_jobs')
-    workers = await sync_to_async(Button.objects.get)(slug='workers')
-    proposals = await sync_to_async(Button.objects.get)(slug='cooperation_proposals')
-    reviews = await sync_to_async(Button.objects.get)(slug='reviews')
+    profile = await catalog.button('profile')
+    jobs = await catalog.button('my_jobs')
+    workers = await catalog.button('workers')
+    proposals = await catalog.button('cooperation_proposals')
+    reviews = await catalog.button('reviews')
 
     keyboard.row(InlineKeyboardButton(text=f'\u202B{profile.heb}', callback_data=EmployerMainSectionsCallBackFactory(destination='profile').pack()))
     keyboard.row(InlineKeyboardButton(text=f'\u202B{jobs.heb}', callback_data=EmployerMainSectionsCallBackFactory(destination='jobs').pack()))
@@ -727,14 +700,15 @@ async def employer_main_menu():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def employer_jobs_menu_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    jobs_active = await sync_to_async(Button.objects.get)(slug='jobs_active')
-    jobs_archive = await sync_to_async(Button.objects.get)(slug='jobs_archive')
-    jobs_declined = await sync_to_async(Button.objects.get)(slug='jobs_declined')
-    job_create = await sync_to_async(Button.objects.get)(slug='job_create')
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    jobs_active = await catalog.button('jobs_active')
+    jobs_archive = await catalog.button('jobs_archive')
+    jobs_declined = await catalog.button('jobs_declined')
+    job_create = await catalog.button('job_create')
+    back = await catalog.button('back')
 
 
     keyboard.row(InlineKeyboardButton(text=f'\u202B{jobs_active.heb}', callback_data=EmployerPagesSectionsCallBackFactory(destination='jobs-active').pack()))
@@ -746,12 +720,13 @@ async def employer_jobs_menu_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def employer_workers_menu_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    workers_all = await sync_to_async(Button.objects.get)(slug='workers_all')
-    workers_suitable = await sync_to_async(Button.objects.get)(slug='workers_suitable')
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    workers_all = await catalog.button('workers_all')
+    workers_suitable = await catalog.button('workers_suitable')
+    back = await catalog.button('back')
 
 
     keyboard.row(InlineKeyboardButton(text=f'\u202B{workers_all.heb}', callback_data=EmployerPagesSectionsCallBackFactory(destination='workers-all').pack()))
@@ -761,12 +736,13 @@ async def employer_workers_menu_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def employer_proposals_menu_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    inbox = await sync_to_async(Button.objects.get)(slug='inbox')
-    outbox = await sync_to_async(Button.objects.get)(slug='outbox')
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    inbox = await catalog.button('inbox')
+    outbox = await catalog.button('outbox')
+    back = await catalog.button('back')
 
 
     keyboard.row(InlineKeyboardButton(text=f'\u202B{inbox.heb}', callback_data=EmployerPagesSectionsCallBackFactory(destination='inbox-proposals').pack()))
@@ -776,12 +752,13 @@ async def employer_proposals_menu_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def employer_reviews_menu_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    inbox = await sync_to_async(Button.objects.get)(slug='inbox')
-    outbox = await sync_to_async(Button.objects.get)(slug='outbox')
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    inbox = await catalog.button('inbox')
+    outbox = await catalog.button('outbox')
+    back = await catalog.button('back')
 
 
     keyboard.row(InlineKeyboardButton(text=f'\u202B{inbox.heb}', callback_data=EmployerPagesSectionsCallBackFactory(destination='inbox-reviews').pack()))
@@ -791,11 +768,12 @@ async def employer_reviews_menu_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def employer_job_notification_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    yes_button = await sync_to_async(Button.objects.get)(slug='yes')
-    no_button = await sync_to_async(Button.objects.get)(slug='no')
+    yes_button = await catalog.button('yes')
+    no_button = await catalog.button('no')
 
     no_kb = InlineKeyboardButton(text=f'\u202B{no_button.heb}', callback_data=EmployerControlsCallBackFactory(control='notifications', action='no').pack())
     yes_kb = InlineKeyboardButton(text=f'\u202B{yes_button.heb}', callback_data=EmployerControlsCallBackFactory(control='notifications', action='yes').pack())
@@ -805,11 +783,12 @@ async def employer_job_notification_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def employer_job_confirmation_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    confirm_button = await sync_to_async(Button.objects.get)(slug='confirm')
-    retype_button = await sync_to_async(Button.objects.get)(slug='retype')
+    confirm_button = await catalog.button('confirm')
+    retype_button = await catalog.button('retype')
 
     keyboard.add(InlineKeyboardButton(text=f'\u202B{retype_button.heb}', callback_data=EmployerControlsCallBackFactory(control='job', action='retype').pack()))
     keyboard.add(InlineKeyboardButton(text=f'\u202B{confirm_button.heb}', callback_data=EmployerControlsCallBackFactory(control='job', action='confirm').pack()))
@@ -817,78 +796,62 @@ async def employer_job_confirmation_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def employer_to_main_menu_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    main_menu = await sync_to_async(Button.objects.get)(slug='main_menu')
+    main_menu = await catalog.button('main_menu')
     keyboard.row(InlineKeyboardButton(text=f'\u202B{main_menu.heb}', callback_data=EmployerBackCallBackFactory(destination='main').pack()))
     
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def employer_to_jobs_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    jobs = await sync_to_async(Button.objects.get)(slug='my_jobs')
+    jobs = await catalog.button('my_jobs')
     keyboard.row(InlineKeyboardButton(text=f'\u202B{jobs.heb}', callback_data=EmployerMainSectionsCallBackFactory(destination='jobs').pack()))
     
     return keyboard.as_markup()
 
 
-async def employer_jobs_list_keyboard(page, destination, user_id):
+async def employer_jobs_list_keyboard(page, destination, employer):
     keyboard = InlineKeyboardBuilder()
 
     jobs = []
 
-    employer = await sync_to_async(Employer.objects.filter(tg_id=user_id).first)()
     if employer:
         if destination == 'jobs-active':
-            jobs = await sync_to_async(lambda: list(Job.objects.filter(
+            jobs = Job.objects.filter(
                 Q(employer=employer) &
                 Q(is_active=True) & 
                 (Q(is_approved=True) | Q(is_approved__isnull=True))
-                ).order_by('-updated_at').distinct()))()
+                ).order_by('-updated_at').distinct().with_occupations()
         elif destination == 'jobs-archive':
-            jobs = await sync_to_async(lambda: list(Job.objects.filter(
+            jobs = Job.objects.filter(
                 Q(employer=employer) &
                 Q(is_active=False) & 
                 Q(is_approved=True)
-                ).order_by('-updated_at').distinct()))()
+                ).order_by('-updated_at').distinct().with_occupations()
         elif destination == 'jobs-declined':
-            jobs = await sync_to_async(lambda: list(Job.objects.filter(
+            jobs = Job.objects.filter(
                 Q(employer=employer) &
                 Q(is_approved=False)
-                ).order_by('-updated_at').distinct()))()
+                ).order_by('-updated_at').distinct().with_occupations()
 
+    jobs, page, pages_count = await executor.run(paginate, jobs, page)
     if jobs:
-        jobs_count = len(jobs)
-        pages_count = math.ceil(jobs_count / PER_PAGE)
-
-        if page > pages_count:
-            page = pages_count
-
-        jobs = jobs[(page - 1) * PER_PAGE:page * PER_PAGE]
-        salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
+        salary_hourly = await catalog.text('salary_hourly')
 
         for num, job in enumerate(jobs):
-            readable_occupations = await sync_to_async(lambda: job.readable_heb_occupations)()
+            readable_occupations = job.readable_heb_occupations
             order_num = num + 1 + (PER_PAGE * (page -1))
             keyboard.row(InlineKeyboardButton(text=f'\u202B{order_num}. {job.min_salary} {salary_hourly.heb}: {readable_occupations}', callback_data=EmployerDetailsCallBackFactory(object_name='job', object_id=job.id).pack()))
 
-        nav = []
-        if pages_count >= 2:
-            if page == 1:
-                nav.append(InlineKeyboardButton(text=f'<<', callback_data='nothing'))
-            else:
-                nav.append(InlineKeyboardButton(text=f'<<', callback_data=EmployerPagesSectionsCallBackFactory(destination=destination, page=page-1).pack()))
-            nav.append(InlineKeyboardButton(text=f'\u202B{page}/{pages_count}', callback_data=f'nothing'))
-            if page == pages_count:
-                nav.append(InlineKeyboardButton(text=f'>>', callback_data='nothing'))
-            else:
-                nav.append(InlineKeyboardButton(text=f'>>', callback_data=EmployerPagesSectionsCallBackFactory(destination=destination, page=page+1).pack()))
-        keyboard.row(*nav)
+        keyboard.row(*navigation_row(EmployerPagesSectionsCallBackFactory, destination, page, pages_count, rtl=True))
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=f'\u202B{back.heb}', callback_data=EmployerMainSectionsCallBackFactory(destination='jobs').pack()))
 
     return keyboard.as_markup()
@@ -899,10 +862,10 @@ async def employer_jobs_edit_keyboard(job_id):
 
     job = await sync_to_async(Job.objects.filter(id=job_id).first)()
     if job:
-        activate = await sync_to_async(Button.objects.get)(slug='activate')
-        deactivate = await sync_to_async(Button.objects.get)(slug='deactivate')
-        enable_notifications = await sync_to_async(Button.objects.get)(slug='enable_notifications')
-        disable_notifications = await sync_to_async(Button.objects.get)(slug='disable_notifications')
+        activate = await catalog.button('activate')
+        deactivate = await catalog.button('deactivate')
+        enable_notifications = await catalog.button('enable_notifications')
+        disable_notifications = await catalog.button('disable_notifications')
 
         if job.is_approved:
             if job.is_active:
@@ -915,98 +878,71 @@ async def employer_jobs_edit_keyboard(job_id):
             else:
                 keyboard.row(InlineKeyboardButton(text=f'\u202B{activate.heb}', callback_data=EmployerControlsCallBackFactory(control='active', action='yes', object_id=job_id).pack()))
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=f'\u202B{back.heb}', callback_data=EmployerBackCallBackFactory(destination='jobs-list').pack()))
 
     return keyboard.as_markup()
 
 
-async def employer_workers_list_keyboard(page, destination, user_id):
+async def employer_workers_list_keyboard(page, destination, employer, cursor=''):
     keyboard = InlineKeyboardBuilder()
 
     workers = []
+    prev_cursor = next_cursor = ''
 
     if destination == 'workers-all':
-        workers = await sync_to_async(lambda: list(Worker.objects.filter(
+        workers = Worker.objects.filter(
             Q(is_approved=True) & 
             Q(is_searching=True)
-            ).distinct()))()
+            ).distinct().with_occupations()
     elif destination == 'workers-suitable':
-        employer = await sync_to_async(Employer.objects.filter(tg_id=user_id).first)()
-        if employer:
-            workers = []
-            employer_jobs = await sync_to_async(lambda: list(employer.jobs.filter(
-                Q(is_approved=True) & 
-                Q(is_active=True)
-                ).distinct()))()
-
-            for job in employer_jobs:
-                occupations = await sync_to_async(lambda: list(job.occupations.all()))()
-                suitable_workers = await sync_to_async(lambda: list(Worker.objects.filter(
-                    Q(is_searching=True) & 
-                    Q(is_approved=True) &
-                    Q(min_salary__lte=job.min_salary) &
-                    Q(occupations__in=occupations)
-                    ).distinct()))()
-                
-                for worker in suitable_workers:
-                    if worker not in workers:
-                        workers.append(worker)
-
-    if workers:
-        workers_count = len(workers)
-        pages_count = math.ceil(workers_count / PER_PAGE)
+        if employer and MATCHING_INDEX:
+            workers = await executor.run(matching.suitable_worker_ids, employer.id)
+        elif employer:
+            workers = Worker.objects.suitable_for_employer(employer).with_occupations()
 
-        if page > pages_count:
-            page = pages_count
+    if destination == 'workers-all':
+        workers, page, pages_count, prev_cursor, next_cursor = await executor.run(paginate_keyset, workers, page, cursor)
+    elif MATCHING_INDEX:
+        workers, page, pages_count = await executor.run(paginate_ids, Worker.objects.with_occupations(), workers, page)
+    else:
+        workers, page, pages_count = await executor.run(paginate, workers, page)
 
-        workers = workers[(page - 1) * PER_PAGE:page * PER_PAGE]
-        salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
+    if workers:
+        salary_hourly = await catalog.text('salary_hourly')
 
         for num, worker in enumerate(workers):
-            readable_occupations = await sync_to_async(lambda: worker.readable_heb_occupations)()
+            readable_occupations = worker.readable_heb_occupations
             order_num = num + 1 + (PER_PAGE * (page -1))
             keyboard.row(InlineKeyboardButton(text=f'\u202B{order_num}. {worker.min_salary} {salary_hourly.heb}: {readable_occupations}', callback_data=EmployerDetailsCallBackFactory(object_name='worker', object_id=worker.id).pack()))
 
-        nav = []
-        if pages_count >= 2:
-            if page == 1:
-                nav.append(InlineKeyboardButton(text=f'<<', callback_data='nothing'))
-            else:
-                nav.append(InlineKeyboardButton(text=f'<<', callback_data=EmployerPagesSectionsCallBackFactory(destination=destination, page=page-1).pack()))
-            nav.append(InlineKeyboardButton(text=f'\u202B{page}/{pages_count}', callback_data=f'nothing'))
-            if page == pages_count:
-                nav.append(InlineKeyboardButton(text=f'>>', callback_data='nothing'))
-            else:
-                nav.append(InlineKeyboardButton(text=f'>>', callback_data=EmployerPagesSectionsCallBackFactory(destination=destination, page=page+1).pack()))
-        keyboard.row(*nav)
+        keyboard.row(*navigation_row(EmployerPagesSectionsCallBackFactory, destination, page, pages_count, rtl=True, prev_cursor=prev_cursor, next_cursor=next_cursor))
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=f'\u202B{back.heb}', callback_data=EmployerMainSectionsCallBackFactory(destination='workers').pack()))
 
     return keyboard.as_markup()
 
 
-async def employer_worker_details_keyboard(worker_id, employer_tg_id):
+async def employer_worker_details_keyboard(worker_id, employer):
     keyboard = InlineKeyboardBuilder()
 
     worker = await sync_to_async(Worker.objects.filter(id=worker_id).first)()
-    employer = await sync_to_async(Employer.objects.filter(tg_id=employer_tg_id).first)()
     if worker and employer:
         proposal = await sync_to_async(EmployerCooperationProposal.objects.filter(Q(worker=worker) & Q(employer=employer)).first)()
         if proposal:
-            view_proposal = await sync_to_async(Button.objects.get)(slug='view_proposal')
+            view_proposal = await catalog.button('view_proposal')
             keyboard.row(InlineKeyboardButton(text=f'\u202B{view_proposal.heb}', callback_data=EmployerDetailsCallBackFactory(object_name='proposal', object_id=proposal.id).pack()))
         else:
-            make_proposal = await sync_to_async(Button.objects.get)(slug='make_proposal')
+            make_proposal = await catalog.button('make_proposal')
             keyboard.row(InlineKeyboardButton(text=f'\u202B{make_proposal.heb}', callback_data=EmployerControlsCallBackFactory(control='proposal', action='make', object_id=worker.id).pack()))
 
         reviews = await sync_to_async(lambda: list(worker.received_reviews.filter(is_approved=True).all()))()
         if reviews:
-            view_reviews = await sync_to_async(Button.objects.get)(slug='view_reviews')
+            view_reviews = await catalog.button('view_reviews')
             keyboard.row(InlineKeyboardButton(text=f'\u202B{view_reviews.heb}', callback_data=EmployerDetailsCallBackFactory(object_name='reviews(worker)', object_id=worker.id).pack()))
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=f'\u202B{back.heb}', callback_data=EmployerBackCallBackFactory(destination='workers-list').pack()))
 
     return keyboard.as_markup()
@@ -1017,7 +953,7 @@ async def employer_job_detail_redirect(redirect, job_id):
 
     job = await sync_to_async(Job.objects.filter(id=job_id).first)()
     if job:
-        view = await sync_to_async(Button.objects.get)(slug='view')
+        view = await catalog.button('view')
 
         keyboard.row(InlineKeyboardButton(text=f'\u202B{view.heb}', callback_data=EmployerRedirectDetailsCallBackFactory(redirect=redirect, object_name='job', object_id=job.id).pack()))
     
@@ -1029,7 +965,7 @@ async def employer_worker_detail_redirect(redirect, worker_id):
 
     worker = await sync_to_async(Worker.objects.filter(id=worker_id).first)()
     if worker:
-        view = await sync_to_async(Button.objects.get)(slug='view')
+        view = await catalog.button('view')
 
         keyboard.row(InlineKeyboardButton(text=f'\u202B{view.heb}', callback_data=EmployerRedirectDetailsCallBackFactory(redirect=redirect, object_name='worker', object_id=worker.id).pack()))
     
@@ -1043,42 +979,34 @@ async def employer_worker_detail_back(worker_id, proposal_id):
     proposal = await sync_to_async(EmployerCooperationProposal.objects.filter(id=proposal_id).first)()
     if worker and proposal:
         if proposal.is_accepted is False:
-            resend_proposal = await sync_to_async(Button.objects.get)(slug='resend_proposal')
+            resend_proposal = await catalog.button('resend_proposal')
             keyboard.row(InlineKeyboardButton(text=f'\u202B{resend_proposal.heb}', callback_data=EmployerControlsCallBackFactory(control='proposal', action='resend', object_id=worker.id).pack()))
 
-        back = await sync_to_async(Button.objects.get)(slug='back')
+        back = await catalog.button('back')
         keyboard.row(InlineKeyboardButton(text=f'\u202B{back.heb}', callback_data=EmployerDetailsCallBackFactory(object_name='worker', object_id=worker.id).pack()))
     
     return keyboard.as_markup()
 
 
-async def employer_proposals_list_keyboard(page, destination, user_id):
+async def employer_proposals_list_keyboard(page, destination, employer):
     keyboard = InlineKeyboardBuilder()
 
     proposals = []
 
-    employer = await sync_to_async(Employer.objects.filter(tg_id=user_id).first)()
     if employer:
         if destination == 'outbox-proposals':
             proposal_type = 'outbox-proposal'
-            proposals = await sync_to_async(lambda: list(EmployerCooperationProposal.objects.filter(
+            proposals = EmployerCooperationProposal.objects.filter(
                 employer=employer,
-                ).distinct()))()
+                ).distinct()
         elif destination == 'inbox-proposals':
             proposal_type = 'inbox-proposal'
-            proposals = await sync_to_async(lambda: list(WorkerCooperationProposal.objects.filter(
+            proposals = WorkerCooperationProposal.objects.filter(
                 employer=employer,
-                ).distinct()))()
+                ).distinct()
 
+    proposals, page, pages_count = await executor.run(paginate, proposals, page)
     if proposals:
-        proposals_count = len(proposals)
-        pages_count = math.ceil(proposals_count / PER_PAGE)
-
-        if page > pages_count:
-            page = pages_count
-
-        proposals = proposals[(page - 1) * PER_PAGE:page * PER_PAGE]
-
         for num, proposal in enumerate(proposals):
             order_num = num + 1 + (PER_PAGE * (page -1))
             updated_date = proposal.updated_at.strftime('%d.%m.%Y')
@@ -1092,20 +1020,9 @@ async def employer_proposals_list_keyboard(page, destination, user_id):
 
             keyboard.row(InlineKeyboardButton(text=f'\u202B{updated_date} {symbol} .{order_num}', callback_data=EmployerDetailsCallBackFactory(object_name=proposal_type, object_id=proposal.id).pack()))
 
-        nav = []
-        if pages_count >= 2:
-            if page == 1:
-                nav.append(InlineKeyboardButton(text=f'<<', callback_data='nothing'))
-            else:
-                nav.append(InlineKeyboardButton(text=f'<<', callback_data=EmployerPagesSectionsCallBackFactory(destination=destination, page=page-1).pack()))
-            nav.append(InlineKeyboardButton(text=f'\u202B{page}/{pages_count}', callback_data=f'nothing'))
-            if page == pages_count:
-                nav.append(InlineKeyboardButton(text=f'>>', callback_data='nothing'))
-            else:
-                nav.append(InlineKeyboardButton(text=f'>>', callback_data=EmployerPagesSectionsCallBackFactory(destination=destination, page=page+1).pack()))
-        keyboard.row(*nav)
+        keyboard.row(*navigation_row(EmployerPagesSectionsCallBackFactory, destination, page, pages_count, rtl=True))
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=f'\u202B{back.heb}', callback_data=EmployerMainSectionsCallBackFactory(destination='proposals').pack()))
 
     return keyboard.as_markup()
@@ -1118,16 +1035,16 @@ async def employer_outbox_proposal_details_keyboard(worker_id, proposal_id):
     proposal = await sync_to_async(EmployerCooperationProposal.objects.filter(id=proposal_id).first)()
     if worker and proposal:
         if proposal.is_accepted is False:
-            resend_proposal = await sync_to_async(Button.objects.get)(slug='resend_proposal')
+            resend_proposal = await catalog.button('resend_proposal')
             keyboard.row(InlineKeyboardButton(text=f'\u202B{resend_proposal.heb}', callback_data=EmployerControlsCallBackFactory(control='outbox-proposal', action='resend', object_id=worker.id).pack()))
         elif proposal.is_accepted is True:
             employer = await sync_to_async(lambda: proposal.employer)()
             prev_review = await sync_to_async(EmployerReview.objects.filter(Q(worker=worker) & Q(employer=employer)).first)()
             if not prev_review:
-                add_review = await sync_to_async(Button.objects.get)(slug='add_review')
+                add_review = await catalog.button('add_review')
                 keyboard.row(InlineKeyboardButton(text=f'\u202B{add_review.heb}', callback_data=EmployerControlsCallBackFactory(control='review', action='add', object_id=worker.id).pack()))
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=f'\u202B{back.heb}', callback_data=EmployerBackCallBackFactory(destination='proposals-list').pack()))
 
     return keyboard.as_markup()
@@ -1140,23 +1057,23 @@ async def employer_inbox_proposal_details_keyboard(proposal_id):
     if proposal:
         worker = await sync_to_async(lambda: proposal.worker)()
         if proposal.is_accepted is None:
-            accept = await sync_to_async(Button.objects.get)(slug='accept')
-            decline = await sync_to_async(Button.objects.get)(slug='decline')
+            accept = await catalog.button('accept')
+            decline = await catalog.button('decline')
             keyboard.row(InlineKeyboardButton(text=f'\u202B{accept.heb}', callback_data=EmployerControlsCallBackFactory(control='inbox-proposal', action='accept', object_id=proposal.id).pack()))
             keyboard.row(InlineKeyboardButton(text=f'\u202B{decline.heb}', callback_data=EmployerControlsCallBackFactory(control='inbox-proposal', action='decline', object_id=proposal.id).pack()))
         elif proposal.is_accepted is True:
             employer = await sync_to_async(lambda: proposal.employer)()
             prev_review = await sync_to_async(EmployerReview.objects.filter(Q(worker=worker) & Q(employer=employer)).first)()
             if not prev_review:
-                add_review = await sync_to_async(Button.objects.get)(slug='add_review')
+                add_review = await catalog.button('add_review')
                 keyboard.row(InlineKeyboardButton(text=f'\u202B{add_review.heb}', callback_data=EmployerControlsCallBackFactory(control='review', action='add', object_id=worker.id).pack()))
 
         reviews = await sync_to_async(lambda: list(worker.received_reviews.filter(is_approved=True).all()))()
         if reviews:
-            view_reviews = await sync_to_async(Button.objects.get)(slug='view_reviews')
+            view_reviews = await catalog.button('view_reviews')
             keyboard.row(InlineKeyboardButton(text=f'\u202B{view_reviews.heb}', callback_data=EmployerDetailsCallBackFactory(object_name='reviews(proposal)', object_id=proposal.id).pack()))
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=f'\u202B{back.heb}', callback_data=EmployerBackCallBackFactory(destination='proposals-list').pack()))
 
     return keyboard.as_markup()
@@ -1167,7 +1084,7 @@ async def employer_outbox_response_detail_redirect(proposal_id):
 
     proposal = await sync_to_async(EmployerCooperationProposal.objects.filter(id=proposal_id).first)()
     if proposal:
-        view = await sync_to_async(Button.objects.get)(slug='view')
+        view = await catalog.button('view')
         keyboard.row(InlineKeyboardButton(text=f'\u202B{view.heb}', callback_data=EmployerRedirectDetailsCallBackFactory(redirect='outbox-proposals', object_name='outbox-proposal', object_id=proposal.id).pack()))
     
     return keyboard.as_markup()
@@ -1178,12 +1095,13 @@ async def employer_inbox_response_detail_redirect(proposal_id):
 
     proposal = await sync_to_async(WorkerCooperationProposal.objects.filter(id=proposal_id).first)()
     if proposal:
-        view = await sync_to_async(Button.objects.get)(slug='view')
+        view = await catalog.button('view')
         keyboard.row(InlineKeyboardButton(text=f'\u202B{view.heb}', callback_data=EmployerRedirectDetailsCallBackFactory(redirect='inbox-proposals', object_name='inbox-proposal', object_id=proposal.id).pack()))
     
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def employer_review_rate_keyboard():
     keyboard = InlineKeyboardBuilder()
 
@@ -1198,11 +1116,12 @@ async def employer_review_rate_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def employer_review_text_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    add_review = await sync_to_async(Button.objects.get)(slug='add_review')
-    next_step = await sync_to_async(Button.objects.get)(slug='next_step')
+    add_review = await catalog.button('add_review')
+    next_step = await catalog.button('next_step')
 
     keyboard.row(InlineKeyboardButton(text=f'\u202B{add_review.heb}', callback_data=EmployerControlsCallBackFactory(control='review', action='text').pack()))
     keyboard.row(InlineKeyboardButton(text=f'\u202B{next_step.heb}', callback_data=EmployerControlsCallBackFactory(control='review', action='skip').pack()))
@@ -1210,11 +1129,12 @@ async def employer_review_text_keyboard():
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def employer_review_confirmation_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    confirm = await sync_to_async(Button.objects.get)(slug='confirm')
-    retype = await sync_to_async(Button.objects.get)(slug='retype')
+    confirm = await catalog.button('confirm')
+    retype = await catalog.button('retype')
 
     keyboard.row(InlineKeyboardButton(text=f'\u202B{confirm.heb}', callback_data=EmployerControlsCallBackFactory(control='review', action='confirm').pack()))
     keyboard.row(InlineKeyboardButton(text=f'\u202B{retype.heb}', callback_data=EmployerControlsCallBackFactory(control='review', action='retype').pack()))
@@ -1222,34 +1142,26 @@ async def employer_review_confirmation_keyboard():
     return keyboard.as_markup()
 
 
-async def employer_reviews_list_keyboard(page, destination, user_id):
+async def employer_reviews_list_keyboard(page, destination, employer):
     keyboard = InlineKeyboardBuilder()
 
     reviews = []
 
-    employer = await sync_to_async(Employer.objects.filter(tg_id=user_id).first)()
     if employer:
         if destination == 'outbox-reviews':
             review_type = 'outbox-review'
-            reviews = await sync_to_async(lambda: list(EmployerReview.objects.filter(
+            reviews = EmployerReview.objects.filter(
                 employer=employer,
-                ).distinct()))()
+                ).distinct()
         elif destination == 'inbox-reviews':
             review_type = 'inbox-review'
-            reviews = await sync_to_async(lambda: list(WorkerReview.objects.filter(
+            reviews = WorkerReview.objects.filter(
                 Q(employer=employer) &
                 Q(is_approved=True)
-                ).distinct()))()
+                ).distinct()
 
+    reviews, page, pages_count = await executor.run(paginate, reviews, page)
     if reviews:
-        reviews_count = len(reviews)
-        pages_count = math.ceil(reviews_count / PER_PAGE)
-
-        if page > pages_count:
-            page = pages_count
-
-        reviews = reviews[(page - 1) * PER_PAGE:page * PER_PAGE]
-
         for num, review in enumerate(reviews):
             order_num = num + 1 + (PER_PAGE * (page -1))
             created_date = review.created_at.strftime('%d.%m.%Y')
@@ -1268,29 +1180,19 @@ async def employer_reviews_list_keyboard(page, destination, user_id):
 
             keyboard.row(InlineKeyboardButton(text=text_button, callback_data=EmployerDetailsCallBackFactory(object_name=review_type, object_id=review.id).pack()))
 
-        nav = []
-        if pages_count >= 2:
-            if page == 1:
-                nav.append(InlineKeyboardButton(text=f'<<', callback_data='nothing'))
-            else:
-                nav.append(InlineKeyboardButton(text=f'<<', callback_data=EmployerPagesSectionsCallBackFactory(destination=destination, page=page-1).pack()))
-            nav.append(InlineKeyboardButton(text=f'\u202B{page}/{pages_count}', callback_data=f'nothing'))
-            if page == pages_count:
-                nav.append(InlineKeyboardButton(text=f'>>', callback_data='nothing'))
-            else:
-                nav.append(InlineKeyboardButton(text=f'>>', callback_data=EmployerPagesSectionsCallBackFactory(destination=destination, page=page+1).pack()))
-        keyboard.row(*nav)
+        keyboard.row(*navigation_row(EmployerPagesSectionsCallBackFactory, destination, page, pages_count, rtl=True))
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=f'\u202B{back.heb}', callback_data=EmployerMainSectionsCallBackFactory(destination='reviews').pack()))
 
     return keyboard.as_markup()
 
 
+@static_keyboard
 async def employer_reviews_back_keyboard():
     keyboard = InlineKeyboardBuilder()
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=f'\u202B{back.heb}', callback_data=EmployerBackCallBackFactory(destination='reviews-list').pack()))
 
     return keyboard.as_markup()
@@ -1301,7 +1203,7 @@ async def employer_outbox_review_detail_redirect(review_id):
 
     review = await sync_to_async(EmployerReview.objects.filter(id=review_id).first)()
     if review:
-        view = await sync_to_async(Button.objects.get)(slug='view')
+        view = await catalog.button('view')
         keyboard.row(InlineKeyboardButton(text=f'\u202B{view.heb}', callback_data=EmployerRedirectDetailsCallBackFactory(redirect='outbox-reviews', object_name='outbox-review', object_id=review.id).pack()))
     
     return keyboard.as_markup()
@@ -1312,7 +1214,7 @@ async def employer_inbox_review_detail_redirect(review_id):
 
     review = await sync_to_async(WorkerReview.objects.filter(id=review_id).first)()
     if review:
-        view = await sync_to_async(Button.objects.get)(slug='view')
+        view = await catalog.button('view')
         keyboard.row(InlineKeyboardButton(text=f'\u202B{view.heb}', callback_data=EmployerRedirectDetailsCallBackFactory(redirect='inbox-reviews', object_name='inbox-review', object_id=review.id).pack()))
     
     return keyboard.as_markup()
@@ -1321,7 +1223,7 @@ async def employer_inbox_review_detail_redirect(review_id):
 async def employer_proposal_detail_back_only(proposal_id):
     keyboard = InlineKeyboardBuilder()
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=f'\u202B{back.heb}', callback_data=EmployerDetailsCallBackFactory(object_name='inbox-proposal', object_id=proposal_id).pack()))
     
     return keyboard.as_markup()
@@ -1330,7 +1232,7 @@ async def employer_proposal_detail_back_only(proposal_id):
 async def employer_worker_detail_back_only(worker_id):
     keyboard = InlineKeyboardBuilder()
 
-    back = await sync_to_async(Button.objects.get)(slug='back')
+    back = await catalog.button('back')
     keyboard.row(InlineKeyboardButton(text=f'\u202B{back.heb}', callback_data=EmployerDetailsCallBackFactory(object_name='worker', object_id=worker_id).pack()))
     
     return keyboard.as_markup()
@@ -0,0 +1,138 @@
+import datetime
+import math
+
+from aiogram.types import InlineKeyboardButton
+from django.db.models import Q
+
+from config import PER_PAGE
+
+
+EPOCH = datetime.datetime(1970, 1, 1)
+DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+
+
+def paginate(objects, page):
+    """Выборка одной страницы (синхронно): COUNT и LIMIT/OFFSET вместо загрузки всех строк.
+
+    Возвращает объекты страницы, номер страницы (не больше последней) и количество страниц.
+    """
+    if isinstance(objects, list):
+        objects_count = len(objects)
+    else:
+        objects_count = objects.count()
+
+    if not objects_count:
+        return [], page, 0
+
+    pages_count = math.ceil(objects_count / PER_PAGE)
+    if page > pages_count:
+        page = pages_count
+
+    return list(objects[(page - 1) * PER_PAGE:page * PER_PAGE]), page, pages_count
+
+
+def paginate_ids(queryset, ids, page):
+    """Страница по готовому списку id (синхронно): строки читаются одним запросом только для текущей страницы."""
+    ids, page, pages_count = paginate(ids, page)
+    objects = queryset.in_bulk(ids)
+
+    return [objects[object_id] for object_id in ids if object_id in objects], page, pages_count
+
+
+def _to_base36(number):
+    result = ''
+    while True:
+        number, digit = divmod(number, 36)
+        result = DIGITS[digit] + result
+        if not number:
+            return result
+
+
+def encode_cursor(direction, obj):
+    """Курсор для callback_data: направление (n - дальше, p - назад) и ключ (created_at, id) объекта.
+
+    В callback_data двоеточие служит разделителем, поэтому ключ записывается в base36 через точку.
+    """
+    delta = obj.created_at - EPOCH
+    microseconds = (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+    return f'{direction}{_to_base36(microseconds)}.{_to_base36(obj.id)}'
+
+
+def decode_cursor(cursor):
+    try:
+        direction = cursor[0]
+        microseconds, object_id = cursor[1:].split('.')
+        created_at = EPOCH + datetime.timedelta(microseconds=int(microseconds, 36))
+        object_id = int(object_id, 36)
+    except (IndexError, ValueError):
+        return None
+
+    if direction not in ('n', 'p'):
+        return None
+
+    return direction, created_at, object_id
+
+
+def paginate_keyset(queryset, page, cursor):
+    """Выборка страницы по курсору (синхронно) для списков, упорядоченных по (-created_at, -id).
+
+    Соседние страницы читаются диапазоном по индексу от последнего увиденного ключа,
+    поэтому не зависят от глубины страницы и не сдвигаются при добавлении новых записей.
+    Возвращает объекты страницы, номер страницы, количество страниц и курсоры на соседние страницы.
+    """
+    objects_count = queryset.count()
+    if not objects_count:
+        return [], page, 0, '', ''
+
+    pages_count = math.ceil(objects_count / PER_PAGE)
+    page = max(1, min(page, pages_count))
+
+    objects = []
+    key = decode_cursor(cursor)
+    if key:
+        direction, created_at, object_id = key
+        if direction == 'n':
+            objects = list(queryset.filter(
+                Q(created_at__lt=created_at) |
+                Q(created_at=created_at, id__lt=object_id)
+                ).order_by('-created_at', '-id')[:PER_PAGE])
+        else:
+            objects = list(queryset.filter(
+                Q(created_at__gt=created_at) |
+                Q(created_at=created_at, id__gt=object_id)
+                ).order_by('created_at', 'id')[:PER_PAGE])
+            objects.reverse()
+            # неполная предыдущая страница - значит дошли до начала списка
+            if len(objects) < PER_PAGE:
+                objects = []
+                page = 1
+
+    if not objects:
+        objects = list(queryset.order_by('-created_at', '-id')[(page - 1) * PER_PAGE:page * PER_PAGE])
+
+    prev_cursor = encode_cursor('p', objects[0]) if objects and page > 1 else ''
+    next_cursor = encode_cursor('n', objects[-1]) if objects and page < pages_count else ''
+
+    return objects, page, pages_count, prev_cursor, next_cursor
+
+
+def navigation_row(factory, destination, page, pages_count, rtl=False, prev_cursor='', next_cursor=''):
+    """Кнопки << страница/страниц >> для списков."""
+    nav = []
+    if pages_count >= 2:
+        if page == 1:
+            nav.append(InlineKeyboardButton(text='<<', callback_data='nothing'))
+        else:
+            nav.append(InlineKeyboardButton(text='<<', callback_data=factory(destination=destination, page=page-1, cursor=prev_cursor).pack()))
+
+        if rtl:
+            nav.append(InlineKeyboardButton(text=f'\u202B{page}/{pages_count}', callback_data='nothing'))
+        else:
+            nav.append(InlineKeyboardButton(text=f'{page}/{pages_count}', callback_data='nothing'))
+
+        if page == pages_count:
+            nav.append(InlineKeyboardButton(text='>>', callback_data='nothing'))
+        else:
+            nav.append(InlineKeyboardButton(text='>>', callback_data=factory(destination=destination, page=page+1, cursor=next_cursor).pack()))
+
+    return nav
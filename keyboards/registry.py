@@ -0,0 +1,66 @@
+import functools
+
+from aiogram.types import TelegramObject
+from pydantic import ConfigDict
+
+from core import catalog
+
+
+# Клавиатуры без пользовательских данных (меню, оценки, подтверждения) зависят только
+# от каталога кнопок, поэтому собираются один раз на снимок каталога и набор аргументов.
+# Разметка aiogram изменяема, поэтому в кэш кладется замороженный экземпляр: правка общего
+# объекта падает с ошибкой, а не портит клавиатуру всем остальным. Копировать на каждый вызов
+# не нужно, сериализуется он так же, как исходная разметка.
+_markups = {}
+_revision = None
+
+
+class _FrozenList(list):
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('cached keyboard is read-only')
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+    def __reduce_ex__(self, protocol):
+        # копия (copy/deepcopy) - обычный изменяемый список
+        return list, (list(self),)
+
+
+@functools.cache
+def _frozen_type(cls):
+    return type(cls.__name__, (cls,), {'model_config': ConfigDict(frozen=True), '__module__': cls.__module__})
+
+
+def _freeze(value):
+    if isinstance(value, TelegramObject):
+        fields = {name: _freeze(getattr(value, name)) for name in type(value).model_fields}
+        return _frozen_type(type(value)).model_construct(value.model_fields_set, **fields)
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+
+    return value
+
+
+def static_keyboard(func):
+    @functools.wraps(func)
+    async def wrapper(*args):
+        global _revision
+
+        await catalog.aload()
+        revision = catalog.revision()
+        if revision != _revision:
+            _markups.clear()
+            _revision = revision
+
+        key = (func.__name__, args)
+        markup = _markups.get(key)
+        if markup is None:
+            markup = _freeze(await func(*args))
+            # если каталог сменился во время сборки, клавиатура могла собраться из старых кнопок
+            if catalog.revision() == _revision:
+                _markups[key] = markup
+
+        return markup
+
+    return wrapper
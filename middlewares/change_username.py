@@ -4,12 +4,12 @@ from typing import Any, Awaitable, Callable, Dict
 import django
 from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject
-from asgiref.sync import sync_to_async
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'work_exchange.settings')
 django.setup()
 
-from core.models import TGUser, Worker, Employer
+from core import usernames
+from core.models import Worker, Employer
 
 
 class UpdateUsernameMiddleware(BaseMiddleware):
@@ -21,22 +21,12 @@ class UpdateUsernameMiddleware(BaseMiddleware):
         *args,
         **kwargs
     ):
-        user_id = data["event_from_user"].id
         username = data["event_from_user"].username
 
-        if username:
-            user = await sync_to_async(TGUser.objects.filter(tg_id=user_id).first)()
-            if user:
-                if user.target == '1':
-                    worker = await sync_to_async(Worker.objects.filter(tg_id=user_id).first)()
-                    if worker and (worker.username is None or worker.username != username):
-                        worker.username = username
-                        await sync_to_async(worker.save)()
-                
-                elif user.target == '2':
-                    employer = await sync_to_async(Employer.objects.filter(tg_id=user_id).first)()
-                    if employer and (employer.username is None or employer.username != username):
-                        employer.username = username
-                        await sync_to_async(employer.save)()
+        # ник профиля берется из статуса (UserContextMiddleware), новый ник попадет в базу отложенно (core/usernames.py)
+        status = data['profile_status']
+        if username and status.has_profile and status.username != username:
+            model = Worker if status.target == '1' else Employer
+            await usernames.record(model, data["event_from_user"].id, username)
 
         return await handler(event, data)
@@ -0,0 +1,58 @@
+import os
+import asyncio
+
+import django
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter, TelegramForbiddenError, TelegramBadRequest
+from aiogram.methods import TelegramMethod, Response
+from aiogram.methods.base import TelegramType
+from asgiref.sync import sync_to_async
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'work_exchange.settings')
+django.setup()
+
+from core import rate_limiter, unreachable
+
+
+SEND_PREFIXES = ('send', 'copy', 'forward')
+
+
+class RateLimitRequestMiddleware(BaseRequestMiddleware):
+    """Пропускает исходящие сообщения бота через общий ограничитель (core/rate_limiter.py).
+
+    Подключается к сессии бота (bot.session.middleware), поэтому действует на все отправки,
+    включая рассылки из notifications_center; ответы пользователю в личный чат укладываются в допустимый
+    всплеск (TELEGRAM_CHAT_BURST). Ответ 429 повторяется один раз после retry_after,
+    недоступные получатели отмечаются в core/unreachable.py.
+    """
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        chat_id = getattr(method, 'chat_id', None)
+        if chat_id is None or not method.__api_method__.startswith(SEND_PREFIXES):
+            return await make_request(bot, method)
+
+        # альбом считается по числу сообщений в нем
+        cost = 1
+        if method.__api_method__ == 'sendMediaGroup':
+            cost = len(method.media)
+
+        await rate_limiter.acquire(chat_id, cost)
+        try:
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as error:
+                # повтор - такое же сообщение, оплачивается из общих корзин заново
+                await asyncio.sleep(error.retry_after)
+                await rate_limiter.acquire(chat_id, cost)
+                return await make_request(bot, method)
+        except (TelegramForbiddenError, TelegramBadRequest) as error:
+            # заблокировавших бота и удаленных пользователей рассылки дальше пропускают
+            error_code = 403 if isinstance(error, TelegramForbiddenError) else 400
+            if not rate_limiter.is_group(chat_id) and unreachable.is_unreachable_error(error_code, error.message):
+                await sync_to_async(unreachable.mark)([chat_id])
+            raise
@@ -0,0 +1,78 @@
+import os
+from typing import Any, Awaitable, Callable, Dict
+
+import django
+from aiogram import BaseMiddleware
+from aiogram.dispatcher.flags import get_flag
+from aiogram.types import TelegramObject
+from asgiref.sync import sync_to_async
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'work_exchange.settings')
+django.setup()
+
+from core import profile_status, executor, unreachable
+from core.models import TGUser, Worker, Employer
+
+
+class UserContextMiddleware(BaseMiddleware):
+    """Загружает статус пользователя один раз на апдейт.
+
+    В data попадает profile_status (core/profile_status.py, из redis), по нему решают остальные
+    middleware и обработчики, которым не нужна строка профиля. Подключается к dp.update как внешний middleware.
+    """
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+        *args,
+        **kwargs
+    ):
+        status = profile_status.EMPTY
+
+        user = data.get("event_from_user")
+        if user:
+            status = await profile_status.get(user.id)
+            # пользователь снова пишет боту (сообщение или кнопка, не my_chat_member о блокировке) - рассылки ему возобновляются
+            if status.is_unreachable and (event.message or event.callback_query):
+                await sync_to_async(unreachable.reactivate)(user.id)
+                status = status._replace(is_unreachable=False)
+
+        data['profile_status'] = status
+
+        return await handler(event, data)
+
+
+class ProfileMiddleware(BaseMiddleware):
+    """Загружает строку профиля и TGUser один раз на апдейт, только для обработчиков, которым они нужны.
+
+    Обработчик отмечается флагами: flags={'profile': True} - в data попадают worker и employer
+    (None, если профиля нет), flags={'tg_user': True} - tg_user. Обработчики и клавиатуры берут их
+    из data, а не запрашивают по tg_id. Подключается к dp.message и dp.callback_query как внутренний middleware.
+    """
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+        *args,
+        **kwargs
+    ):
+        user_id = data["event_from_user"].id
+
+        if get_flag(data, 'profile'):
+            status = data['profile_status']
+            worker = employer = None
+            # строка профиля читается, только если он есть
+            if status.has_profile and status.target == '1':
+                worker = await executor.run(Worker.objects.filter(tg_id=user_id).first)
+            elif status.has_profile and status.target == '2':
+                employer = await executor.run(Employer.objects.filter(tg_id=user_id).first)
+
+            data['worker'] = worker
+            data['employer'] = employer
+
+        if get_flag(data, 'tg_user'):
+            data['tg_user'] = await executor.run(TGUser.objects.filter(tg_id=user_id).first)
+
+        return await handler(event, data)
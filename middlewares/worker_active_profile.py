@@ -4,12 +4,11 @@ from typing import Any, Awaitable, Callable, Dict
 import django
 from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject
-from asgiref.sync import sync_to_async
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'work_exchange.settings')
 django.setup()
 
-from core.models import Worker, Text
+from core import catalog
 
 
 class IsActiveProfileMiddleware(BaseMiddleware):
@@ -21,12 +20,11 @@ class IsActiveProfileMiddleware(BaseMiddleware):
         *args,
         **kwargs
     ):
-        user_id = data["event_from_user"].id
-
-        worker = await sync_to_async(Worker.objects.filter(tg_id=user_id).first)()
-        if worker:
-            if worker.is_approved is None:
-                reply_text = await sync_to_async(Text.objects.get)(slug='worker_wait_check')
+        # статус из redis (UserContextMiddleware), без запроса к базе
+        status = data['profile_status']
+        if status.target == '1' and status.has_profile:
+            if status.is_approved is None:
+                reply_text = await catalog.text('worker_wait_check')
                 try:
                     await event.bot.answer_callback_query(
                         callback_query_id=event.id,
@@ -37,8 +35,8 @@ class IsActiveProfileMiddleware(BaseMiddleware):
                     pass
                 return True
 
-            elif worker.is_approved is False:
-                reply_text = await sync_to_async(Text.objects.get)(slug='worker_check_failed')
+            elif status.is_approved is False:
+                reply_text = await catalog.text('worker_check_failed')
                 try:
                     await event.bot.answer_callback_query(
                         callback_query_id=event.id,
@@ -50,7 +48,7 @@ class IsActiveProfileMiddleware(BaseMiddleware):
                 return True
 
         else:
-            reply_text = await sync_to_async(Text.objects.get)(slug='worker_profile_error')
+            reply_text = await catalog.text('worker_profile_error')
             try:
                 await event.bot.answer_callback_query(
                     callback_query_id=event.id,
@@ -73,12 +71,11 @@ class IsReviewedByAdminsMiddleware(BaseMiddleware):
         *args,
         **kwargs
     ):
-        user_id = data["event_from_user"].id
-
-        worker = await sync_to_async(Worker.objects.filter(tg_id=user_id).first)()
-        if worker:
-            if worker.is_approved is None:
-                reply_text = await sync_to_async(Text.objects.get)(slug='worker_wait_check')
+        # статус из redis (UserContextMiddleware), без запроса к базе
+        status = data['profile_status']
+        if status.target == '1' and status.has_profile:
+            if status.is_approved is None:
+                reply_text = await catalog.text('worker_wait_check')
                 try:
                     await event.bot.answer_callback_query(
                         callback_query_id=event.id,
@@ -90,7 +87,7 @@ class IsReviewedByAdminsMiddleware(BaseMiddleware):
                 return True
 
         else:
-            reply_text = await sync_to_async(Text.objects.get)(slug='worker_profile_error')
+            reply_text = await catalog.text('worker_profile_error')
             await event.bot.answer_callback_query(
                 callback_query_id=event.id,
                 text=reply_text.rus,
@@ -43,6 +43,8 @@ class Notification(models.Model):
     success_users = models.IntegerField(default=0)
     total_send_users = models.IntegerField(default=0)
     total_users = models.IntegerField(default=0)
+    # file_id изображения в телеграме после первой успешной отправки, остальным получателям файл не загружается
+    image_file_id = models.CharField(verbose_name='file_id изображения', max_length=255, null=True, blank=True, default=None)
 
     class Meta:
         verbose_name = 'уведомление пользователей'
@@ -0,0 +1,29 @@
+from asgiref.sync import sync_to_async
+
+
+# Перебор получателей рассылок порциями по id: читаются только нужные поля (values_list),
+# в памяти не больше одной порции, поэтому размер аудитории не влияет на память процесса.
+RECIPIENTS_CHUNK = 2000 # сколько получателей читается из базы за один запрос
+
+
+def _chunk(queryset, fields, last_id):
+    return list(queryset.filter(id__gt=last_id).order_by('id').values_list('id', *fields)[:RECIPIENTS_CHUNK])
+
+
+async def iterate_chunks(queryset, *fields):
+    """Списки значений fields получателей, порциями по RECIPIENTS_CHUNK."""
+    last_id = 0
+    while True:
+        chunk = await sync_to_async(_chunk)(queryset, fields, last_id)
+        if not chunk:
+            break
+
+        yield [row[1:] for row in chunk]
+        last_id = chunk[-1][0]
+
+
+async def iterate(queryset, *fields):
+    """Значения fields получателей по одному (кортежи), чтение из базы порциями."""
+    async for chunk in iterate_chunks(queryset, *fields):
+        for row in chunk:
+            yield row
@@ -0,0 +1,151 @@
+import asyncio
+import logging
+
+import aiohttp
+
+from config import TELEGRAM_TOKEN, NOTIFICATIONS_CONCURRENCY
+from core import rate_limiter, unreachable
+from core.redis_connections import close_async_redis
+
+
+# Асинхронная отправка рассылок из задач celery: одна сессия aiohttp с keep-alive соединениями,
+# не больше NOTIFICATIONS_CONCURRENCY запросов одновременно, темп - общий ограничитель (core/rate_limiter.py).
+# Результаты отдаются по мере отправки, задача сохраняет прогресс, не дожидаясь конца рассылки.
+API_URL = 'https://api.telegram.org/bot{}/{}'
+
+logger = logging.getLogger(__name__)
+
+
+def _form(params, photo):
+    form = aiohttp.FormData()
+    for key, value in params.items():
+        form.add_field(key, str(value))
+    form.add_field('photo', photo['content'], filename=photo['name'])
+
+    return form
+
+
+async def _post(session, method, params, photo, token):
+    url = API_URL.format(token, method)
+    if isinstance(photo, dict):
+        data = _form(params, photo)
+    elif photo:
+        # уже загруженное фото - по file_id
+        data = dict(params, photo=photo)
+    else:
+        data = params
+
+    async with session.post(url, data=data) as response:
+        return await response.json(content_type=None)
+
+
+async def _send_one(session, method, params, photo, token):
+    """Отправка одного сообщения, возвращает ответ bot api. Ответ 429 повторяется один раз."""
+    await rate_limiter.acquire(params['chat_id'])
+    try:
+        result = await _post(session, method, params, photo, token)
+        if result.get('error_code') == 429:
+            await asyncio.sleep(result.get('parameters', {}).get('retry_after', 1))
+            await rate_limiter.acquire(params['chat_id'])
+            result = await _post(session, method, params, photo, token)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        return {}
+
+    return result
+
+
+async def _iterate(messages):
+    # messages может быть обычным или асинхронным итерируемым (порции получателей из базы)
+    if hasattr(messages, '__aiter__'):
+        async for message in messages:
+            yield message
+    else:
+        for message in messages:
+            yield message
+
+
+def _outcome(params, result):
+    is_unreachable = unreachable.is_unreachable_error(result.get('error_code'), result.get('description'))
+    return params['chat_id'], bool(result.get('ok')), is_unreachable
+
+
+def _photo_file_id(result):
+    # самый крупный размер фото из ответа sendPhoto
+    try:
+        return result['result']['photo'][-1]['file_id']
+    except (KeyError, IndexError, TypeError):
+        return None
+
+
+async def send(messages, photo=None, on_upload=None, token=TELEGRAM_TOKEN, concurrency=NOTIFICATIONS_CONCURRENCY):
+    """Отправляет сообщения и по мере отправки отдает (chat_id, отправлено ли, недоступен ли получатель).
+
+    messages - итерируемое (или асинхронное итерируемое) из (method, params), params - параметры метода bot api с chat_id.
+    photo - file_id или словарь name/content, если к каждому сообщению прикладывается фото.
+    Файл загружается только до первой успешной отправки, дальше используется полученный
+    file_id, он же передается в on_upload (корутина), чтобы его можно было сохранить.
+    """
+    tasks = asyncio.Queue(maxsize=concurrency)
+    results = asyncio.Queue()
+    finished = object()
+    messages = _iterate(messages)
+
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=concurrency)) as session:
+        # загрузка файла - по одному получателю, пока кому-нибудь не отправится
+        while isinstance(photo, dict):
+            message = await anext(messages, None)
+            if message is None:
+                break
+
+            method, params = message
+            result = await _send_one(session, method, params, photo, token)
+            file_id = _photo_file_id(result)
+            if file_id:
+                photo = file_id
+                if on_upload:
+                    await on_upload(file_id)
+
+            yield _outcome(params, result)
+
+        async def worker():
+            try:
+                while True:
+                    message = await tasks.get()
+                    if message is None:
+                        break
+
+                    method, params = message
+                    result = await _send_one(session, method, params, photo, token)
+                    await results.put(_outcome(params, result))
+            finally:
+                await results.put(finished)
+
+        async def producer():
+            try:
+                async for message in messages:
+                    await tasks.put(message)
+            finally:
+                # воркеры завершаются и при ошибке в messages
+                for _ in range(concurrency):
+                    await tasks.put(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        producer_task = asyncio.create_task(producer())
+        try:
+            running = concurrency
+            while running:
+                result = await results.get()
+                if result is finished:
+                    running -= 1
+                else:
+                    yield result
+
+            # ошибка при переборе messages
+            await producer_task
+        finally:
+            producer_task.cancel()
+            for task in workers:
+                task.cancel()
+
+            # клиент redis ограничителя привязан к этому event loop
+            await close_async_redis()
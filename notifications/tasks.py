@@ -1,13 +1,22 @@
+import os
+import asyncio
 import datetime
 import json
 import time
 
-from django.db.models import Q
+from django.db import close_old_connections
+from django.db.models import Q, F
 from celery import shared_task
+from asgiref.sync import sync_to_async
 
+from core import unreachable
 from core.models import TGUser
 from notifications.models import Notification
-from notifications.utils import send_message_on_telegram
+from notifications import sender, recipients
+
+
+PROGRESS_EVERY = 100 # через сколько получателей прогресс рассылки записывается в базу
+PROGRESS_INTERVAL = 10 # и не реже, чем раз в столько секунд
 
 
 def search_notifications():
@@ -43,16 +52,20 @@ def mark_notifications_started(notifications):
 
 
 def select_users_for_notification(notification: Notification):
+    """Получатели уведомления (queryset TGUser, строки читаются порциями, notifications/recipients.py)."""
     if notification.target == '1':
-        users = [notification.user]
+        users = TGUser.objects.filter(id=notification.user_id)
     elif notification.target == '2':
-        users = TGUser.objects.filter(target='1').all()
+        users = TGUser.objects.filter(target='1')
     elif notification.target == '3':
-        users = TGUser.objects.filter(target='2').all()
+        users = TGUser.objects.filter(target='2')
     elif notification.target == '4':
         users = TGUser.objects.all()
+    else:
+        users = TGUser.objects.none()
     
-    return users
+    # заблокировавшие бота пропускаются
+    return users.filter(unreachable_since__isnull=True)
 
 
 def construct_notification_params(notification: Notification):
@@ -105,6 +118,89 @@ def construct_notification_params(notification: Notification):
     return params_rus, params_heb, image_path
     
 
+async def build_messages(recipients, params_rus, params_heb, method):
+    """Сообщения рассылки (method, params) по получателям: русский текст работникам, иврит работодателям."""
+    async for tg_id, target in recipients:
+        if target == '1':
+            params = params_rus
+        elif target == '2':
+            params = params_heb
+        else:
+            continue
+
+        yield method, dict(params, chat_id=tg_id)
+
+
+def read_photo(notification: Notification, image_path):
+    # после первой отправки фото берется по file_id, файл читается и загружается только до нее
+    if notification.image_file_id:
+        return notification.image_file_id
+
+    with open(image_path, 'rb') as image:
+        return {'name': os.path.basename(image_path), 'content': image.read()}
+
+
+def save_image_file_id(notification: Notification, file_id):
+    notification.image_file_id = file_id
+    Notification.objects.filter(id=notification.id).update(image_file_id=file_id)
+
+
+class Progress:
+    """Прогресс рассылки: счетчики копятся в памяти и записываются в базу приращениями (F)
+    раз в PROGRESS_EVERY получателей или PROGRESS_INTERVAL секунд, обновляются только эти колонки.
+    Недоступные получатели отмечаются тогда же.
+    """
+    def __init__(self, notification_id):
+        self.notification_id = notification_id
+        self.sent = 0
+        self.success = 0
+        self.unreachable = []
+        self.flushed_at = time.monotonic()
+
+    def add(self, chat_id, is_sent, is_unreachable):
+        self.sent += 1
+        if is_sent:
+            self.success += 1
+        if is_unreachable:
+            self.unreachable.append(chat_id)
+
+    def is_due(self):
+        return self.sent >= PROGRESS_EVERY or time.monotonic() - self.flushed_at >= PROGRESS_INTERVAL
+
+    def flush(self):
+        if self.sent:
+            Notification.objects.filter(id=self.notification_id).update(
+                total_send_users=F('total_send_users') + self.sent,
+                success_users=F('success_users') + self.success,
+                )
+        unreachable.mark(self.unreachable)
+
+        self.sent = 0
+        self.success = 0
+        self.unreachable = []
+        self.flushed_at = time.monotonic()
+
+
+async def deliver_notification(notification: Notification, messages, photo):
+    async def on_upload(file_id):
+        await sync_to_async(save_image_file_id)(notification, file_id)
+
+    success = False
+    progress = Progress(notification.id)
+    try:
+        async for chat_id, is_sent, is_unreachable in sender.send(messages, photo=photo, on_upload=on_upload):
+            progress.add(chat_id, is_sent, is_unreachable)
+            success = success or is_sent
+            if progress.is_due():
+                await sync_to_async(progress.flush)()
+    finally:
+        # остаток записывается и при ошибке рассылки
+        await sync_to_async(progress.flush)()
+        await sync_to_async(close_old_connections)()
+
+    return success
+
+
 @shared_task
 def send_notifications():
     notifications = search_notifications()
@@ -113,41 +209,14 @@ def send_notifications():
     for notification in valid_notifications:
         users = select_users_for_notification(notification)
         params_rus, params_heb, image_path = construct_notification_params(notification)
-        total_users = len(users)
+        total_users = users.count()
 
-        notification.total_users = total_users
-        notification.save()
-        success = False
-        for user in users:
-            if user.target == '1':
-                params_rus['chat_id'] = user.tg_id
-                main_params = params_rus
-
-            elif user.target == '2':
-                params_heb['chat_id'] = user.tg_id
-                main_params = params_heb
-
-            if image_path:
-                with open(image_path, 'rb') as image:
-                    files = {
-                        'photo': image,
-                    }
-                    response = send_message_on_telegram(main_params, files=files)
-            
-            else:
-                response = send_message_on_telegram(main_params)
-            
-            notification.total_send_users += 1
-            if response:
-                try:
-                    if response.json().get('ok'):
-                        success = True
-                        notification.success_users += 1
-                except:
-                    pass
-            
-            notification.save()
-            time.sleep(3)
-        
-        notification.notified = success
-        notification.save()
+        # счетчики отправки меняются только приращениями (Progress), полное сохранение их бы затерло
+        Notification.objects.filter(id=notification.id).update(total_users=total_users)
+
+        method = 'sendPhoto' if image_path else 'sendMessage'
+        photo = read_photo(notification, image_path) if image_path else None
+        messages = build_messages(recipients.iterate(users, 'tg_id', 'target'), params_rus, params_heb, method)
+        success = asyncio.run(deliver_notification(notification, messages, photo))
+
+        Notification.objects.filter(id=notification.id).update(notified=success)
@@ -1,10 +1,15 @@
 import os
 import asyncio
+import logging
+from collections import namedtuple
+from functools import partial
 
 import django
+import redis
 from django.db.models import Q
 from aiogram import Bot
 from aiogram.types import InputMediaPhoto
+from aiogram.exceptions import TelegramForbiddenError, TelegramBadRequest
 from asgiref.sync import sync_to_async
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'work_exchange.settings')
@@ -14,171 +19,211 @@ from config import ADMIN_CHAT_PROPOSALS_ID, ADMIN_CHAT_REVIEWS_ID
 from core.models import (Text, Worker, ChannelForEmployers, ChannelForWorkers, 
                          Employer, Job, WorkerCooperationProposal, EmployerCooperationProposal,
                          EmployerReview, WorkerReview)
+from core import usernames, broadcasts, executor, unreachable
 from keyboards import keyboards
+from notifications import recipients
 from utils import escape_markdown
 
 
-async def new_worker_to_employers_channels(bot: Bot, worker: Worker, about_heb: str):
-    target_channels = await sync_to_async(lambda: list(ChannelForEmployers.objects.all()))()
-    readable_occupations = await sync_to_async(lambda: worker.readable_heb_occupations)()
+NEW_WORKER_CHANNEL_TEXTS = Text.objects.require(
+    'occupations', 'min_salary', 'about', 'new_worker', 'salary_hourly',
+)
+NEW_JOB_CHANNEL_TEXTS = Text.objects.require(
+    'occupations', 'min_salary', 'description', 'new_job', 'salary_hourly',
+)
+NEW_WORKER_TEXTS = Text.objects.require(
+    'occupations', 'min_salary', 'about', 'new_worker_interesting', 'salary_hourly',
+)
+NEW_JOB_TEXTS = Text.objects.require(
+    'occupations', 'min_salary', 'description', 'new_job_interesting', 'salary_hourly',
+)
 
-    occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-    min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-    about_text = await sync_to_async(Text.objects.get)(slug='about')
-    new_worker = await sync_to_async(Text.objects.get)(slug='new_worker')
-    salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
-    objects_photos = await sync_to_async(lambda: list(worker.objects_photos.all()))()
+logger = logging.getLogger(__name__)
 
-    input_media_photos = []
-    for object_photo in objects_photos:
-        input_media_photos.append(InputMediaPhoto(media=object_photo.photo_id))
-    
-    reply_text = f'''\u202B*{new_worker.heb}*\
-            \n\
-            \n*{occupations_text.heb}* {readable_occupations}\
-            \n*{min_salary_text.heb}* {worker.min_salary} {salary_hourly.heb}\
-            \n*{about_text.heb}* {about_heb}'''
 
-    for channel in target_channels:
-        if input_media_photos:
-            try:
-                await bot.send_media_group(
-                    chat_id=channel.tg_id,
-                    media=input_media_photos,
-                    )
-            except:
-                pass
-        
-        try:
-            await bot.send_message(
-                chat_id=channel.tg_id,
-                text=reply_text,
-                reply_markup=await keyboards.more_workers_channel_keyboard(),
-                parse_mode='Markdown',
-            )
-        except:
-            pass
-        await asyncio.sleep(10)
+Post = namedtuple('Post', ('text', 'photos', 'reply_markup'))
+
+
+def _load_worker(worker_id):
+    worker = Worker.objects.with_occupations().filter(id=worker_id).first()
+    if worker is None:
+        return None
+
+    return worker, [object_photo.photo_id for object_photo in worker.objects_photos.all()]
+
 
+def _load_job(job_id):
+    return Job.objects.with_occupations().filter(id=job_id).first()
 
-async def new_jobs_to_workers_channels(bot: Bot, job: Job):
-    target_channels = await sync_to_async(lambda: list(ChannelForWorkers.objects.all()))()
 
-    readable_occupations = await sync_to_async(lambda: job.readable_rus_occupations)()
+async def _new_worker_post(worker_id, channel):
+    loaded = await executor.run(_load_worker, worker_id)
+    if loaded is None:
+        return None
 
-    occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-    min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-    description_text = await sync_to_async(Text.objects.get)(slug='description')
-    new_job = await sync_to_async(Text.objects.get)(slug='new_job')
-    salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
+    worker, photos = loaded
+    if channel:
+        texts = await Text.objects.aresolve(*NEW_WORKER_CHANNEL_TEXTS, lang='heb')
+        title = texts.new_worker
+        reply_markup = await keyboards.more_workers_channel_keyboard()
+    else:
+        texts = await Text.objects.aresolve(*NEW_WORKER_TEXTS, lang='heb')
+        title = texts.new_worker_interesting
+        reply_markup = await keyboards.employer_worker_detail_redirect('workers-suitable', worker.id)
+
+    reply_text = f'''\u202B*{title}*\
+            \n\
+            \n*{texts.occupations}* {worker.readable_heb_occupations}\
+            \n*{texts.min_salary}* {worker.min_salary} {texts.salary_hourly}\
+            \n*{texts.about}* {worker.about_heb}'''
+
+    return Post(reply_text, photos, reply_markup)
+
+
+async def _new_job_post(job_id, channel):
+    job = await executor.run(_load_job, job_id)
+    if job is None:
+        return None
+
+    if channel:
+        texts = await Text.objects.aresolve(*NEW_JOB_CHANNEL_TEXTS, lang='rus')
+        title = texts.new_job
+        reply_markup = await keyboards.more_jobs_channel_keyboard()
+    else:
+        texts = await Text.objects.aresolve(*NEW_JOB_TEXTS, lang='rus')
+        title = texts.new_job_interesting
+        reply_markup = await keyboards.worker_job_detail_redirect('suitable-jobs', job.id)
 
     reply_text = f'''
-            *{new_job.rus}*\
+            *{title}*\
             \n\
-            \n*{occupations_text.rus}* {readable_occupations}\
-            \n*{min_salary_text.rus}* {job.min_salary} {salary_hourly.rus}\
-            \n*{description_text.rus}* {job.description_rus}\
+            \n*{texts.occupations}* {job.readable_rus_occupations}\
+            \n*{texts.min_salary}* {job.min_salary} {texts.salary_hourly}\
+            \n*{texts.description}* {job.description_rus}\
             '''
 
-    for channel in target_channels:        
+    return Post(reply_text, [], reply_markup)
+
+
+# виды рассылок из очереди (core/broadcasts.py): сообщение собирается один раз на рассылку
+POSTS = {
+    'worker-channel': partial(_new_worker_post, channel=True),
+    'worker': partial(_new_worker_post, channel=False),
+    'job-channel': partial(_new_job_post, channel=True),
+    'job': partial(_new_job_post, channel=False),
+}
+_posts_cache = {} # (id рассылки, вид) -> Post
+_fallback_tasks = set()
+
+
+async def _send_post(bot: Bot, chat_id, post: Post):
+    # постоянные ошибки (заблокировал бота, чат не найден) пропускаются, временные (сеть, 5xx)
+    # поднимаются выше, чтобы очередь повторила отправку, но только пока получателю ничего не ушло:
+    # повтор после отправленного альбома прислал бы его второй раз
+    delivered = False
+    if post.photos:
         try:
-            await bot.send_message(
-                chat_id=channel.tg_id,
-                text=reply_text,
-                reply_markup=await keyboards.more_jobs_channel_keyboard(),
-                parse_mode='Markdown',
-            )
-        except:
+            await bot.send_media_group(
+                chat_id=chat_id,
+                media=[InputMediaPhoto(media=photo_id) for photo_id in post.photos],
+                )
+            delivered = True
+        except (TelegramForbiddenError, TelegramBadRequest):
             pass
-        await asyncio.sleep(10)
-
 
-async def new_worker_to_employers(bot: Bot, worker: Worker, about_heb: str):
-    worker_occupations = await sync_to_async(lambda: list(worker.occupations.all()))()
-    employers = await sync_to_async(lambda: list(Employer.objects.filter(
-        Q(jobs__occupations__in=worker_occupations) &
+    try:
+        await bot.send_message(
+            chat_id=chat_id,
+            text=post.text,
+            reply_markup=post.reply_markup,
+            parse_mode='Markdown',
+        )
+    except (TelegramForbiddenError, TelegramBadRequest):
+        pass
+    except Exception:
+        if not delivered:
+            raise
+
+        logger.exception('Текст поста не отправлен в чат %s после альбома, рассылка считается выполненной', chat_id)
+
+
+async def deliver(bot: Bot, broadcast_id, kind, object_id, chat_id):
+    """Отправка одной записи очереди рассылок."""
+    key = (broadcast_id, kind)
+    if key not in _posts_cache:
+        if len(_posts_cache) > 100:
+            _posts_cache.clear()
+        _posts_cache[key] = await POSTS[kind](object_id)
+
+    post = _posts_cache[key]
+    if post:
+        await _send_post(bot, chat_id, post)
+
+
+async def _deliver_without_queue(bot: Bot, broadcast_id, kind, object_id, chat_ids):
+    # параллельно по чатам, темп каждого чата задает ограничитель (core/rate_limiter.py)
+    results = await asyncio.gather(*(deliver(bot, broadcast_id, kind, object_id, chat_id) for chat_id in chat_ids), return_exceptions=True)
+    for chat_id, result in zip(chat_ids, results):
+        if isinstance(result, Exception):
+            logger.error('Ошибка рассылки %s %s в чат %s', kind, object_id, chat_id, exc_info=result)
+
+
+async def _broadcast(bot: Bot, object_id, recipients_querysets):
+    # recipients_querysets - пары (вид рассылки, queryset получателей), tg_id читаются порциями
+    broadcast_id = broadcasts.new_broadcast_id()
+    for kind, queryset in recipients_querysets:
+        async for chunk in recipients.iterate_chunks(queryset, 'tg_id'):
+            chat_ids = [tg_id for tg_id, in chunk]
+            try:
+                await broadcasts.enqueue(broadcast_id, kind, object_id, chat_ids)
+            except redis.RedisError:
+                logger.exception('Очередь рассылок недоступна, рассылка выполняется без очереди')
+                # отправка в фоне, чтобы не задерживать ответ администратору
+                task = asyncio.create_task(_deliver_without_queue(bot, broadcast_id, kind, object_id, chat_ids))
+                _fallback_tasks.add(task)
+                task.add_done_callback(_fallback_tasks.discard)
+
+
+def _new_worker_recipients(worker_id):
+    worker = Worker.objects.filter(id=worker_id).first()
+    if worker is None:
+        return []
+
+    employers = Employer.objects.filter(
+        Q(jobs__occupations__in=worker.occupations.all()) &
         Q(jobs__min_salary__gte=worker.min_salary) &
         Q(jobs__notifications=True) &
         Q(jobs__is_approved=True) &
-        Q(jobs__is_active=True)).distinct()))()
-
-    readable_occupations = await sync_to_async(lambda: worker.readable_heb_occupations)()
-
-    occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-    min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-    about_text = await sync_to_async(Text.objects.get)(slug='about')
-    new_worker = await sync_to_async(Text.objects.get)(slug='new_worker_interesting')
-    salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
-    objects_photos = await sync_to_async(lambda: list(worker.objects_photos.all()))()
-
-    input_media_photos = []
-    for object_photo in objects_photos:
-        input_media_photos.append(InputMediaPhoto(media=object_photo.photo_id))
-    
-    reply_text = f'''\u202B*{new_worker.heb}*\
-            \n\
-            \n*{occupations_text.heb}* {readable_occupations}\
-            \n*{min_salary_text.heb}* {worker.min_salary} {salary_hourly.heb}\
-            \n*{about_text.heb}* {about_heb}'''
-    
-    for employer in employers:
-        if input_media_photos:
-            try:
-                await bot.send_media_group(
-                    chat_id=employer.tg_id,
-                    media=input_media_photos,
-                    )
-            except:
-                pass
-        
-        try:
-            await bot.send_message(
-                chat_id=employer.tg_id,
-                text=reply_text,
-                reply_markup=await keyboards.employer_worker_detail_redirect('workers-suitable', worker.id),
-                parse_mode='Markdown',
-            )
-        except:
-            pass
-        await asyncio.sleep(3)
+        Q(jobs__is_active=True)).distinct()
+
+    return [('worker-channel', ChannelForEmployers.objects.filter(is_active=True)), ('worker', unreachable.reachable(employers))]
 
 
-async def new_job_to_workers(bot: Bot, job: Job):
-    job_occupations = await sync_to_async(lambda: list(job.occupations.all()))()
-    workers = await sync_to_async(lambda: list(Worker.objects.filter(
-        Q(occupations__in=job_occupations) &
+def _new_job_recipients(job_id):
+    job = Job.objects.filter(id=job_id).first()
+    if job is None:
+        return []
+
+    workers = Worker.objects.filter(
+        Q(occupations__in=job.occupations.all()) &
         Q(min_salary__lte=job.min_salary) &
         Q(notifications=True) &
         Q(is_approved=True) &
-        Q(is_searching=True)).distinct()))()
+        Q(is_searching=True)).distinct()
 
-    readable_occupations = await sync_to_async(lambda: job.readable_rus_occupations)()
+    return [('job-channel', ChannelForWorkers.objects.filter(is_active=True)), ('job', unreachable.reachable(workers))]
 
-    occupations_text = await sync_to_async(Text.objects.get)(slug='occupations')
-    min_salary_text = await sync_to_async(Text.objects.get)(slug='min_salary')
-    description_text = await sync_to_async(Text.objects.get)(slug='description')
-    new_job = await sync_to_async(Text.objects.get)(slug='new_job_interesting')
-    salary_hourly = await sync_to_async(Text.objects.get)(slug='salary_hourly')
 
-    reply_text = f'''
-            *{new_job.rus}*\
-            \n\
-            \n*{occupations_text.rus}* {readable_occupations}\
-            \n*{min_salary_text.rus}* {job.min_salary} {salary_hourly.rus}\
-            \n*{description_text.rus}* {job.description_rus}\
-            '''
-    
-    for worker in workers:
-        try:
-            await bot.send_message(
-                chat_id=worker.tg_id,
-                text=reply_text,
-                reply_markup=await keyboards.worker_job_detail_redirect('suitable-jobs', job.id),
-                parse_mode='Markdown',
-            )
-        except:
-            pass
-        await asyncio.sleep(3)
+async def new_worker_broadcast(bot: Bot, worker_id):
+    """Рассылка нового резюме по каналам и подходящим работодателям (через очередь)."""
+    recipients_querysets = await executor.run(_new_worker_recipients, worker_id)
+    await _broadcast(bot, worker_id, recipients_querysets)
+
+
+async def new_job_broadcast(bot: Bot, job_id):
+    """Рассылка новой вакансии по каналам и подходящим работникам (через очередь)."""
+    recipients_querysets = await executor.run(_new_job_recipients, job_id)
+    await _broadcast(bot, job_id, recipients_querysets)
 
 
 async def worker_proposal_accepted(bot: Bot, proposal_id):
@@ -191,8 +236,8 @@ async def worker_proposal_accepted(bot: Bot, proposal_id):
         worker_occupations = await sync_to_async(lambda: worker.readable_rus_occupations)()
         job_occupations = await sync_to_async(lambda: job.readable_rus_occupations)()
 
-        worker_username = worker.username
-        employer_username = employer.username
+        worker_username = await usernames.current(worker)
+        employer_username = await usernames.current(employer)
 
         if worker_username:
             worker_username = await escape_markdown(f'@{worker_username}')
@@ -262,8 +307,8 @@ async def employer_proposal_accepted(bot: Bot, proposal_id):
 
         worker_occupations = await sync_to_async(lambda: worker.readable_rus_occupations)()
 
-        worker_username = worker.username
-        employer_username = employer.username
+        worker_username = await usernames.current(worker)
+        employer_username = await usernames.current(employer)
 
         if worker_username:
             worker_username = await escape_markdown(f'@{worker_username}')
@@ -327,8 +372,8 @@ async def new_employer_review(bot: Bot, review_id):
         worker = await sync_to_async(lambda: review.worker)()
         employer = await sync_to_async(lambda: review.employer)()
 
-        worker_username = worker.username
-        employer_username = employer.username
+        worker_username = await usernames.current(worker)
+        employer_username = await usernames.current(employer)
 
         if worker_username:
             worker_username = await escape_markdown(f'@{worker_username}')
@@ -379,8 +424,8 @@ async def new_worker_review(bot: Bot, review_id):
         worker = await sync_to_async(lambda: review.worker)()
         employer = await sync_to_async(lambda: review.employer)()
 
-        worker_username = worker.username
-        employer_username = employer.username
+        worker_username = await usernames.current(worker)
+        employer_username = await usernames.current(employer)
 
         if worker_username:
             worker_username = await escape_markdown(f'@{worker_username}')
@@ -42,10 +42,19 @@ async def escape_markdown(text):
     return text
 
 
+# перевод занимает секунды (сетевой запрос), поэтому выполняется в отдельном пуле,
+# а не в event loop бота и не в пуле запросов к базе (core/executor.py)
+_translate_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='translate')
+
+
+def _translate(text, dest):
+    translator = Translator()
+    return translator.translate(text=text, dest=dest, src='auto')
+
+
 async def translate_to_heb(text):
     try:
-        translator = Translator()
-        text_heb = translator.translate(text=text, dest='he', src='auto')
+        text_heb = await asyncio.get_running_loop().run_in_executor(_translate_executor, _translate, text, 'he')
         if text_heb.text:
             return text_heb.text
         return False
@@ -55,8 +64,7 @@ async def translate_to_heb(text):
 
 async def translate_to_rus(text):
     try:
-        translator = Translator()
-        text_rus = translator.translate(text=text, dest='ru', src='auto')
+        text_rus = await asyncio.get_running_loop().run_in_executor(_translate_executor, _translate, text, 'ru')
         if text_rus.text:
             return text_rus.text
         return False
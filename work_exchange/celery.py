@@ -15,6 +15,10 @@ app.conf.beat_schedule = {
         'task': 'notifications.tasks.send_notifications',
         'schedule': crontab(minute='*/1'),  
     },
+    'flush-usernames-every-minute': {
+        'task': 'core.tasks.flush_usernames',
+        'schedule': crontab(minute='*/1'),
+    },
 }
 
 app.autodiscover_tasks()
\ No newline at end of file
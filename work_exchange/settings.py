@@ -105,6 +105,9 @@ DATABASES = {
         'PASSWORD': os.getenv('USER_PASSWORD'),
         'HOST': '127.0.0.1',
         'PORT': '3306',
+        # время жизни соединения в секундах (0 - новое на каждый запрос), для бота задается в bot.py
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '0')),
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'charset': 'utf8mb4',
         },